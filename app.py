@@ -1,23 +1,13 @@
 import ctypes
 import os
+import multiprocessing
 from dotenv import load_dotenv
 import asyncio
 import warnings
 from src import state
-from src.binlog.monitor import monitor_binlog
-from src.controller.ten_min_controller import stop_ten_min
-from database import AsyncSessionLocal, async_engine
-from src.dao.remote_pcs_dao import RemoteDao
-from database import get_db_context
-from src.utils.api import Api
-from src.utils.error_handler import ErrorHandler
-from src.logging import LogWindow
-from src.logging import PrintLogger
 
 # 전역 변수로 이벤트 루프 참조 저장
 loop = None
-error_handler = ErrorHandler()
-api = Api()
 
 def setup_signal_handlers():
     """시그널 핸들러 설정"""
@@ -64,6 +54,9 @@ async def cleanup_resources(is_shutting_down=False):
     """리소스 정리 함수"""
     unique_id_value = None
     unique_id_instance = state.unique_id()
+    if is_shutting_down:
+        # 백그라운드 캡처 스레드, 매칭 스레드 풀/작업 프로세스와 공유 메모리 정리
+        close_resources()
     try:
         if not os.path.exists(unique_id_instance.file_path):
             return
@@ -141,11 +134,34 @@ async def main():
     """메인 애플리케이션 로직"""
     try:
         unique_id_value = await startup()
+        # 템플릿을 동시에 미리 내려받아 탐지 중에는 네트워크를 기다리지 않도록 함
+        await template_service.prefetch_templates()
+        template_service.start_manifest_watch()
+        # OCR 모델은 시작 경로를 막지 않도록 백그라운드에서 로드
+        OCREngine.get_instance().warm_up()
         await monitor_binlog(unique_id_value)
     except Exception as e:
         print(f"애플리케이션 오류: {e}")
 
 if __name__ == "__main__":
+    # 매칭 작업 프로세스(spawn, PyInstaller 실행 파일)는 여기서 바로 작업 코드로 넘어감
+    multiprocessing.freeze_support()
+
+    # 작업 프로세스가 이 파일을 다시 import할 때 컨트롤러/DB/GUI 모듈을 만들지 않도록 실행할 때만 import
+    from src.binlog.monitor import monitor_binlog
+    from src.controller.ten_min_controller import stop_ten_min, template_service, close_resources
+    from database import AsyncSessionLocal, async_engine
+    from src.dao.remote_pcs_dao import RemoteDao
+    from database import get_db_context
+    from src.utils.api import Api
+    from src.utils.error_handler import ErrorHandler
+    from src.utils.ocr_engine import OCREngine
+    from src.logging import LogWindow
+    from src.logging import PrintLogger
+
+    error_handler = ErrorHandler()
+    api = Api()
+
     warnings.filterwarnings("ignore")
     load_dotenv()
     setup_signal_handlers()
@@ -0,0 +1,113 @@
+import os
+import json
+import argparse
+import cv2
+import numpy as np
+from dotenv import load_dotenv
+from src.service.template_service import TemplateService
+from src.utils.template_bundle import build_bundle
+from src.utils.template_disk_cache import TemplateDiskCache
+from src.utils.template_pyramid import TemplatePyramid
+
+
+def find_local_file(img_dir, template_path):
+    """static/img에서 템플릿 파일 찾기 (.png/.PNG 등 확장자 대소문자 무시)"""
+    name = template_path.lstrip('/').lower()
+    for file_name in os.listdir(img_dir):
+        if file_name.lower() == name:
+            return os.path.join(img_dir, file_name)
+    return None
+
+
+def download_template(disk_cache, base_url, template_path):
+    """서버에서 템플릿 파일 내용 다운로드 (다른 확장자로 한 번 더 시도)
+
+    Returns:
+        tuple: (내용, 실제로 받은 서버 경로) - 실패하면 (None, None)
+    """
+    base_path = template_path[:-4]
+    alt_path = base_path + ('.PNG' if template_path.lower().endswith('.png') else '.png')
+    for path in (template_path, alt_path):
+        try:
+            return disk_cache.fetch(f"{base_url}{path}"), path
+        except Exception as e:
+            print(f"다운로드 실패 ({path}): {e}")
+    return None, None
+
+
+def read_file(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def decode(content):
+    return cv2.imdecode(np.frombuffer(content, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+
+
+def collect_templates(img_dir):
+    """번들에 넣을 템플릿 수집
+
+    TemplateService.TEMPLATES와 숫자 템플릿(0~9)은 TemplateService가 사용하는 경로를 키로,
+    static/img의 나머지 파일은 '/파일이름'을 키로 사용합니다.
+    IMG_URL이 설정되어 있으면 실행 중에 사용하는 서버 파일을 우선 사용하고, 받을 수 없을 때만 static/img를 사용합니다.
+
+    Returns:
+        tuple: ({template_path: 흑백 템플릿 이미지}, {template_path: 원본 파일 내용}, {template_path: 받은 서버 경로})
+    """
+    template_paths = list(TemplateService.TEMPLATES.values())
+    template_paths += [TemplateService._password_path(digit) for digit in range(10)]
+
+    base_url = (os.getenv("IMG_URL") or "").rstrip('/')
+    disk_cache = TemplateDiskCache() if base_url else None
+
+    templates = {}
+    sources = {}
+    source_paths = {}
+    used_files = set()
+    for template_path in template_paths:
+        local_path = find_local_file(img_dir, template_path)
+        if local_path:
+            used_files.add(os.path.basename(local_path))
+        content, source_path = download_template(disk_cache, base_url, template_path) if disk_cache is not None else (None, None)
+        if content is None and local_path:
+            content = read_file(local_path)
+        template = decode(content) if content is not None else None
+        if template is None:
+            print(f"템플릿을 찾을 수 없어 제외합니다: {template_path}")
+            continue
+        templates[template_path] = template
+        sources[template_path] = content
+        if source_path:
+            source_paths[template_path] = source_path
+
+    for file_name in sorted(os.listdir(img_dir)):
+        if file_name in used_files or not file_name.lower().endswith('.png'):
+            continue
+        content = read_file(os.path.join(img_dir, file_name))
+        template = decode(content)
+        if template is not None:
+            templates[f'/{file_name}'] = template
+            sources[f'/{file_name}'] = content
+    return templates, sources, source_paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="템플릿 이미지를 메모리 매핑용 번들 파일로 묶습니다.")
+    parser.add_argument("--img-dir", default=os.path.join('static', 'img'), help="로컬 템플릿 이미지 폴더")
+    parser.add_argument("--output", default=os.getenv("TEMPLATE_BUNDLE", "templates.bundle"), help="번들 파일 경로")
+    parser.add_argument("--meta", help="템플릿별 부가 정보 JSON 파일 ({\"/otpFrame.PNG\": {\"threshold\": 0.8, \"roi\": [...]}})")
+    args = parser.parse_args()
+
+    metadata = {}
+    if args.meta:
+        with open(args.meta, 'r', encoding='utf-8') as f:
+            metadata = json.load(f)
+
+    templates, sources, source_paths = collect_templates(args.img_dir)
+    size = build_bundle(args.output, templates, TemplatePyramid(), metadata, sources, source_paths)
+    print(f"템플릿 번들 생성 완료: {args.output} ({len(templates)}개, {size / 1024:.1f}KB)")
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    main()
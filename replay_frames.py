@@ -0,0 +1,147 @@
+import time
+import asyncio
+import argparse
+from dotenv import load_dotenv
+from src.utils.frame_source import create_frame_source
+from src.utils.image_matcher import ImageMatcher
+from src.service.template_service import TemplateService
+from src.models.screen_state import ScreenState
+from src.detection.password_handler import PasswordHandler
+from src.detection.notice_handler import NoticeHandler
+from src.detection.ten_min_handler import TenMinScreenHandler
+from src.detection.duplicate_login_handler import DuplicateLoginHandler
+from src.utils.error_handler import NoDetectionError, WrongPasswordError, TemplateEmptyError, DuplicateLoginError
+
+
+class ReplayInputController:
+    """녹화 재생용 입력 컨트롤러 (실제로 입력하지 않고 동작만 기록)"""
+
+    def __init__(self):
+        self.last_action_time = 0.0
+        self.actions = []
+
+    def _record(self, *action):
+        self.actions.append(action)
+        self.last_action_time = time.monotonic()
+        return True
+
+    def click(self, x, y, clicks=1):
+        return self._record("click", x, y, clicks)
+
+    def cursor_move(self, x, y):
+        return self._record("move", x, y)
+
+    def press_key(self, key):
+        return self._record("key", key)
+
+    def hotkey(self, *args):
+        return self._record("hotkey", *args)
+
+    def type_text(self, text):
+        return self._record("type", text)
+
+
+async def replay(source, password, max_frames=0, deanak_id=0):
+    """녹화된 프레임을 AutoTenMin과 같은 순서로 탐지 핸들러에 통과시킴
+
+    Args:
+        source: 프레임 소스 (DirectoryFrameSource/VideoFrameSource)
+        password: 비밀번호 화면에서 누를 숫자열
+        max_frames: 처리할 최대 프레임 수 (0이면 소스 끝까지)
+        deanak_id: 오류 처리기에 넘길 대낙 ID
+
+    Returns:
+        dict: 재생 결과 (처리 프레임 수, 프레임당 처리 시간, 화면 통과 상태, 입력 동작 등)
+    """
+    input_controller = ReplayInputController()
+    image_matcher = ImageMatcher(input_controller=input_controller)
+    template_service = TemplateService(image_matcher)
+    password_list = list(password)
+    loaded_templates = template_service.get_templates(password_list)
+
+    password_handler = PasswordHandler(image_matcher, input_controller, source)
+    notice_handler = NoticeHandler(image_matcher, input_controller, source)
+    ten_min_handler = TenMinScreenHandler(image_matcher, input_controller, source)
+    duplicate_login_handler = DuplicateLoginHandler(image_matcher, input_controller, source)
+    screen_state = ScreenState()
+
+    frames = 0
+    error = None
+    started = time.perf_counter()
+    try:
+        while not max_frames or frames < max_frames:
+            screen = await source.screen_capture_async()
+            if screen is None:
+                break
+            frames += 1
+            image_matcher.begin_frame(screen)
+
+            await duplicate_login_handler.check_duplicate_login(screen, loaded_templates, deanak_id)
+
+            if not screen_state.password_passed:
+                screen_state.increment_count("password")
+            if not screen_state.notice_passed and screen_state.password_passed:
+                screen_state.increment_count("notice")
+            if not screen_state.team_select_passed and screen_state.notice_passed:
+                screen_state.increment_count("team_select")
+
+            if await password_handler.handle_password_screen(screen, loaded_templates, password_list, screen_state, deanak_id):
+                continue
+            if await notice_handler.handle_notice_screen(screen, loaded_templates, screen_state, deanak_id):
+                continue
+            if await ten_min_handler.handle_ten_min_screen(screen, loaded_templates, screen_state, deanak_id):
+                continue
+            if screen_state.team_select_passed:
+                break
+    except (NoDetectionError, WrongPasswordError, TemplateEmptyError, DuplicateLoginError) as e:
+        error = e
+    finally:
+        elapsed = time.perf_counter() - started
+        image_matcher.shutdown_executor()
+        source.close()
+
+    return {
+        "frames": frames,
+        "elapsed": elapsed,
+        "ms_per_frame": elapsed * 1000 / frames if frames else 0.0,
+        "last_timestamp": source.last_timestamp,
+        "password_passed": screen_state.password_passed,
+        "notice_passed": screen_state.notice_passed,
+        "team_select_passed": screen_state.team_select_passed,
+        "error": error,
+        "actions": input_controller.actions,
+        "frame_stats": image_matcher.frame_stats(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화된 화면(이미지 폴더/동영상)을 10분 접속 탐지 핸들러로 재생합니다.")
+    parser.add_argument("source", help="프레임 소스 (dir:<이미지 폴더> 또는 video:<동영상 파일>)")
+    parser.add_argument("--password", default="0000", help="비밀번호 화면에서 누를 숫자열")
+    parser.add_argument("--max-frames", type=int, default=0, help="처리할 최대 프레임 수 (0이면 끝까지)")
+    parser.add_argument("--realtime", action="store_true", help="핸들러의 대기 시간(asyncio.sleep)을 그대로 적용")
+    args = parser.parse_args()
+
+    if not args.realtime:
+        # 핸들러의 화면 전환 대기를 건너뛰어 녹화보다 빠르게 재생
+        sleep = asyncio.sleep
+
+        async def no_wait(delay, result=None):
+            return await sleep(0, result)
+
+        asyncio.sleep = no_wait
+
+    result = asyncio.run(replay(create_frame_source(args.source), args.password, args.max_frames))
+    print(f"재생 완료: {result['frames']}프레임, {result['elapsed']:.2f}초 ({result['ms_per_frame']:.1f}ms/프레임), "
+          f"마지막 타임스탬프 {result['last_timestamp']}")
+    print(f"화면 통과: 비밀번호={result['password_passed']}, 공지사항={result['notice_passed']}, "
+          f"팀 선택={result['team_select_passed']}")
+    if result["error"] is not None:
+        print(f"탐지 중단: {type(result['error']).__name__}: {result['error']}")
+    print(f"입력 동작 {len(result['actions'])}회: {result['actions'][:20]}")
+    print(f"프레임 통계: {result['frame_stats']}")
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    main()
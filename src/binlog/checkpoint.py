@@ -0,0 +1,99 @@
+import os
+import json
+import time
+import threading
+
+
+class BinlogCheckpoint:
+    """처리를 마친 binlog 위치(log_file, log_pos)를 로컬 파일에 저장하는 체크포인트
+
+    위치는 트랜잭션 경계에서만 갱신되므로, 재시작하거나 다시 연결할 때
+    저장된 위치부터 읽으면 이벤트를 중복 처리하거나 건너뛰지 않습니다.
+    작업을 실행한 트랜잭션의 위치는 바로 기록하고, 그 외의 위치는 interval에 한 번만 기록합니다.
+    """
+
+    def __init__(self, file_path=None, interval=None):
+        """
+        Args:
+            file_path: 체크포인트 파일 경로
+            interval: 파일에 기록하는 최소 간격(초)
+        """
+        self.file_path = file_path or os.getenv("BINLOG_CHECKPOINT_FILE", "binlog_checkpoint.json")
+        self.interval = interval if interval is not None else float(os.getenv("BINLOG_CHECKPOINT_INTERVAL", "1.0"))
+        self.log_file = None
+        self.log_pos = None
+        self._saved = None
+        self._saved_at = None  # 마지막으로 파일에 기록한 시각 (None이면 첫 갱신을 바로 기록)
+        self._lock = threading.Lock()
+        self.load()
+
+    @property
+    def position(self):
+        """(log_file, log_pos) 반환 (저장된 위치가 없으면 None)"""
+        with self._lock:
+            if self.log_file is None or self.log_pos is None:
+                return None
+            return self.log_file, self.log_pos
+
+    def load(self):
+        """파일에서 마지막으로 저장된 위치 읽기"""
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            log_file, log_pos = data["log_file"], int(data["log_pos"])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Binlog 체크포인트 읽기 실패 ({self.file_path}): {e}")
+            return None
+
+        with self._lock:
+            self.log_file, self.log_pos = log_file, log_pos
+            self._saved = (log_file, log_pos)
+        return log_file, log_pos
+
+    def update(self, log_file, log_pos, force=False):
+        """처리를 마친 위치 갱신 (마지막 기록 후 interval이 지났거나 force이면 파일에도 기록)
+
+        Args:
+            log_file: binlog 파일 이름
+            log_pos: 파일 내 위치
+            force: True이면 interval과 관계없이 바로 기록 (작업을 실행한 이벤트 - 재시작 시 다시 실행되지 않도록)
+        """
+        with self._lock:
+            self.log_file, self.log_pos = log_file, log_pos
+        if force or self._saved_at is None or time.monotonic() - self._saved_at >= self.interval:
+            self.flush()
+
+    def reset(self):
+        """저장된 위치를 지움 (다음 시작은 현재 위치부터)"""
+        with self._lock:
+            self.log_file = None
+            self.log_pos = None
+            self._saved = None
+            try:
+                os.remove(self.file_path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Binlog 체크포인트 삭제 실패 ({self.file_path}): {e}")
+
+    def flush(self):
+        """현재 위치를 파일에 기록 (바뀐 것이 없으면 무시)"""
+        with self._lock:
+            if self.log_file is None or self.log_pos is None:
+                return
+            position = (self.log_file, self.log_pos)
+            if position == self._saved:
+                return
+
+            tmp_path = f"{self.file_path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({"log_file": position[0], "log_pos": position[1], "saved_at": time.time()}, f)
+                os.replace(tmp_path, self.file_path)
+            except Exception as e:
+                print(f"Binlog 체크포인트 저장 실패 ({self.file_path}): {e}")
+                return
+            self._saved = position
+            self._saved_at = time.monotonic()
@@ -12,41 +12,40 @@ from src.utils.error_handler import ControllerError, ErrorHandler
 error_handler = ErrorHandler()
 
 async def handle_row_event(event, server_id):
-    """이벤트 처리 로직"""
+    """이벤트 처리 로직
+
+    행 값은 binlog 리더 스레드에서 RowDecoderRegistry가 테이블별 행 객체로 변환해 둔
+    event.typed_rows(RowChange 목록)를 사용합니다.
+
+    Returns:
+        bool: 작업을 등록하거나 실행했는지 여부 (True이면 처리 위치를 바로 체크포인트에 기록)
+    """
+    dispatched = False
     try:
-        table_columns = ["id", "server_id", "service", "worker_id", "state", "server_online_time"]
-        for row in event.rows:
+        for row in getattr(event, "typed_rows", ()):
             try:
                 # remote_pcs테이블에서 after_values의 server_id와 인자로 받은 server_id가 같고 worker_id가 있을때 
                 # ten_min테이블에서 service가 일반대낙, otp가 0이며, coupon_count가 0이고, state가 2이면서, worker_id가 존재하면 자동 대낙 실행
-                before_values = row.get("before_values", {})
-                after_values = row.get("after_values", {})
+                before_values = row.before
+                after_values = row.after
 
                 # 이벤트가 remote_pcs의 변경인지 ten_min의 변경인지 확인
                 table_name = event.table
                 if isinstance(event, (UpdateRowsEvent)):
                     if table_name == "remote_pcs":
 
-                        # UNKNOWN_COL을 실제 컬럼 이름으로 매핑
-                        table_columns = ["id", "server_id", "service", "worker_id", "state", "server_online_time"]
-                        unknown_cols = ["UNKNOWN_COL0", "UNKNOWN_COL1", "UNKNOWN_COL2", "UNKNOWN_COL3", "UNKNOWN_COL4", "UNKNOWN_COL5"]
-
-                        # UNKNOWN_COL을 실제 컬럼 이름으로 변경
-                        before_values = {table_columns[i]: before_values.get(unknown_cols[i], None) for i in range(len(table_columns))}
-                        after_values = {table_columns[i]: after_values.get(unknown_cols[i], None) for i in range(len(table_columns))}
-
                         # server_id 검증
-                        if "server_id" in after_values and str(after_values["server_id"]) != str(server_id):
+                        if str(after_values.server_id) != str(server_id):
                             continue
-                        worker_id = after_values.get("worker_id")
+                        worker_id = after_values.worker_id
 
                         if worker_id is None:
                             print("worker_id이 없음")
                             continue
 
                         # 상태가 변경되었다면 스킵
-                        if str(after_values.get("state")) != str(before_values.get("state")):
-                            print(f"상태가 변경되었음: {before_values.get('state')} -> {after_values.get('state')}")
+                        if str(after_values.state) != str(before_values.state):
+                            print(f"상태가 변경되었음: {before_values.state} -> {after_values.state}")
                             continue
 
                         if worker_id in state.worker_id:
@@ -55,44 +54,32 @@ async def handle_row_event(event, server_id):
 
                         print(f"worker_id데이터 state에 삽입")
                         state.add_worker(worker_id)
+                        dispatched = True
                         
                         # 작업 상태 업데이트
                         async with get_db_context() as db:
                             await RemoteDao().update_tasks_request(db, server_id, worker_id, "idle")
 
                     elif table_name == "daenak":
-                        # ten_min 테이블의 컬럼 매핑
-                        ten_min_columns = ["id", "name", "depositor", "service", "game_id", "pw1", "pw2", "nickname", "phone", "login_type", 
-                                            "price", "otp", "instant", "topclass", "coupon_count", "coupon_content", "state", "cookie", "regdate", "deposit_date",
-                                            "success_date", "worker_id", "erased_worker_id", "erased_reason", "erased_date", "path", "same_name",
-                                            "is_waiting_active", "topclass_agree", "otp_pass"]
-
-                        unknown_cols = []
-                        for i in range(len(ten_min_columns)):
-                            unknown_cols.append(f"UNKNOWN_COL{i}")
-
-                        before_values = {ten_min_columns[i]: before_values.get(unknown_cols[i], None) for i in range(len(ten_min_columns))}
-                        after_values = {ten_min_columns[i]: after_values.get(unknown_cols[i], None) for i in range(len(ten_min_columns))}
-
-                        worker_id = after_values.get("worker_id")
+                        worker_id = after_values.worker_id
                         print(f"worker_id={worker_id}, state.worker_id={state.worker_id}")
                         if not worker_id or worker_id is None or not worker_id in state.worker_id:
                             continue
 
                         # otp_pass에 관한 update사항이라면 continue를 통해 로직에서 빠져나오기
-                        if after_values.get("otp_pass") != before_values.get("otp_pass"):
-                            print(f"before_values.get('otp_pass')={before_values.get('otp_pass')}, after_values.get('otp_pass')={after_values.get('otp_pass')}")
+                        if after_values.otp_pass != before_values.otp_pass:
+                            print(f"before_values.otp_pass={before_values.otp_pass}, after_values.otp_pass={after_values.otp_pass}")
                             continue
 
 
                         # ten_min 테이블의 필요한 값들 가져오기
-                        deanak_id = after_values.get("id")
-                        service = after_values.get("service")
-                        pw2 = after_values.get("pw2")
-                        otp = after_values.get("otp")
-                        otp_pass = after_values.get("otp_pass")
-                        coupon_count = after_values.get("coupon_count")
-                        ten_min_state = after_values.get("state")
+                        deanak_id = after_values.id
+                        service = after_values.service
+                        pw2 = after_values.pw2
+                        otp = after_values.otp
+                        otp_pass = after_values.otp_pass
+                        coupon_count = after_values.coupon_count
+                        ten_min_state = after_values.state
 
                         # print(f"개별 row 처리: service={service}, worker_id={worker_id}, pw2={pw2}, coupon_count={coupon_count}, otp={otp}, ten_min_state={ten_min_state}, otp_pass={otp_pass}")
 
@@ -110,6 +97,7 @@ async def handle_row_event(event, server_id):
 
                         # 서비스 실행
                         if service == "10분접속" and otp == 0 and coupon_count == 0 and ten_min_state == '2':
+                            dispatched = True  # 바로 실행하거나 대기열에 추가됨
                             remote_pcs = await check_remote_pc_state(server_id, worker_id, ten_min_info)
                             if not remote_pcs:
                                 continue
@@ -118,6 +106,7 @@ async def handle_row_event(event, server_id):
                             await do_task("ten_min_start", ten_min_info)
 
                         if service == "10분접속" and otp == 1 and otp_pass == 0 and coupon_count == 0 and ten_min_state == '2':
+                            dispatched = True
                             remote_pcs = await check_remote_pc_state(server_id, worker_id, ten_min_info)
                             if not remote_pcs:
                                 continue
@@ -138,6 +127,8 @@ async def handle_row_event(event, server_id):
                 print(f"개별 row 처리 중 오류 발생: {e}")
                 continue
 
+        return dispatched
+
     except Exception as e:
         async with get_db_context() as db:
             await RemoteDao.update_tasks_request(db, server_id, "stopped")
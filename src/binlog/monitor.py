@@ -1,4 +1,5 @@
 from pymysqlreplication import BinLogStreamReader
+from pymysqlreplication.event import QueryEvent, XidEvent
 from pymysqlreplication.row_event import (
     DeleteRowsEvent,
     UpdateRowsEvent,
@@ -6,40 +7,107 @@ from pymysqlreplication.row_event import (
 )
 from config.settings import DB_CONFIG
 from .handler import handle_row_event
+from .reader import BinlogReader
+from .checkpoint import BinlogCheckpoint
+from .row_decoder import RowDecoderRegistry
 import asyncio
+import os
+import time
+import pymysql
 from src import state
 
-async def monitor_binlog(unique_id_value):
-    """Binlog 모니터링 로직"""
-    state.monitoring_task = asyncio.current_task()
+BINLOG_SCHEMA = "ez_daenak"
+BINLOG_TABLES = ["remote_pcs", "daenak"]
+# 재시작 후 체크포인트부터 다시 읽은 행 이벤트 중 이보다 오래된 것은 작업을 실행하지 않음 (초, 0이면 제한 없음)
+BINLOG_MAX_REPLAY_AGE = float(os.getenv("BINLOG_MAX_REPLAY_AGE", "300"))
 
-    stream = BinLogStreamReader(
+def create_stream(position=None):
+    """blocking 모드의 binlog 스트림 생성 (리더 스레드에서 호출)
+
+    Args:
+        position: 이어서 읽을 (log_file, log_pos) (None이면 현재 위치부터)
+    """
+    log_file, log_pos = position if position else (None, None)
+    return BinLogStreamReader(
         connection_settings=DB_CONFIG,
         server_id=1,
-        blocking=False,
+        blocking=True,
         resume_stream=True,
-        only_events=[UpdateRowsEvent],
-        only_tables=["remote_pcs", "daenak"],
-        only_schemas=["ez_daenak"],
+        log_file=log_file,
+        log_pos=log_pos,
+        # XidEvent/QueryEvent는 트랜잭션 경계(체크포인트 위치)를 알기 위해 함께 받음
+        only_events=[UpdateRowsEvent, XidEvent, QueryEvent],
+        only_tables=BINLOG_TABLES,
+        only_schemas=[BINLOG_SCHEMA],
         freeze_schema=False # 스키마 변경사항을 실시간으로 반영하여 컬럼명이 제대로 표시되도록 함
     )
 
-    print("Binlog 모니터링 시작")    
-    while not state.monitoring_task.cancelled():  # 취소 여부 확인
-        try:
-            binlogevent = stream.fetchone()
-            if binlogevent is None:
-                await asyncio.sleep(1)  # CPU 사용률 조절을 위한 짧은 대기
-                continue
+def current_position():
+    """서버의 현재 binlog 위치 (log_file, log_pos) 조회 (binlog가 꺼져 있으면 None)"""
+    connection = pymysql.connect(**DB_CONFIG)
+    try:
+        with connection.cursor() as cursor:
+            try:
+                cursor.execute("SHOW BINARY LOG STATUS")  # MySQL 8.2 이상
+            except pymysql.MySQLError:
+                cursor.execute("SHOW MASTER STATUS")
+            row = cursor.fetchone()
+    finally:
+        connection.close()
+    return (row[0], int(row[1])) if row else None
+
+async def monitor_binlog(unique_id_value):
+    """Binlog 모니터링 로직"""
+    state.monitoring_task = asyncio.current_task()
+
+    # 전용 스레드가 blocking 스트림에서 이벤트를 읽어 큐로 전달하고,
+    # 처리를 마친 트랜잭션 위치는 체크포인트에 저장하여 재시작 시 그 위치부터 이어서 읽음
+    checkpoint = BinlogCheckpoint()
+
+    # 테이블별 행 디코더는 시작할 때 information_schema에서 한 번 만들고, DDL이 들어오면 리더 스레드에서 갱신
+    loop = asyncio.get_running_loop()
+    decoders = RowDecoderRegistry(DB_CONFIG, BINLOG_SCHEMA, BINLOG_TABLES)
+    try:
+        print(f"행 디코더 로드: {await loop.run_in_executor(None, decoders.load)}")
+    except Exception as e:
+        print(f"행 디코더 로드 실패 (첫 행 이벤트에서 다시 시도): {e}")
 
-            if isinstance(binlogevent, (UpdateRowsEvent)):
-                await handle_row_event(binlogevent, unique_id_value)
-                
+    # 체크포인트부터 다시 읽는 경우, 시작 시점의 서버 위치까지가 재시작 전에 기록된 이벤트
+    replay_until = None
+    if checkpoint.position is not None:
+        try:
+            replay_until = await loop.run_in_executor(None, current_position)
         except Exception as e:
-            if not state.monitoring_task.cancelled():  # 취소가 아닌 실제 오류인 경우만 출력
-                # print(f"Binlog 이벤트 처리 중 오류 발생: {e}")
-                await asyncio.sleep(3)  # 오류 발생시 5초 대기
-            continue
-        finally:
-            if 'stream' in locals():
-                stream.close()
+            print(f"현재 binlog 위치 조회 실패 (다시 읽은 이벤트도 오래된 이벤트로 건너뛰지 않음): {e}")
+
+    reader = BinlogReader(loop, create_stream, checkpoint=checkpoint, decoder=decoders, replay_until=replay_until)
+    state.binlog_reader = reader
+    reader.start()
+
+    print(f"Binlog 모니터링 시작 (시작 위치: {checkpoint.position or '현재 위치'})")
+    try:
+        while not state.monitoring_task.cancelled():  # 취소 여부 확인
+            binlogevent = await reader.get()
+            dispatched = False
+            try:
+                # 체크포인트부터 다시 읽은 오래된 변경으로 지난 작업이 실행되지 않도록 건너뜀 (위치는 계속 갱신)
+                # 실시간 이벤트는 서버와 시계가 다르거나 트랜잭션이 길어도 건너뛰지 않음
+                if getattr(binlogevent, "replayed", False) and BINLOG_MAX_REPLAY_AGE:
+                    age = time.time() - (getattr(binlogevent, "timestamp", None) or time.time())
+                    if age > BINLOG_MAX_REPLAY_AGE:
+                        print(f"오래된 binlog 이벤트 건너뜀: {binlogevent.table} ({age:.0f}초 전)")
+                        continue
+
+                if isinstance(binlogevent, (UpdateRowsEvent)):
+                    dispatched = await handle_row_event(binlogevent, unique_id_value)
+
+            except Exception as e:
+                if not state.monitoring_task.cancelled():  # 취소가 아닌 실제 오류인 경우만 출력
+                    # print(f"Binlog 이벤트 처리 중 오류 발생: {e}")
+                    await asyncio.sleep(3)  # 오류 발생시 3초 대기
+                continue
+            finally:
+                reader.mark_processed(dispatched)
+    finally:
+        reader.stop()
+        checkpoint.flush()
@@ -0,0 +1,261 @@
+import asyncio
+import concurrent.futures
+import os
+import threading
+import time
+from pymysqlreplication.event import QueryEvent, XidEvent
+
+
+class BinlogReader:
+    """전용 스레드에서 blocking 모드의 binlog 스트림을 읽어 asyncio.Queue로 전달하는 리더
+
+    이벤트가 도착하는 즉시 스레드에서 행 데이터까지 디코딩한 뒤 큐에 넣으므로,
+    이벤트 루프는 폴링이나 대기 없이 큐에서 바로 이벤트를 받습니다.
+    큐가 가득 차면 리더 스레드가 기다리므로 이벤트를 버리지 않습니다.
+
+    스트림은 오류가 날 때까지 하나를 계속 사용합니다. 행 이벤트는 트랜잭션이 끝날 때
+    (XidEvent, COMMIT/DDL QueryEvent) 한꺼번에 큐에 넣고, 마지막 행에 그 시점의 위치를 함께 전달하므로
+    다시 연결할 때는 마지막으로 읽은 트랜잭션 경계부터 중복 없이 이어서 읽습니다.
+    BEGIN이나 트랜잭션 경계 같은 행 이외의 이벤트는 리더 스레드에서 위치만 기록하고 큐에 넣지 않습니다.
+
+    저장된 위치의 binlog 파일이 이미 삭제되었거나(오류 1236) 같은 위치에서 연속으로 실패하면
+    건너뛴 구간을 기록하고 체크포인트를 지운 뒤 현재 위치부터 다시 읽습니다.
+
+    replay_until(시작할 때 서버의 binlog 위치)까지의 행 이벤트에는 replayed=True를 표시하여,
+    재시작 전에 기록된 변경과 실시간 변경을 구분할 수 있게 합니다.
+    """
+    PURGED_LOG_ERROR = 1236
+
+    def __init__(self, loop, stream_factory, queue_size=1000, checkpoint=None,
+                 retry_delay=1.0, max_retry_delay=None, decoder=None, max_resume_failures=None, replay_until=None):
+        """
+        Args:
+            loop: 이벤트를 받을 asyncio 이벤트 루프
+            stream_factory: 시작 위치((log_file, log_pos) 또는 None)를 받아 blocking BinLogStreamReader를 생성하는 함수
+            queue_size: 큐 최대 크기
+            checkpoint: 처리를 마친 위치를 저장할 BinlogCheckpoint (없으면 저장하지 않음)
+            retry_delay: 스트림 오류 후 첫 재연결 대기 시간(초)
+            max_retry_delay: 재연결 대기 시간 상한(초)
+            decoder: 리더 스레드에서 이벤트마다 process(event)를 호출할 행 디코더 (RowDecoderRegistry)
+            max_resume_failures: 저장된 위치에서 연속으로 실패하면 현재 위치로 넘어갈 횟수 (0이면 넘어가지 않음)
+            replay_until: 시작할 때 서버의 (log_file, log_pos) - 이 위치까지의 행 이벤트는 다시 읽은 이벤트로 표시
+        """
+        self.loop = loop
+        self.stream_factory = stream_factory
+        self.checkpoint = checkpoint
+        self.decoder = decoder
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay if max_retry_delay is not None else float(os.getenv("BINLOG_RECONNECT_MAX_DELAY", "30"))
+        self.max_resume_failures = max_resume_failures if max_resume_failures is not None else int(os.getenv("BINLOG_MAX_RESUME_FAILURES", "10"))
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        # 마지막으로 큐에 넣은 트랜잭션 경계 위치 (다시 연결할 때 시작 위치)
+        self.position = checkpoint.position if checkpoint is not None else None
+        self.replay_until = replay_until if self.position is not None else None
+        self._dispatched = False  # 아직 체크포인트에 기록하지 않은 트랜잭션에서 작업을 실행했는지 여부
+        self._processed_position = None
+        self._busy = False  # 이벤트 루프가 꺼낸 이벤트를 처리 중인지 여부
+        self._last_idle_advance = 0.0
+        self._stream = None
+        self._stream_lock = threading.Lock()
+        self._running = False
+        self._thread = None
+        self.stats = {
+            "received": 0,  # 스트림에서 읽은 이벤트 수
+            "consumed": 0,  # 이벤트 루프가 꺼낸 이벤트 수
+            "errors": 0,
+            "reconnects": 0,
+            "skipped_gaps": 0,  # 저장된 위치를 읽을 수 없어 현재 위치로 넘어간 횟수
+            "max_queue_depth": 0,
+            "last_lag_ms": 0.0,  # 마지막 이벤트의 binlog 기록 시각부터 처리 시작까지 걸린 시간
+            "max_lag_ms": 0.0,
+            "last_queue_ms": 0.0,  # 마지막 이벤트가 큐에서 기다린 시간
+        }
+
+    def start(self):
+        """리더 스레드 시작"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="binlog-reader", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """리더 스레드 종료 요청 (스트림을 닫아 blocking 읽기를 깨움)
+
+        이벤트 루프에서 호출되므로 스레드 종료를 기다리지 않습니다.
+        """
+        self._running = False
+        self._close_stream()
+        self._thread = None
+        self._advance_idle()
+
+    def _close_stream(self):
+        with self._stream_lock:
+            stream, self._stream = self._stream, None
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    @staticmethod
+    def _is_boundary(event):
+        """트랜잭션이 끝나는 이벤트인지 확인 (DDL은 자동 커밋되므로 경계로 취급)"""
+        if isinstance(event, XidEvent):
+            return True
+        if isinstance(event, QueryEvent):
+            return str(event.query).strip().upper() != "BEGIN"
+        return False
+
+    @staticmethod
+    def _is_row_event(event):
+        """큐로 전달할 행 이벤트인지 확인"""
+        return hasattr(event, "rows")
+
+    @classmethod
+    def _is_purged_log_error(cls, error):
+        """저장된 위치의 binlog 파일을 서버에서 찾을 수 없다는 오류인지 확인"""
+        args = getattr(error, "args", ())
+        if args and args[0] == cls.PURGED_LOG_ERROR:
+            return True
+        return "could not find first log file" in str(error).lower()
+
+    def _skip_to_current(self, reason):
+        """읽을 수 없는 저장 위치를 버리고 현재 위치부터 다시 읽도록 설정"""
+        print(f"Binlog {self.position} 위치부터 읽을 수 없어 현재 위치로 넘어갑니다 ({reason}). 그 사이의 변경 사항은 처리되지 않습니다.")
+        self.position = None
+        self.replay_until = None  # 현재 위치부터는 모두 실시간 이벤트
+        self.stats["skipped_gaps"] += 1
+        if self.checkpoint is not None:
+            self.checkpoint.reset()
+
+    def _put(self, event, position=None):
+        """리더 스레드에서 이벤트를 큐에 넣음 (큐가 가득 차면 빈 자리가 날 때까지 대기)"""
+        item = (time.monotonic(), event, position)
+        future = asyncio.run_coroutine_threadsafe(self.queue.put(item), self.loop)
+        while self._running:
+            try:
+                future.result(timeout=1.0)
+                break
+            except concurrent.futures.TimeoutError:
+                continue
+        else:
+            future.cancel()
+            return
+        depth = self.queue.qsize()
+        if depth > self.stats["max_queue_depth"]:
+            self.stats["max_queue_depth"] = depth
+
+    def _advance_idle(self):
+        """이벤트 루프에서 처리 중인 이벤트가 없으면 마지막으로 읽은 경계 위치를 체크포인트에 반영
+
+        큐가 비어 있고 처리 중인 이벤트가 없다면 그 위치까지의 행 이벤트는 모두 처리된 상태입니다.
+        """
+        if self.checkpoint is None or self._busy or not self.queue.empty():
+            return
+        position = self.position
+        if position is not None:
+            self.checkpoint.update(*position)
+
+    def _schedule_idle_advance(self):
+        """행이 없는 트랜잭션이 끝났을 때 이벤트 루프에 체크포인트 반영을 요청 (1초에 한 번)"""
+        now = time.monotonic()
+        if now - self._last_idle_advance < 1.0:
+            return
+        self._last_idle_advance = now
+        try:
+            self.loop.call_soon_threadsafe(self._advance_idle)
+        except RuntimeError:
+            pass  # 이벤트 루프가 이미 닫힘
+
+    def _run(self):
+        delay = self.retry_delay
+        failures = 0  # 같은 위치에서 연속으로 실패한 횟수
+        while self._running:
+            # 트랜잭션 경계 전에 연결이 끊기면 해당 트랜잭션은 다시 읽으므로 버림
+            pending = []
+            try:
+                stream = self.stream_factory(self.position)
+                with self._stream_lock:
+                    self._stream = stream
+                if not self._running:
+                    break
+
+                for event in stream:
+                    if not self._running:
+                        break
+                    # 행 데이터는 처음 접근할 때 디코딩되므로 리더 스레드에서 미리 디코딩
+                    getattr(event, "rows", None)
+                    if self.decoder is not None:
+                        self.decoder.process(event)
+                    self.stats["received"] += 1
+                    delay = self.retry_delay
+                    failures = 0
+
+                    if self._is_row_event(event):
+                        pending.append(event)
+                        continue
+                    if not self._is_boundary(event):
+                        continue
+
+                    position = (stream.log_file, stream.log_pos)
+                    replayed = self.replay_until is not None and position <= self.replay_until
+                    for index, buffered in enumerate(pending):
+                        buffered.replayed = replayed
+                        self._put(buffered, position if index == len(pending) - 1 else None)
+                    self.position = position
+                    if not pending:
+                        self._schedule_idle_advance()
+                    pending = []
+            except Exception as e:
+                if not self._running:
+                    break
+                self.stats["errors"] += 1
+                self.stats["reconnects"] += 1
+                failures += 1
+                if self.position is not None and self._is_purged_log_error(e):
+                    self._skip_to_current(f"binlog 파일 없음: {e}")
+                    failures = 0
+                    continue
+                if self.position is not None and self.max_resume_failures and failures >= self.max_resume_failures:
+                    self._skip_to_current(f"{failures}회 연속 실패: {e}")
+                    failures = 0
+                    continue
+                print(f"Binlog 스트림 읽기 중 오류 발생: {e} ({delay:.0f}초 후 {self.position or '현재 위치'}부터 다시 연결)")
+                time.sleep(delay)
+                delay = min(delay * 2, self.max_retry_delay)
+            finally:
+                self._close_stream()
+
+    async def get(self):
+        """다음 이벤트를 기다려 반환하고 지연 시간 지표를 갱신"""
+        enqueued, event, position = await self.queue.get()
+        self._processed_position = position
+        self._busy = True
+        self.stats["consumed"] += 1
+        self.stats["last_queue_ms"] = (time.monotonic() - enqueued) * 1000
+
+        timestamp = getattr(event, "timestamp", None)
+        if timestamp:
+            lag_ms = max(0.0, (time.time() - timestamp) * 1000)
+            self.stats["last_lag_ms"] = lag_ms
+            self.stats["max_lag_ms"] = max(self.stats["max_lag_ms"], lag_ms)
+        return event
+
+    def mark_processed(self, dispatched=False):
+        """마지막으로 꺼낸 이벤트의 처리가 끝났음을 알림 (트랜잭션의 마지막 행이면 체크포인트 갱신)
+
+        Args:
+            dispatched: 이 이벤트로 작업을 실행했는지 여부 - 트랜잭션이 끝나면 위치를 바로 파일에 기록
+        """
+        position, self._processed_position = self._processed_position, None
+        self._busy = False
+        self._dispatched = self._dispatched or dispatched
+        if position is not None and self.checkpoint is not None:
+            self.checkpoint.update(*position, force=self._dispatched)
+            self._dispatched = False
+        self._advance_idle()
+
+    def metrics(self):
+        """큐 깊이와 지연 시간 지표 반환"""
+        return dict(self.stats, queue_depth=self.queue.qsize())
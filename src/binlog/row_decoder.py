@@ -0,0 +1,188 @@
+import re
+import threading
+from collections import namedtuple
+import pymysql
+from pymysqlreplication.event import QueryEvent
+from pymysqlreplication.row_event import RowsEvent
+
+# 행 변경 한 건 (before/after는 테이블별 행 타입, 없으면 None)
+RowChange = namedtuple("RowChange", ["before", "after"])
+
+DDL_PATTERN = re.compile(r"^\s*(ALTER|CREATE|DROP|RENAME|TRUNCATE)\s+TABLE\b", re.IGNORECASE)
+# DDL 대상 테이블 이름 (`schema`.`table`, IF [NOT] EXISTS 허용) - RENAME/DROP은 쉼표로 여러 테이블 지정 가능
+TABLE_NAME = r"(?:`?\w+`?\s*\.\s*)?`?(\w+)`?"
+DDL_TARGET = re.compile(
+    r"^\s*(?:ALTER|CREATE(?:\s+TEMPORARY)?|DROP(?:\s+TEMPORARY)?|RENAME|TRUNCATE)\s+TABLE\s+(?:IF\s+(?:NOT\s+)?EXISTS\s+)?"
+    + TABLE_NAME,
+    re.IGNORECASE,
+)
+# RENAME TABLE a TO b, c TO d / DROP TABLE a, b 의 나머지 테이블
+EXTRA_TARGETS = re.compile(r"(?:,|\bTO\b)\s*" + TABLE_NAME, re.IGNORECASE)
+# 도구나 ORM이 DDL 앞에 붙이는 주석 (/* ... */, -- ..., # ...)
+LEADING_COMMENTS = re.compile(r"^(?:\s*(?:/\*.*?\*/|--[^\n]*(?:\n|$)|#[^\n]*(?:\n|$)))*", re.DOTALL)
+
+
+def is_ddl(query):
+    """앞쪽 주석을 제외하고 테이블 DDL로 시작하는 쿼리인지 확인"""
+    return DDL_PATTERN.match(LEADING_COMMENTS.sub("", query, count=1)) is not None
+
+
+def ddl_tables(query):
+    """테이블 DDL의 대상 테이블 이름 집합 (테이블 DDL이 아니면 빈 집합)
+
+    ALTER/CREATE/DROP/TRUNCATE는 첫 번째 테이블을, RENAME과 여러 테이블을 지정한 DROP은
+    나열된 모든 테이블(RENAME은 바뀐 이름 포함)을 반환합니다.
+    """
+    query = LEADING_COMMENTS.sub("", query, count=1)
+    match = DDL_TARGET.match(query)
+    if match is None:
+        return set()
+    tables = {match.group(1)}
+    if re.match(r"\s*(RENAME|DROP)\b", query, re.IGNORECASE):
+        tables.update(extra.group(1) for extra in EXTRA_TARGETS.finditer(query, match.end()))
+    return tables
+
+
+class TableDecoder:
+    """테이블 한 개의 컬럼 순서로 만든 위치 기반 행 디코더
+
+    binlog 행 값은 컬럼 순서대로 들어 있으므로, 키 이름(UNKNOWN_COLn 등)과 상관없이
+    값 순서 그대로 테이블 전용 namedtuple에 담습니다.
+    """
+
+    def __init__(self, table, columns):
+        """
+        Args:
+            table: 테이블 이름
+            columns: ORDINAL_POSITION 순서의 컬럼 이름 목록
+        """
+        self.table = table
+        self.columns = tuple(columns)
+        self.width = len(self.columns)
+        type_name = "".join(part.capitalize() for part in table.split("_")) + "Row"
+        self.row_type = namedtuple(type_name, self.columns, rename=True)
+        self._make = self.row_type._make
+
+    def decode(self, values):
+        """binlog 행 값(dict)을 행 객체로 변환 (컬럼 수가 다르면 None)"""
+        if not values or len(values) != self.width:
+            return None
+        return self._make(values.values())
+
+
+class RowDecoderRegistry:
+    """information_schema에서 읽은 컬럼 순서로 테이블별 디코더를 만들어 두는 저장소
+
+    시작할 때 한 번 로드하고, 감시 대상 테이블의 DDL(QueryEvent)이 들어오면 다시 로드합니다.
+    process()는 binlog 리더 스레드에서 이벤트 순서대로 호출되므로,
+    DDL 이후의 이벤트는 항상 새 컬럼 순서로 디코딩됩니다.
+    """
+
+    def __init__(self, connection_settings, schema, tables):
+        """
+        Args:
+            connection_settings: pymysql 연결 설정 (DB_CONFIG)
+            schema: 데이터베이스 이름
+            tables: 디코더를 만들 테이블 이름 목록
+        """
+        self.connection_settings = connection_settings
+        self.schema = schema
+        self.tables = list(tables)
+        self._decoders = {}
+        self._lock = threading.Lock()
+        # 마지막 로드 이후 다시 로드해도 맞지 않았던 (table, 컬럼 수) - 같은 불일치로 반복 로드하지 않음
+        self._mismatches = set()
+        self.refreshes = 0
+
+    def load(self):
+        """information_schema에서 컬럼 순서를 읽어 디코더를 다시 생성
+
+        Returns:
+            dict: {table: 컬럼 수}
+        """
+        connection = pymysql.connect(**self.connection_settings)
+        try:
+            with connection.cursor() as cursor:
+                placeholders = ", ".join(["%s"] * len(self.tables))
+                cursor.execute(
+                    "SELECT TABLE_NAME, COLUMN_NAME FROM information_schema.COLUMNS "
+                    f"WHERE TABLE_SCHEMA = %s AND TABLE_NAME IN ({placeholders}) "
+                    "ORDER BY TABLE_NAME, ORDINAL_POSITION",
+                    [self.schema, *self.tables],
+                )
+                rows = cursor.fetchall()
+        finally:
+            connection.close()
+
+        columns = {}
+        for table, column in rows:
+            columns.setdefault(table, []).append(column)
+
+        decoders = {table: TableDecoder(table, names) for table, names in columns.items()}
+        with self._lock:
+            self._decoders = decoders
+            self._mismatches.clear()
+        self.refreshes += 1
+        return {table: decoder.width for table, decoder in decoders.items()}
+
+    def get(self, table):
+        """테이블 디코더 반환 (없으면 None)"""
+        with self._lock:
+            return self._decoders.get(table)
+
+    def _refresh(self, reason):
+        try:
+            widths = self.load()
+            print(f"행 디코더 갱신 ({reason}): {widths}")
+        except Exception as e:
+            print(f"행 디코더 갱신 실패 ({reason}): {e}")
+
+    def _decode_row(self, decoder, row):
+        """행 하나를 RowChange로 변환 (컬럼 수가 맞지 않으면 None)"""
+        before = row.get("before_values")
+        after = row.get("after_values", row.get("values"))
+        change = RowChange(
+            decoder.decode(before) if before is not None else None,
+            decoder.decode(after) if after is not None else None,
+        )
+        if (before is not None and change.before is None) or (after is not None and change.after is None):
+            return None
+        return change
+
+    def decode(self, event):
+        """행 이벤트를 RowChange 목록으로 변환
+
+        컬럼 수가 맞지 않는 행이 있으면 스키마가 바뀐 것으로 보고 다시 로드하며,
+        그래도 맞지 않는 행은 건너뜁니다. 같은 컬럼 수의 불일치로는 다시 로드하지 않습니다.
+        """
+        decoder = self.get(event.table)
+        changes = []
+        for row in event.rows:
+            change = self._decode_row(decoder, row) if decoder is not None else None
+            if change is None:
+                width = len(row.get("after_values") or row.get("values") or row.get("before_values") or ())
+                key = (event.table, width)
+                if key not in self._mismatches:
+                    self._refresh(f"{event.table} 컬럼 불일치")
+                    decoder = self.get(event.table)
+                    change = self._decode_row(decoder, row) if decoder is not None else None
+                    if change is None:
+                        self._mismatches.add(key)
+            if change is None:
+                print(f"{event.table} 행을 현재 스키마로 디코딩하지 못해 건너뜀")
+                continue
+            changes.append(change)
+        return changes
+
+    def process(self, event):
+        """binlog 리더 스레드에서 이벤트마다 호출
+
+        감시 대상 테이블의 DDL이면 디코더를 다시 로드하고,
+        행 이벤트이면 typed_rows에 RowChange 목록을 담습니다.
+        """
+        if isinstance(event, QueryEvent):
+            query = str(event.query)
+            if ddl_tables(query) & set(self.tables):
+                self._refresh("DDL")
+        elif isinstance(event, RowsEvent) and event.table in self.tables:
+            event.typed_rows = self.decode(event)
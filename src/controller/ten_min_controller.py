@@ -1,4 +1,5 @@
 import asyncio
+import os
 from enum import auto
 from src import state
 from database import get_db_context
@@ -16,14 +17,23 @@ from src.dao.remote_pcs_dao import RemoteDao
 from src.dao.auto_ten_min_dao import AutoTenMinDao
 from src.dao.deanak_dao import DeanakDao
 from src.utils.image_matcher import ImageMatcher
-from src.utils.capture import CaptureUtil
-from src.utils.input_controller import InputController
+from src.utils.frame_source import create_frame_source
 from src.utils.error_handler import CantFindRemoteProgram, TenMinError, ErrorHandler, CheckTimerError, CantFindTenMinDataError, OTPError, NoWorkerError, CantFindPcNumError, OTPTimeoutError, NoDetectionError, OTPOverTimeDetectError, TemplateEmptyError, ControllerError
 
+
+def create_input_controller():
+    """실시간 입력 컨트롤러 생성 (pyautogui/keyboard는 이 모듈이 서비스를 구성할 때만 import)"""
+    from src.utils.input_controller import InputController
+    return InputController()
+
+
 # 공통으로 사용할 객체들 초기화
-image_matcher = ImageMatcher()
-capture = CaptureUtil()
-input_controller = InputController()
+input_controller = create_input_controller()
+image_matcher = ImageMatcher(input_controller=input_controller)
+# 기본값: 필요할 때 executor에서 실시간 화면 캡처 (dir:<경로>, video:<경로>로 녹화 재생)
+# CAPTURE_FPS > 0이면 세션 중에만 백그라운드 스레드에서 초당 CAPTURE_FPS회 캡처하고, 마지막 입력 이후의 프레임만 사용
+capture = create_frame_source(os.getenv("FRAME_SOURCE"), capture_fps=float(os.getenv("CAPTURE_FPS", "0")),
+                              action_clock=lambda: input_controller.last_action_time)
 remote = RemoteController()
 error_handler = ErrorHandler()
 remote_pcs_dao = RemoteDao()
@@ -155,3 +165,18 @@ async def update_error_status(server_id, e, context, ErrorMessage):
 async def stop_ten_min():
     """태스크 중지"""
     return await do_service.stop_ten_min()
+
+def close_resources():
+    """화면 캡처 스레드, 매칭 스레드 풀과 작업 프로세스 등 프로그램 종료 시 정리할 리소스 해제 (저장하지 않은 템플릿 prior도 저장)"""
+    try:
+        capture.close()
+    except Exception as e:
+        print(f"화면 캡처 정리 중 오류 발생: {e}")
+    try:
+        image_matcher.shutdown_executor()
+    except Exception as e:
+        print(f"매칭 작업자 정리 중 오류 발생: {e}")
+    try:
+        image_matcher.priors.flush()
+    except Exception as e:
+        print(f"템플릿 prior 저장 중 오류 발생: {e}")
@@ -1,31 +1,33 @@
 from src.utils.error_handler import DuplicateLoginError, ErrorHandler
 from src.utils.image_matcher import ImageMatcher
-from src.utils.input_controller import InputController
-from src.utils.capture import CaptureUtil
+from src.utils.frame_source import FrameSource
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.utils.input_controller import InputController
 
 class DuplicateLoginHandler:
-    def __init__(self, image_matcher: ImageMatcher, input_controller: InputController, capture: CaptureUtil):
+    def __init__(self, image_matcher: ImageMatcher, input_controller: "InputController", capture: FrameSource):
         self.image_matcher = image_matcher
         self.input_controller = input_controller
         self.capture = capture
         self.error_handler = ErrorHandler()
 
-    def check_duplicate_login(self, screen, loaded_templates, deanak_id):
-        try:
-            if self.image_matcher.process_template(screen, 'some_one_otp_pass_error', loaded_templates, threshold=0.8):
-                raise DuplicateLoginError(self.error_handler.DUPLICATE_OTP_CHECK_ERROR)
-            
-            if self.image_matcher.process_template(screen, 'same_login_in_anykey_error', loaded_templates, threshold=0.8):
-                raise DuplicateLoginError(self.error_handler.SAME_START_ERROR_BY_ANYKEY_SCENE)
-
-            if self.image_matcher.process_template(screen, 'someone_already_login_error', loaded_templates, threshold=0.8):
-                raise DuplicateLoginError(self.error_handler.DUPLICATE_CONNECTING_ERROR)
-
-            if self.image_matcher.process_template(screen, 'some_one_connecting_try_error', loaded_templates, threshold=0.8):
-                raise DuplicateLoginError(self.error_handler.SOMEONE_CONNECT_TRY_ERROR)
+        # 중복 로그인 템플릿과 에러 메시지 (탐지 우선순위 순)
+        self.DUPLICATE_LOGIN_TEMPLATES = {
+            'some_one_otp_pass_error': self.error_handler.DUPLICATE_OTP_CHECK_ERROR,
+            'same_login_in_anykey_error': self.error_handler.SAME_START_ERROR_BY_ANYKEY_SCENE,
+            'someone_already_login_error': self.error_handler.DUPLICATE_CONNECTING_ERROR,
+            'some_one_connecting_try_error': self.error_handler.SOMEONE_CONNECT_TRY_ERROR,
+            'same_login_in_password_error': self.error_handler.SAME_START_ERROR_BY_PASSWORD_SCENE,
+        }
 
-            if self.image_matcher.process_template(screen, 'same_login_in_password_error', loaded_templates, threshold=0.8):
-                raise DuplicateLoginError(self.error_handler.SAME_START_ERROR_BY_PASSWORD_SCENE)
+    async def check_duplicate_login(self, screen, loaded_templates, deanak_id):
+        try:
+            # 한 번의 호출로 모든 중복 로그인 템플릿을 탐지 (첫 탐지 시 종료)
+            hits = await self.image_matcher.detect_templates_async(screen, list(self.DUPLICATE_LOGIN_TEMPLATES), loaded_templates, threshold=0.8)
+            for template_key in hits:
+                raise DuplicateLoginError(self.DUPLICATE_LOGIN_TEMPLATES[template_key])
             
             return False
         except DuplicateLoginError as e:
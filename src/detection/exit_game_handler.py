@@ -2,7 +2,6 @@ import asyncio
 from src.utils.error_handler import ErrorHandler, NoDetectionError
 from src.models.screen_state import ScreenState
 from src import state
-import time
 
 class ExitGameHandler:
     def __init__(self, image_matcher, capture, template_service, MAX_DETECTION_ATTEMPTS=5):
@@ -21,18 +20,19 @@ class ExitGameHandler:
         if getattr(screen_state, f"{screen_type}_screen_passed"):
             return True
         
-        screen = self.capture.screen_capture()
+        screen = await self.capture.screen_capture_async()
+        self.image_matcher.begin_frame(screen)
 
         screen_state.increment_count(screen_type)
         if screen_state.get_count(screen_type) > self.MAX_DETECTION_ATTEMPTS:
             raise NoDetectionError(f"{screen_type} 화면이 {self.MAX_DETECTION_ATTEMPTS}회 이상 탐지되지 않았습니다.")
         
-        top_left, bottom_right, _ = self.image_matcher.detect_template(screen, loaded_templates[screen_type])
+        top_left, bottom_right, _ = await self.image_matcher.detect_template_async(screen, loaded_templates[screen_type], template_key=screen_type)
         if top_left and bottom_right:
             roi = (top_left[0], top_left[1], bottom_right[0], bottom_right[1])
-            if self.image_matcher.process_template(screen, f"{screen_type}_btn", loaded_templates, click=True, roi=roi):
+            if await self.image_matcher.process_template_async(screen, f"{screen_type}_btn", loaded_templates, click=True, roi=roi):
                 setattr(screen_state, f"{screen_type}_screen_passed", True)
-                time.sleep(1)
+                await asyncio.sleep(1)
                 return True
 
         return False
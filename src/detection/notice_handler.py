@@ -1,7 +1,7 @@
 from src.utils.error_handler import NoDetectionError, ErrorHandler
 from src.models.screen_state import ScreenState
 from src import state
-import time
+import asyncio
 
 class NoticeHandler:
     def __init__(self, image_matcher, input_controller, capture, MAX_DETECTION_ATTEMPTS=3):
@@ -12,7 +12,7 @@ class NoticeHandler:
         self.state = state
         self.error_handler = ErrorHandler()
 
-    def handle_notice_screen(self, screen, loaded_templates, screen_state: ScreenState, deanak_id):
+    async def handle_notice_screen(self, screen, loaded_templates, screen_state: ScreenState, deanak_id):
         """공지사항 화면을 처리합니다.
         
         Args:
@@ -29,10 +29,10 @@ class NoticeHandler:
                 if screen_state.get_count("notice") > self.MAX_DETECTION_ATTEMPTS:
                     raise NoDetectionError(f"noticeScreen 화면이 {self.MAX_DETECTION_ATTEMPTS}회 이상 탐지되지 않았습니다.")
                 
-                if self.image_matcher.process_template(screen, 'team_select_screen', loaded_templates):
+                if await self.image_matcher.process_template_async(screen, 'team_select_screen', loaded_templates):
                     screen_state.notice_passed = True
                     print("공지사항 확인 완료")
-                    time.sleep(1)
+                    await asyncio.sleep(1)
                     return True
             
             return False
@@ -1,7 +1,7 @@
 from src.utils.error_handler import NoDetectionError, WrongPasswordError, TemplateEmptyError, ErrorHandler
 from src.models.screen_state import ScreenState
 from src import state
-import time
+import asyncio
 
 class PasswordHandler:
     def __init__(self, image_matcher, input_controller, capture, MAX_DETECTION_ATTEMPTS=20):
@@ -12,7 +12,7 @@ class PasswordHandler:
         self.state = state
         self.error_handler = ErrorHandler()
 
-    def handle_password_screen(self, screen, loaded_templates, password_list, screen_state: ScreenState, deanak_id):
+    async def handle_password_screen(self, screen, loaded_templates, password_list, screen_state: ScreenState, deanak_id):
         """비밀번호 화면을 처리합니다.
         Args:
             screen: 현재 화면 이미지
@@ -30,7 +30,7 @@ class PasswordHandler:
                 if screen_state.get_count("password") > self.MAX_DETECTION_ATTEMPTS:
                     raise NoDetectionError(f"passwordScreen 화면이 {self.MAX_DETECTION_ATTEMPTS}회 이상 탐지되지 않았습니다.")
                 
-                top_left, bottom_right, _ = self.image_matcher.detect_template(screen, loaded_templates['password_screen'])
+                top_left, bottom_right, _ = await self.image_matcher.detect_template_async(screen, loaded_templates['password_screen'], template_key='password_screen')
                 if top_left and bottom_right:
                     roi = (top_left[0], top_left[1], bottom_right[0], bottom_right[1])
 
@@ -38,17 +38,18 @@ class PasswordHandler:
                         if template_key not in loaded_templates['password_templates']:
                             raise TemplateEmptyError(f"비밀번호 템플릿이 없습니다: {template_key}")
                         
-                        # 비밀번호 입력스크린 감지
-                        self.image_matcher.process_template(screen, template_key, loaded_templates['password_templates'], click=True, roi=roi)
-                        time.sleep(0.5)
+                        # 비밀번호 입력스크린 감지 (키패드 숫자 위치는 매번 바뀌므로 학습된 위치를 사용하지 않음)
+                        await self.image_matcher.process_template_async(screen, template_key, loaded_templates['password_templates'], click=True, roi=roi,
+                                                                        use_prior=False)
+                        await asyncio.sleep(0.5)
 
                     # 비밀번호 확인 클릭
-                    if self.image_matcher.process_template(screen, 'password_confirm', loaded_templates, click=True, roi=roi):
-                        time.sleep(3)
+                    if await self.image_matcher.process_template_async(screen, 'password_confirm', loaded_templates, click=True, roi=roi):
+                        await asyncio.sleep(3)
                         for i in range(3):
-                            screen = self.capture.screen_capture()
-                            time.sleep(1)
-                            if self.image_matcher.process_template(screen, 'wrong_password', loaded_templates, threshold=0.8, roi=roi):
+                            screen = await self.capture.screen_capture_async()
+                            await asyncio.sleep(1)
+                            if await self.image_matcher.process_template_async(screen, 'wrong_password', loaded_templates, threshold=0.8, roi=roi):
                                 raise WrongPasswordError("비밀번호 오류")
                         
                         screen_state.password_passed = True
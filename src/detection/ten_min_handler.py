@@ -13,7 +13,7 @@ class TenMinScreenHandler:
         self.state = state
         self.error_handler = ErrorHandler()
 
-    def handle_ten_min_screen(self, screen, loaded_templates, screen_state: ScreenState, deanak_id):
+    async def handle_ten_min_screen(self, screen, loaded_templates, screen_state: ScreenState, deanak_id):
         """10분 모드을 처리합니다.
         
         Args:
@@ -30,7 +30,7 @@ class TenMinScreenHandler:
                     raise NoDetectionError(f"team_select_screen 화면이 {self.MAX_DETECTION_ATTEMPTS}회 이상 탐지되지 않았습니다.")
                 
                 # 팀 선택 화면 탐지
-                top_left, bottom_right, _ = self.image_matcher.detect_template(screen, loaded_templates['team_select_screen'], threshold=0.8)
+                top_left, bottom_right, _ = await self.image_matcher.detect_template_async(screen, loaded_templates['team_select_screen'], threshold=0.8, template_key='team_select_screen')
                 if top_left and bottom_right:
                     screen_state.team_select_passed = True
 
@@ -1,10 +1,8 @@
 import datetime as dt
 from src.utils.error_handler import DuplicateLoginError, TenMinError, APICallError, NoDetectionError, WrongPasswordError, TemplateEmptyError
 from src.utils.image_matcher import ImageMatcher
-from src.utils.input_controller import InputController
-from src.utils.remote_controller import RemoteController
 from src.service.template_service import TemplateService
-from src.utils.capture import CaptureUtil
+from src.utils.frame_source import FrameSource
 from src.utils.error_handler import ErrorHandler
 from src.models.screen_state import ScreenState
 from src import state
@@ -19,9 +17,15 @@ from src.detection.notice_handler import NoticeHandler
 from src.detection.ten_min_handler import TenMinScreenHandler
 from src.detection.duplicate_login_handler import DuplicateLoginHandler
 import asyncio
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.utils.input_controller import InputController
+    from src.utils.remote_controller import RemoteController
+
 
 class AutoTenMin:
-    def __init__(self, image_matcher: ImageMatcher, input_controller: InputController, template_service: TemplateService, capture: CaptureUtil, state: state, remote_pcs_dao: RemoteDao, remote: RemoteController, auto_ten_min_dao: AutoTenMinDao, api: Api):
+    def __init__(self, image_matcher: ImageMatcher, input_controller: "InputController", template_service: TemplateService, capture: FrameSource, state: state, remote_pcs_dao: RemoteDao, remote: "RemoteController", auto_ten_min_dao: AutoTenMinDao, api: Api):
         self.image_matcher = image_matcher
         self.input_controller = input_controller
         self.template_service = template_service
@@ -67,10 +71,14 @@ class AutoTenMin:
             self.state.is_running = True
             while self.state.is_running:
                 try:
-                    screen = self.capture.screen_capture()
+                    screen = await self.capture.screen_capture_async()
                     print("capturing...")
+                    # 이 프레임의 탐지 결과는 모든 핸들러가 공유 (같은 템플릿을 두 번 매칭하지 않음)
+                    frame = self.image_matcher.begin_frame(screen)
+                    if not frame.changed:
+                        print("화면 변경 없음 - 이전 탐지 결과 재사용")
 
-                    self.duplicate_login_handler.check_duplicate_login(screen, loaded_templates, deanak_id)
+                    await self.duplicate_login_handler.check_duplicate_login(screen, loaded_templates, deanak_id)
 
                     if not self.screen_state.password_passed:
                         self.screen_state.increment_count("password")
@@ -79,13 +87,13 @@ class AutoTenMin:
                     if not self.screen_state.team_select_passed and self.screen_state.notice_passed:
                         self.screen_state.increment_count("team_select")
                         
-                    if self.password_handler.handle_password_screen(screen, loaded_templates, password_list, self.screen_state, deanak_id):
+                    if await self.password_handler.handle_password_screen(screen, loaded_templates, password_list, self.screen_state, deanak_id):
                         continue
 
-                    if self.notice_handler.handle_notice_screen(screen, loaded_templates, self.screen_state, deanak_id):
+                    if await self.notice_handler.handle_notice_screen(screen, loaded_templates, self.screen_state, deanak_id):
                         continue
 
-                    if self.ten_min_screen_handler.handle_ten_min_screen(screen, loaded_templates, self.screen_state, deanak_id):
+                    if await self.ten_min_screen_handler.handle_ten_min_screen(screen, loaded_templates, self.screen_state, deanak_id):
                         continue
                         
                     if self.screen_state.team_select_passed:
@@ -127,10 +135,11 @@ class AutoTenMin:
             timer_delta = dt.timedelta(seconds=self.state.SERVICE_TIMER)
             end_time = current_time + timer_delta
             while (end_time - dt.datetime.now()).total_seconds() > 0:
-                screen = self.capture.screen_capture()
+                screen = await self.capture.screen_capture_async()
                 await asyncio.sleep(30)
                 print("중복 접속 체크")
-                self.duplicate_login_handler.check_duplicate_login(screen, loaded_templates, deanak_id)
+                self.image_matcher.begin_frame(screen)
+                await self.duplicate_login_handler.check_duplicate_login(screen, loaded_templates, deanak_id)
 
             return True
 
@@ -100,6 +100,7 @@ class DoService:
                 # 통과로 state업데이트
                 if is_state_check == 1:
                     print("OTP 통과, 게임 실행")
+                    self.otp_service.confirm_otp(already_send_otp)
                     async with get_db_context() as db:
                         await self.deanak_dao.update_otp_pass(db, deanak_id, 1)
 
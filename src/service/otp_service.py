@@ -1,42 +1,68 @@
 import os
 import asyncio
+from typing import TYPE_CHECKING
 from src.utils.image_matcher import ImageMatcher
-from src.utils.capture import CaptureUtil
-from src.utils.input_controller import InputController
+from src.utils.frame_source import FrameSource
 from src.service.template_service import TemplateService
+from src.utils.digit_recognizer import DigitRecognizer
 from src.utils.error_handler import OTPOverTimeDetectError, NoDetectionError, TemplateEmptyError
 
+if TYPE_CHECKING:
+    from src.utils.input_controller import InputController
+
 class OTPService:
-    def __init__(self, image_matcher: ImageMatcher, capture: CaptureUtil, input: InputController, template_service: TemplateService):
+    def __init__(self, image_matcher: ImageMatcher, capture: FrameSource, input: "InputController", template_service: TemplateService):
         self.image_matcher = image_matcher
         self.capture = capture
         self.input = input
         self.template_service = template_service
-    
+        self.digit_recognizer = DigitRecognizer()  # OTP 숫자 인식기 (확인된 OTP로 학습, 신뢰도가 낮으면 OCR 사용)
+        self._otp_region = None  # 마지막으로 찾은 OTP 프레임 주변 캡처 영역 (x1, y1, x2, y2)
+        self.OTP_REGION_MARGIN = 40
+
+    async def _detect_otp_frame(self, templates, capture_error_message):
+        """OTP 프레임 탐지
+
+        이전에 찾은 OTP 프레임 주변 영역만 먼저 캡처하여 탐지하고,
+        찾지 못하면 전체 화면을 캡처하여 다시 탐지합니다.
+
+        Returns:
+            tuple: (screen, roi) - roi는 screen 기준 OTP 프레임 영역 (찾지 못하면 None)
+        """
+        regions = [self._otp_region, None] if self._otp_region is not None else [None]
+        screen = None
+        for region in regions:
+            screen = await self.capture.screen_capture_async(region=region, reuse_buffer=True)
+            if screen is None:
+                raise NoDetectionError(capture_error_message)
+
+            top_left, bottom_right, _ = await self.image_matcher.detect_template_async(screen, templates["otp_frame"], threshold=0.6, template_key="otp_frame")
+            if top_left and bottom_right:
+                if region is None:
+                    margin = self.OTP_REGION_MARGIN
+                    self._otp_region = (top_left[0] - margin, top_left[1] - margin, bottom_right[0] + margin, bottom_right[1] + margin)
+                return screen, (top_left[0], top_left[1], bottom_right[0], bottom_right[1])
+
+        self._otp_region = None
+        return screen, None
+
     async def _extract_otp(self, templates, max_attempts=10):
         """화면에서 OTP 추출"""
         attempt = 0
         while attempt < max_attempts:
-            screen = self.capture.screen_capture()
-            if screen is None:
-                raise NoDetectionError("otp 화면 캡처 중 화면 캡처 실패")
-            
             attempt += 1
             print(f"OTP 인식 시도 {attempt}/{max_attempts}...")
             
-            top_left, bottom_right, _ = self.image_matcher.detect_template(screen, templates["otp_frame"], threshold=0.6)
-            if not top_left or not bottom_right:
+            screen, roi = await self._detect_otp_frame(templates, "otp 화면 캡처 중 화면 캡처 실패")
+            if roi is None:
                 if attempt == max_attempts:
                     raise OTPOverTimeDetectError("OTP 감지 횟수 초과 - OTP FRAME")
                 print("OTP 영역 찾기 실패. 재시도 중...")
                 await asyncio.sleep(3)
                 continue
-            
-            # ROI 적용
-            roi = (top_left[0], top_left[1], bottom_right[0], bottom_right[1])
 
             # OTP 텍스트 추출
-            otp_text = await self.image_matcher.extract_text(screen, templates["otp_number"], threshold=0.6, roi=roi)
+            otp_text = await self.image_matcher.extract_text(screen, templates["otp_number"], threshold=0.6, roi=roi, digit_recognizer=self.digit_recognizer)
             if not otp_text:
                 if attempt == max_attempts:
                     raise OTPOverTimeDetectError("OTP 감지 횟수 초과 - OTP TEXT")
@@ -52,18 +78,11 @@ class OTPService:
     async def _wrong_otp_detect(self, templates):
         """틀린 OTP 감지"""
         try:
-            screen = self.capture.screen_capture()
-            if screen is None:
-                raise NoDetectionError("실패 otp 화면 캡처 중 캡처 실패")
-
-            top_left, bottom_right, _ = self.image_matcher.detect_template(screen, templates["otp_frame"], threshold=0.6)
+            screen, roi = await self._detect_otp_frame(templates, "실패 otp 화면 캡처 중 캡처 실패")
 
-            if not top_left or not bottom_right:
+            if roi is None:
                 print("OTP 영역 사라짐")
                 return 1
-            
-            # ROI 적용
-            roi = (top_left[0], top_left[1], bottom_right[0], bottom_right[1])
 
             # OTP 텍스트 추출
             otp_wrong = await self.image_matcher.extract_text(screen, templates["otp_wrong"], threshold=0.6, roi=roi)
@@ -85,12 +104,18 @@ class OTPService:
             await asyncio.sleep(1)  # UI가 완전히 로드될 때까지 대기
 
             templates = self.template_service.load_templates(["otp_frame", "otp_wrong"])
+            await self.image_matcher.ocr.wait_ready()  # OCR 모델 워밍업 완료 대기
             return await self._wrong_otp_detect(templates)
 
         except (TemplateEmptyError, NoDetectionError):
             raise
 
 
+    def confirm_otp(self, otp_text):
+        """OTP 통과가 확인되면 OCR로 읽은 숫자를 숫자 인식기 견본으로 학습"""
+        if self.digit_recognizer.confirm(otp_text):
+            print(f"확인된 OTP로 숫자 견본 학습: {otp_text}")
+
     async def capture_and_extract_otp(self):
         """화면 캡처 후 OTP 추출"""
         try:
@@ -1,92 +1,327 @@
 import os
+import time
+import queue
+import asyncio
+import threading
+import aiohttp
 import cv2
 from dotenv import load_dotenv
 import requests
 import numpy as np
 from src.utils.image_matcher import ImageMatcher
 from src.utils.error_handler import TemplateEmptyError
+from src.utils.template_disk_cache import TemplateDiskCache
+from src.utils.template_bundle import TemplateBundle
+from src.utils.template_store import TemplateStore
+from src.utils.template_manifest import TemplateManifestWatcher
 
 class TemplateService:
+    TEMPLATES = {
+        # OTP 관련 템플릿
+        "otp_frame": '/otpFrame.PNG',
+        "otp_number": '/otpNumber.png',
+        "otp_wrong": '/otpWrong.PNG',
+        # 10분접속 관련 템플릿
+        "password_screen": '/passwordScreen.png',
+        "password_confirm": '/loginConfirm.png',
+        "wrong_password": '/wrongPassword.png',
+        "team_select_screen": '/selectTeam.png',
+        "team_select_text": '/selectTeamText.png',
+        # 게임종료 템플릿
+        "exit_team": '/selectTeamIcon.png',
+        "exit_team_btn": '/exitTeamBtn.png',
+        "exit_modal": '/exitModalScreen.png',
+        "exit_modal_btn": '/exitModalBtn.png',
+        # 중복 로그인 에러
+        "same_login_in_anykey_error": '/atThatSameTimeInAnyKeyAndBeforeAccountExpire.png',
+        "someone_already_login_error": '/duplicateConnection.png',
+        "some_one_connecting_try_error": '/someOneConnect.png',
+        "same_login_in_password_error": '/whenThroughPasswordButSomeOneInPassword.png',
+        "some_one_otp_pass_error": '/whenFinishOTPpassButSomeOnePassOTPEither.png'
+    }
+
     def __init__(self, image_matcher: ImageMatcher):
         self.image_matcher = image_matcher
         load_dotenv()
         self.base_url = os.getenv("IMG_URL");
         self.base_url = self.base_url.rstrip('/')
-        self.TEMPLATES = {
-            # OTP 관련 템플릿
-            "otp_frame": '/otpFrame.PNG',
-            "otp_number": '/otpNumber.png',
-            "otp_wrong": '/otpWrong.PNG',
-            # 10분접속 관련 템플릿
-            "password_screen": '/passwordScreen.png',
-            "password_confirm": '/loginConfirm.png',
-            "wrong_password": '/wrongPassword.png',
-            "team_select_screen": '/selectTeam.png',
-            "team_select_text": '/selectTeamText.png',
-            # 게임종료 템플릿
-            "exit_team": '/selectTeamIcon.png',
-            "exit_team_btn": '/exitTeamBtn.png',
-            "exit_modal": '/exitModalScreen.png',
-            "exit_modal_btn": '/exitModalBtn.png',
-            # 중복 로그인 에러
-            "same_login_in_anykey_error": '/atThatSameTimeInAnyKeyAndBeforeAccountExpire.png',
-            "someone_already_login_error": '/duplicateConnection.png',
-            "some_one_connecting_try_error": '/someOneConnect.png',
-            "same_login_in_password_error": '/whenThroughPasswordButSomeOneInPassword.png',
-            "some_one_otp_pass_error": '/whenFinishOTPpassButSomeOnePassOTPEither.png'
-        }
-        self._template_cache = {}
+        # 내용 해시 단위 템플릿 저장소 - TEMPLATES는 고정, 비밀번호 숫자 등 추가 템플릿은 LRU로 보관
+        self.store = TemplateStore(max_extras=int(os.getenv("TEMPLATE_LRU_SIZE", "32")),
+                                   on_evict=self._release_template)
+        self._core_paths = set(self.TEMPLATES.values())
+        self.disk_cache = TemplateDiskCache()  # 재시작 후에도 유지되는 URL 단위 디스크 캐시
+        # build_template_bundle.py로 만든 번들이 있으면, 디스크 캐시에 마지막으로 확인된 서버 파일과 같은 항목은
+        # 요청 없이 메모리 매핑으로 로드하고, 서버 파일이 바뀌었는지는 백그라운드에서 다시 확인
+        self.bundle = TemplateBundle.open(os.getenv("TEMPLATE_BUNDLE", "templates.bundle"))
+        self._revalidate_queue = queue.Queue()
+        self._revalidated = set()  # 재검증을 요청한 번들 템플릿 경로
+        self._revalidate_thread = None
+
+        # 템플릿 매니페스트 - 설정되어 있으면 TEMPLATES 대신 사용하고, 버전이 올라가면 실행 중에 교체
+        self.manifest = None
+        self._swap_lock = threading.RLock()
+        manifest_path = os.getenv("TEMPLATE_MANIFEST")
+        self.manifest_watcher = None
+        if manifest_path:
+            self.manifest_watcher = TemplateManifestWatcher(manifest_path, self.apply_manifest,
+                                                            interval=float(os.getenv("TEMPLATE_MANIFEST_INTERVAL", "10")),
+                                                            required_keys=TemplateService.TEMPLATES)
+            self.manifest_watcher.check()
 
     def _load_template(self, template_path: str):
         """서버에서 템플릿 이미지를 로드하고 캐싱"""
         try:
             # 캐시 확인
-            if template_path in self._template_cache:
-                return self._template_cache[template_path]
+            template = self.store.get(template_path)
+            if template is not None:
+                return template
+
+            # 매니페스트 옆 로컬 미러에 있는 템플릿은 파일에서 로드
+            template = self._load_from_manifest(template_path)
+            if template is not None:
+                return template
+
+            # 번들 항목이 마지막으로 확인된 서버 파일과 같으면 요청 없이 메모리 매핑된 배열 사용
+            template = self._load_bundled(template_path)
+            if template is not None:
+                return template
 
-            # 서버에서 이미지 다운로드
+            # 서버에서 이미지 다운로드 (디스크 캐시로 재검증, 서버에 연결할 수 없으면 캐시 사용)
             url = f"{self.base_url}{template_path}"
             try:
-                response = requests.get(url)
-                response.raise_for_status()
-            except requests.RequestException as e:
-                print(f"첫 번째 시도 실패 ({url}): {str(e)}")
-                # 첫 번째 시도 실패시 다른 확장자로 시도
-                base_path = template_path[:-4]  # 확장자 제거
-                if template_path.lower().endswith('.png'):
-                    alt_path = base_path + '.PNG'
-                else:
-                    alt_path = base_path + '.png'
-                
-                url = f"{self.base_url}{alt_path}"
-                print(f"두 번째 시도 ({url})")
-                response = requests.get(url)
-                response.raise_for_status()
+                try:
+                    content = self.disk_cache.fetch(url)
+                except requests.RequestException as e:
+                    print(f"첫 번째 시도 실패 ({url}): {str(e)}")
+                    # 첫 번째 시도 실패시 다른 확장자로 시도
+                    base_path = template_path[:-4]  # 확장자 제거
+                    if template_path.lower().endswith('.png'):
+                        alt_path = base_path + '.PNG'
+                    else:
+                        alt_path = base_path + '.png'
 
-            # 이미지 데이터를 numpy array로 변환
-            image_array = np.asarray(bytearray(response.content), dtype=np.uint8)
-            template = cv2.imdecode(image_array, cv2.IMREAD_GRAYSCALE)
+                    url = f"{self.base_url}{alt_path}"
+                    print(f"두 번째 시도 ({url})")
+                    content = self.disk_cache.fetch(url)
+            except requests.RequestException:
+                # 서버와 디스크 캐시 모두에서 받을 수 없으면 번들로 대체
+                template = self._load_from_bundle(template_path)
+                if template is not None:
+                    print(f"템플릿을 받을 수 없어 번들에 포함된 파일 사용: {template_path}")
+                    return template
+                raise
 
-            if template is None:
-                raise TemplateEmptyError(f"템플릿 이미지를 디코딩할 수 없습니다: {url}")
+            # 번들 항목이 받은 파일과 같으면 디코딩 없이 메모리 매핑된 배열 사용
+            template = self._load_from_bundle(template_path, content)
+            if template is not None:
+                return template
 
-            # 캐시에 저장
-            self._template_cache[template_path] = template
-            return template
+            return self._decode_and_cache(template_path, content, url)
 
         except requests.RequestException as e:
             raise TemplateEmptyError(f"템플릿 다운로드 실패 (파일이 서버에 없을 수 있음): {str(e)}")
         except Exception as e:
             raise TemplateEmptyError(f"템플릿 로드 중 오류 발생: {str(e)}")
 
+    def _load_from_manifest(self, template_path: str):
+        """매니페스트 옆 로컬 파일에서 템플릿 로드 (매니페스트가 없거나 파일이 없으면 None)"""
+        manifest = self.manifest
+        if manifest is None or manifest.local_file(template_path) is None:
+            return None
+        return self._cache_template(template_path, self._fetch_fresh(manifest, template_path))
+
+    def _load_from_bundle(self, template_path: str, content: bytes = None):
+        """번들에서 템플릿과 미리 계산된 스케일별 이미지를 로드
+
+        Args:
+            template_path: 템플릿 경로
+            content: 서버(디스크 캐시)에서 받은 원본 파일 내용 - 번들 항목의 해시와 다르면 번들을 사용하지 않음
+                     (None이면 비교 없이 사용 - 서버와 캐시 모두 사용할 수 없는 경우)
+
+        Returns:
+            ndarray: 템플릿 (번들에 없거나 원본 파일이 바뀌었으면 None)
+        """
+        if self.bundle is None or template_path not in self.bundle:
+            return None
+        if content is not None and not self.bundle.matches(template_path, content):
+            return None
+
+        return self._cache_template(template_path, self.bundle.get(template_path), self.bundle.levels(template_path))
+
+    def _load_bundled(self, template_path: str):
+        """네트워크 요청 없이 번들에서 템플릿 로드
+
+        번들 항목을 받은 서버 경로(확장자 포함)의 디스크 캐시 내용과 해시를 비교하여, 서버 파일이 바뀐 것으로
+        확인된 경우에만 None을 반환합니다. 캐시가 없으면 번들을 그대로 사용하고, 서버 파일이 바뀌었는지는
+        백그라운드에서 다시 확인합니다.
+
+        Returns:
+            ndarray: 템플릿 (번들에 없거나 디스크 캐시의 서버 파일과 다르면 None)
+        """
+        if self.bundle is None or template_path not in self.bundle:
+            return None
+        url = f"{self.base_url}{self.bundle.source(template_path)}"
+        cached = self.disk_cache.cached(url)
+        if cached is not None and not self.bundle.matches(template_path, cached):
+            return None
+        template = self._load_from_bundle(template_path)
+        self._schedule_revalidate(template_path, url)
+        return template
+
+    def _schedule_revalidate(self, template_path: str, url: str):
+        """번들에서 로드한 템플릿의 서버 파일 재검증을 백그라운드 스레드에 요청 (경로마다 한 번)"""
+        with self._swap_lock:
+            if template_path in self._revalidated:
+                return
+            self._revalidated.add(template_path)
+            if self._revalidate_thread is None or not self._revalidate_thread.is_alive():
+                self._revalidate_thread = threading.Thread(target=self._revalidate_worker, name="template-revalidate", daemon=True)
+                self._revalidate_thread.start()
+        self._revalidate_queue.put((template_path, url))
+
+    def _revalidate_worker(self):
+        while True:
+            template_path, url = self._revalidate_queue.get()
+            try:
+                self._revalidate_bundled(template_path, url)
+            except Exception as e:
+                print(f"번들 템플릿 재검증 중 오류 발생 ({template_path}): {e}")
+            finally:
+                self._revalidate_queue.task_done()
+
+    def _revalidate_bundled(self, template_path: str, url: str):
+        """서버 파일을 디스크 캐시로 재검증하고, 번들 항목과 다르면 저장소의 템플릿을 교체"""
+        try:
+            content = self.disk_cache.fetch(url)
+        except requests.RequestException as e:
+            print(f"번들 템플릿 재검증 실패 ({url}): {e}")
+            return
+        if self.bundle.matches(template_path, content):
+            return
+
+        print(f"번들 템플릿이 서버 파일과 달라 교체합니다: {template_path}")
+        with self._swap_lock:
+            self._decode_and_cache(template_path, content, url)
+            # 교체되어 더 이상 어떤 경로도 가리키지 않는 번들 배열 정리
+            self.store.retain(self._core_paths)
+
+    def _cache_template(self, template_path: str, template, levels=None):
+        """템플릿을 저장소에 넣고, 새로 저장된 내용이면 스케일별 이미지를 준비
+
+        Args:
+            template_path: 템플릿 경로
+            template: 흑백 템플릿 이미지
+            levels: 미리 계산된 스케일별 이미지 (번들에서 로드한 경우)
+
+        Returns:
+            ndarray: 저장소가 보관하는 템플릿 (같은 내용이 이미 있으면 기존 배열)
+        """
+        stored = self.store.put(template_path, template, pinned=template_path in self._core_paths)
+        if stored is template:
+            if levels is not None:
+                self.image_matcher.pyramid.register(template, levels)
+            else:
+                self.image_matcher.pyramid.build(template)
+            if self.image_matcher.process_engine is not None:
+                self.image_matcher.process_engine.preload(template)
+        return stored
+
+    def _release_template(self, template):
+        """저장소에서 제거된 템플릿의 스케일별 이미지와 작업 프로세스용 공유 메모리 해제"""
+        self.image_matcher.pyramid.invalidate(template)
+        if self.image_matcher.process_engine is not None:
+            self.image_matcher.process_engine.release(template)
+
+    def _decode_and_cache(self, template_path: str, content: bytes, url: str):
+        """내려받은 이미지를 흑백 템플릿으로 디코딩하여 캐싱"""
+        # 이미지 데이터를 numpy array로 변환
+        image_array = np.frombuffer(content, dtype=np.uint8)
+        template = cv2.imdecode(image_array, cv2.IMREAD_GRAYSCALE)
+
+        if template is None:
+            raise TemplateEmptyError(f"템플릿 이미지를 디코딩할 수 없습니다: {url}")
+
+        # 저장소에 저장 및 스케일별 템플릿 미리 생성
+        return self._cache_template(template_path, template)
+
+    async def _load_template_async(self, session, template_path: str):
+        """_load_template의 비동기 버전 (공유 aiohttp 세션 사용)"""
+        template = self.store.get(template_path)
+        if template is not None:
+            return template
+
+        template = self._load_from_manifest(template_path)
+        if template is None:
+            template = self._load_bundled(template_path)
+        if template is not None:
+            return template
+
+        url = f"{self.base_url}{template_path}"
+        try:
+            try:
+                content = await self.disk_cache.fetch_async(session, url)
+            except aiohttp.ClientResponseError:
+                # 다른 확장자로 재시도
+                base_path = template_path[:-4]
+                alt_path = base_path + ('.PNG' if template_path.lower().endswith('.png') else '.png')
+                url = f"{self.base_url}{alt_path}"
+                content = await self.disk_cache.fetch_async(session, url)
+        except aiohttp.ClientError:
+            template = self._load_from_bundle(template_path)
+            if template is not None:
+                print(f"템플릿을 받을 수 없어 번들에 포함된 파일 사용: {template_path}")
+                return template
+            raise
+
+        template = self._load_from_bundle(template_path, content)
+        if template is not None:
+            return template
+
+        return self._decode_and_cache(template_path, content, url)
+
+    async def prefetch_templates(self, include_digits: bool = True, concurrency: int = 8):
+        """시작 시 모든 템플릿을 동시에 내려받아 메모리에 올림
+
+        이후 get_templates/load_templates/load_password_templates는 네트워크 없이 캐시만 사용합니다.
+        실패한 템플릿은 건너뛰며, 처음 사용할 때 기존 방식으로 다시 로드됩니다.
+
+        Args:
+            include_digits (bool): 비밀번호/OTP 숫자 템플릿(0~9)도 함께 로드할지 여부
+            concurrency (int): 동시 연결 수
+
+        Returns:
+            int: 로드된 템플릿 수
+        """
+        paths = list(self.TEMPLATES.values())
+        if include_digits:
+            paths += [self._password_path(digit) for digit in range(10)]
+
+        started = time.monotonic()
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            results = await asyncio.gather(
+                *(self._load_template_async(session, path) for path in paths),
+                return_exceptions=True,
+            )
+
+        loaded = 0
+        for path, result in zip(paths, results):
+            if isinstance(result, Exception):
+                print(f"템플릿 미리 로드 실패 ({path}): {result}")
+            else:
+                loaded += 1
+        print(f"템플릿 미리 로드 완료: {loaded}/{len(paths)}개, {time.monotonic() - started:.2f}초")
+        return loaded
+
     # 개발 전용 로컬 템플릿 로드
     def _local_load_template(self, template_path: str):
         """로컬 static/img 폴더에서 템플릿 이미지를 로드하고 캐싱"""
         try:
             print(f"로컬 파일 로드: {template_path}")
             # 캐시 확인
-            if template_path in self._template_cache:
-                return self._template_cache[template_path]
+            template = self.store.get(template_path)
+            if template is not None:
+                return template
 
             # 로컬 파일 경로 구성
             local_path = os.path.join('static', 'img', template_path.lstrip('/'))
@@ -112,9 +347,8 @@ class TemplateService:
             if template is None:
                 raise TemplateEmptyError(f"템플릿 이미지를 로드할 수 없습니다: {local_path}")
 
-            # 캐시에 저장
-            self._template_cache[template_path] = template
-            return template
+            # 저장소에 저장 및 스케일별 템플릿 미리 생성
+            return self._cache_template(template_path, template)
 
         except Exception as e:
             raise TemplateEmptyError(f"템플릿 로드 중 오류 발생: {str(e)}")
@@ -131,32 +365,31 @@ class TemplateService:
         Raises:
             Exception: 템플릿 파일이 없거나 로드 실패시
         """
-        templates = {}
-        for key in template_keys:
-            if key not in self.TEMPLATES:
-                raise TemplateEmptyError(f"존재하지 않는 템플릿 키: {key}")
-                
-            path = self.TEMPLATES[key]
-            template = self._load_template(path)
-            # template = self._local_load_template(path)
-            if template is None:
-                raise TemplateEmptyError(f"템플릿 로드 실패: {path}")
+        with self._swap_lock:  # 매니페스트 교체 중에는 교체가 끝난 뒤 조회
+            templates = {}
+            for key in template_keys:
+                path = self._resolve_path(key)
+                template = self._load_template(path)
+                # template = self._local_load_template(path)
+                if template is None:
+                    raise TemplateEmptyError(f"템플릿 로드 실패: {path}")
                 
-            templates[key] = template
+                templates[key] = template
             
-        return templates
+            return templates
 
     def load_password_templates(self, password_list: list):
         """비밀번호 템플릿 로드"""
-        templates = {}
-        for password in password_list:
-            path = f'/{password}.png'
-            template = self._load_template(path)
-            # template = self._local_load_template(path)
-            if template is None:
-                raise TemplateEmptyError(f"비밀번호 템플릿 로드 실패: {path}")
-            templates[password] = template
-        return templates
+        with self._swap_lock:  # 매니페스트 교체 중에는 교체가 끝난 뒤 조회
+            templates = {}
+            for password in password_list:
+                path = self._password_path(password)
+                template = self._load_template(path)
+                # template = self._local_load_template(path)
+                if template is None:
+                    raise TemplateEmptyError(f"비밀번호 템플릿 로드 실패: {path}")
+                templates[password] = template
+            return templates
 
     def get_templates(self, password_list: list = None):
         """모든 템플릿 이미지를 로드하고 반환합니다.
@@ -170,45 +403,109 @@ class TemplateService:
         Raises:
             TemplateEmptyError: 템플릿 파일이 없거나 로드 실패시
         """
-        try:
-            templates = {}
+        with self._swap_lock:  # 매니페스트 교체 중에는 교체가 끝난 뒤 조회
+            try:
+                templates = {}
             
-            # 기본 템플릿 로드
-            for key in self.TEMPLATES.keys():
-                path = self.TEMPLATES[key]
-                
-                # 캐시된 템플릿이 있으면 사용
-                if key in self._template_cache:
-                    templates[key] = self._template_cache[key]
-                    continue
+                # 기본 템플릿 로드 (키는 항상 경로로 변환하여 경로 기준 저장소에서 조회)
+                for key in self.TEMPLATES.keys():
+                    path = self._resolve_path(key)
+                    template = self._load_template(path)
+                    # template = self._local_load_template(path)
+                    if template is None:
+                        raise TemplateEmptyError(f"템플릿 로드에 실패했습니다: {path}")
                 
-                # 템플릿 파일 존재 확인
-                # 서버에서 이미지를 다운로드 받기 때문에 파일 존재 확인 불필요
-                
-                # 템플릿 로드
-                template = self._load_template(path)
-                # template = self._local_load_template(path)
-                if template is None:
-                    raise TemplateEmptyError(f"템플릿 로드에 실패했습니다: {path}")
-                
-                templates[key] = template
-                self._template_cache[key] = template  # 캐시에 저장
+                    templates[key] = template
             
-            # 비밀번호 템플릿 로드
-            if password_list:
-                password_templates = self.load_password_templates(password_list)
-                templates["password_templates"] = password_templates
+                # 비밀번호 템플릿 로드
+                if password_list:
+                    password_templates = self.load_password_templates(password_list)
+                    templates["password_templates"] = password_templates
                 
-            if not templates:
-                raise TemplateEmptyError("로드된 템플릿이 없습니다.")
+                if not templates:
+                    raise TemplateEmptyError("로드된 템플릿이 없습니다.")
                 
-            return templates
+                return templates
             
-        except Exception as e:
-            if isinstance(e, TemplateEmptyError):
-                raise
-            raise TemplateEmptyError(f"템플릿 로드 중 오류 발생: {str(e)}")
+            except Exception as e:
+                if isinstance(e, TemplateEmptyError):
+                    raise
+                raise TemplateEmptyError(f"템플릿 로드 중 오류 발생: {str(e)}")
+
+    def _fetch_fresh(self, manifest, template_path: str):
+        """저장소와 번들을 거치지 않고 템플릿을 새로 로드 (매니페스트 옆 로컬 파일 우선, 없으면 서버)"""
+        local_path = manifest.local_file(template_path)
+        if local_path:
+            template = cv2.imread(local_path, cv2.IMREAD_GRAYSCALE)
+            if template is None:
+                raise TemplateEmptyError(f"템플릿 이미지를 로드할 수 없습니다: {local_path}")
+            return template
+
+        url = f"{self.base_url}{template_path}"
+        return cv2.imdecode(np.frombuffer(self.disk_cache.fetch(url), dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+
+    def apply_manifest(self, manifest):
+        """새 매니페스트 적용
+
+        바뀐 템플릿을 먼저 모두 로드하고 스케일별 이미지까지 만든 뒤, 키-경로 목록과 함께 한 번에 교체합니다.
+        교체 전까지는 이전 템플릿으로 탐지가 계속되며, 이미 템플릿을 받아 간 세션은 받은 템플릿을 그대로 사용합니다.
+        처음 적용할 때 아직 로드되지 않은 템플릿은 처음 사용할 때 로드됩니다.
+
+        Args:
+            manifest: TemplateManifest
+
+        Raises:
+            TemplateEmptyError: 기본 TEMPLATES의 키가 매니페스트에 빠진 경우 (기존 템플릿을 그대로 사용)
+        """
+        missing = manifest.missing_keys(TemplateService.TEMPLATES)
+        if missing:
+            print(f"템플릿 매니페스트 버전 {manifest.version}에 필수 키가 없어 적용하지 않습니다: {missing}")
+            raise TemplateEmptyError(f"템플릿 매니페스트에 필수 키가 없습니다: {missing}")
+
+        fresh = {}
+        for key in manifest.changed_keys(self.manifest):
+            path = manifest.entries[key]["path"]
+            if self.manifest is None and path not in self.store:
+                continue
+            template = self._fetch_fresh(manifest, path)
+            if template is None:
+                raise TemplateEmptyError(f"템플릿 이미지를 디코딩할 수 없습니다: {path}")
+            self.image_matcher.pyramid.build(template)
+            fresh[path] = template
+
+        with self._swap_lock:
+            self._core_paths = set(manifest.paths.values())
+            for path, template in fresh.items():
+                if self._cache_template(path, template) is not template:
+                    # 같은 내용이 이미 있으면 미리 만든 스케일별 이미지는 사용하지 않음
+                    self.image_matcher.pyramid.invalidate(template)
+            self.TEMPLATES = manifest.paths
+            self.manifest = manifest
+            removed = self.store.retain(self._core_paths)
+
+        print(f"템플릿 매니페스트 버전 {manifest.version} 적용: 교체 {len(fresh)}개, 정리 {removed}개")
+
+    def start_manifest_watch(self):
+        """매니페스트 감시 스레드 시작 (TEMPLATE_MANIFEST가 설정된 경우)"""
+        if self.manifest_watcher is not None:
+            self.manifest_watcher.start()
+
+    def _resolve_path(self, key: str):
+        """템플릿 키를 템플릿 경로로 변환"""
+        if key not in self.TEMPLATES:
+            raise TemplateEmptyError(f"존재하지 않는 템플릿 키: {key}")
+        return self.TEMPLATES[key]
+
+    @staticmethod
+    def _password_path(password):
+        """비밀번호 숫자 템플릿 경로"""
+        return f'/{password}.png'
+
+    def cache_stats(self):
+        """템플릿 저장소 통계 (조회 적중/실패, 보관 바이트 수 등)"""
+        return self.store.stats()
 
     def clear_cache(self):
         """템플릿 캐시 초기화"""
-        self._template_cache.clear()
+        self.store.clear()
+        self.image_matcher.pyramid.clear()
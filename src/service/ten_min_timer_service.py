@@ -7,15 +7,19 @@ from src.detection.exit_game_handler import ExitGameHandler
 from src.service.template_service import TemplateService
 from src.utils import api
 from src.utils.image_matcher import ImageMatcher
-from src.utils.capture import CaptureUtil
+from src.utils.frame_source import FrameSource
 from src.utils.error_handler import ErrorHandler, CheckTimerError, CantFindTenMinDataError
 from src.dao.auto_ten_min_dao import AutoTenMinDao
 from src.dao.remote_pcs_dao import RemoteDao
 from src.utils.remote_controller import RemoteController
-from src.utils.input_controller import InputController
 from src import state
 from src.models.service_state import ServiceState
 from src.utils.api import Api
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.utils.input_controller import InputController
+
 
 class TenMinTimerService:
     """10분 접속 타이머 관리 서비스
@@ -31,7 +35,7 @@ class TenMinTimerService:
     """
     def __init__(self, remote: RemoteController, error_handler: ErrorHandler, 
                  remote_pcs_dao: RemoteDao, auto_ten_min_dao: AutoTenMinDao, deanak_dao: DeanakDao,
-                 input_controller: InputController, state: state, api: Api, image_matcher: ImageMatcher, capture: CaptureUtil,
+                 input_controller: "InputController", state: state, api: Api, image_matcher: ImageMatcher, capture: FrameSource,
                  template_service: TemplateService):
         self.remote = remote
         self.error_handler = error_handler
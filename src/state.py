@@ -44,6 +44,7 @@ class unique_id:
 
 # 태스크 관리를 위한 전역 변수
 monitoring_task = None
+binlog_reader = None  # binlog 리더 (큐 깊이/지연 시간 지표 확인용)
 service_running_task = None
 waiting_process_task = None
 is_running = True  # Task 실행 상태를 제어하기 위한 플래그
@@ -1,17 +1,70 @@
+import asyncio
 import pyautogui
 from PIL import Image
 import os
+import time
 import cv2
 import numpy as np
+from src.utils.frame_source import FrameSource
 
-class CaptureUtil:
-    def screen_capture(self, region=None):
-        """화면을 캡처하여 흑백 이미지로 반환합니다."""
+class CaptureUtil(FrameSource):
+    """실시간 화면 캡처 프레임 소스"""
+
+    def __init__(self):
+        super().__init__()
+        self._gray_buffers = {}  # (height, width) -> 재사용하는 흑백 변환 버퍼
+
+    def _gray_buffer(self, shape):
+        """해당 크기의 흑백 변환 버퍼 반환 (없으면 할당)"""
+        buffer = self._gray_buffers.get(shape)
+        if buffer is None:
+            buffer = np.empty(shape, dtype=np.uint8)
+            self._gray_buffers[shape] = buffer
+        return buffer
+
+    def _clip_region(self, region):
+        """캡처 영역 (x1, y1, x2, y2)을 화면 범위로 제한"""
+        screen_width, screen_height = pyautogui.size()
+        x1, y1, x2, y2 = (int(v) for v in region)
+        x1, y1 = max(0, x1), max(0, y1)
+        x2, y2 = min(screen_width, x2), min(screen_height, y2)
+        if x2 <= x1 or y2 <= y1:
+            raise ValueError(f"잘못된 캡처 영역: {region}")
+        return x1, y1, x2, y2
+
+    def screen_capture(self, region=None, reuse_buffer=False):
+        """화면을 캡처하여 흑백 이미지로 반환합니다.
+
+        Args:
+            region: 캡처할 영역 (x1, y1, x2, y2) - None이면 전체 화면
+            reuse_buffer: True이면 미리 할당한 버퍼에 흑백 이미지를 기록하여 반환
+                          (같은 크기로 다시 캡처하면 덮어써지므로 바로 사용하고 버리는 경우에만 사용)
+        """
         try:
-            screenshot = pyautogui.screenshot()
-            frame = np.array(screenshot)
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)  # PIL -> OpenCV 색상 공간 변환
-            return frame
+            if region is not None:
+                x1, y1, x2, y2 = self._clip_region(region)
+                screenshot = pyautogui.screenshot(region=(x1, y1, x2 - x1, y2 - y1))
+            else:
+                screenshot = pyautogui.screenshot()
+            self.last_timestamp = time.time()
+            frame = np.asarray(screenshot)  # np.array와 달리 추가 복사 없이 변환
+
+            if reuse_buffer:
+                gray = self._gray_buffer(frame.shape[:2])
+                cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray)  # PIL -> OpenCV 색상 공간 변환
+                return gray
+
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)  # PIL -> OpenCV 색상 공간 변환
         except Exception as e:
             print(f"화면 캡처 중 오류 발생: {e}")
             return None
+
+    async def screen_capture_async(self, region=None, reuse_buffer=False):
+        """screen_capture를 executor에서 실행하여 캡처하는 동안 이벤트 루프를 막지 않음"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: self.screen_capture(region=region, reuse_buffer=reuse_buffer))
+
+    def read_frame(self):
+        """전체 화면을 캡처하여 (timestamp, frame) 반환"""
+        frame = self.screen_capture()
+        return self.last_timestamp, frame
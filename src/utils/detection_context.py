@@ -0,0 +1,56 @@
+class DetectionContext:
+    """캡처한 프레임 하나에 대한 탐지 결과 캐시
+
+    같은 프레임에서 여러 핸들러가 같은 템플릿을 탐지하더라도
+    (템플릿 키, ROI, 임계값)이 같으면 한 번만 매칭하도록 결과를 보관합니다.
+    이전 프레임과 화면이 같으면 이전 프레임의 결과도 함께 이어받습니다.
+    """
+
+    def __init__(self, screen, changed=True, previous=None):
+        """
+        Args:
+            screen: 캡처한 화면 이미지
+            changed: 이전에 분석한 프레임에서 화면이 바뀌었는지 여부
+            previous: 화면이 바뀌지 않은 경우 이어받을 이전 프레임의 컨텍스트
+        """
+        self.screen = screen
+        self.changed = changed
+        self._results = {}
+        self._inherited = {}
+        if not changed and previous is not None:
+            self._inherited.update(previous._inherited)
+            self._inherited.update(previous._results)
+        self.hits = 0
+        self.reused = 0
+
+    @staticmethod
+    def make_key(template, template_key=None, index=0, threshold=0.8, roi=None, coarse=False):
+        """결과 캐시 키 생성 - 템플릿 키가 없으면 템플릿 객체 id 사용"""
+        name = (template_key, index) if template_key is not None else id(template)
+        return (name, threshold, tuple(roi) if roi is not None else None, coarse)
+
+    def get(self, key, template):
+        """캐시된 탐지 결과 조회
+
+        Returns:
+            tuple: (cached, found) - cached가 False이면 매칭이 필요함
+        """
+        entry = self._results.get(key)
+        if entry is not None and entry[0] is template:
+            self.hits += 1
+            return True, entry[1]
+
+        entry = self._inherited.get(key)
+        if entry is not None and entry[0] is template:
+            self.reused += 1
+            self._results[key] = entry
+            return True, entry[1]
+
+        return False, None
+
+    def put(self, key, template, found):
+        """탐지 결과 저장 (템플릿 참조를 함께 보관하여 다른 템플릿과 혼동하지 않음)"""
+        self._results[key] = (template, found)
+
+    def __len__(self):
+        return len(self._results)
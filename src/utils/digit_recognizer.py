@@ -0,0 +1,256 @@
+import os
+import threading
+import cv2
+import numpy as np
+from src.utils.template_stats import StatsMatrix
+
+
+class DigitRecognizer:
+    """고정 폰트 숫자열(OTP 번호)을 글자 단위 템플릿 매칭으로 인식하는 클래스
+
+    숫자 영역을 이진화하여 글자별로 분리한 뒤, 크기를 정규화한 숫자 견본과
+    정규화 상관계수로 비교하여 가장 가까운 숫자로 분류합니다.
+    견본은 OCR로 읽은 뒤 통과가 확인된 OTP(confirm)에서만 학습하며, 0~9 모든 숫자의 견본이 모이기 전에는
+    인식하지 않습니다. 글자 수가 OTP 길이와 다르거나, 가장 비슷한 숫자와 그다음 숫자의 점수 차이가
+    min_margin보다 작으면 인식 결과를 사용하지 않습니다 (OCR로 대체).
+    """
+    DIGITS = "0123456789"
+    LENGTH_KEY = "__length__"  # 견본 파일에 함께 저장하는 OTP 길이
+
+    def __init__(self, glyph_size=(20, 28), min_confidence=0.9, min_margin=0.1, max_samples_per_digit=5, file_path="otp_glyphs.npz"):
+        """
+        Args:
+            glyph_size: 정규화된 글자 크기 (width, height)
+            min_confidence: 이 값 미만이면 인식 결과를 신뢰하지 않음 (OCR로 대체)
+            min_margin: 가장 비슷한 숫자와 그다음 숫자의 최소 점수 차이 (작으면 OCR로 대체)
+            max_samples_per_digit: OCR 결과로 학습하는 숫자별 최대 견본 수
+            file_path: 학습한 견본을 저장할 파일 경로 (None이면 저장하지 않음)
+
+        OTP 길이는 OTP_LENGTH 환경 변수로 지정하고, 없으면 통과가 확인된 OTP의 길이를 사용합니다.
+        길이를 알 수 없는 동안에는 인식 결과를 사용하지 않고 OCR로 인식합니다.
+        """
+        self.file_path = file_path
+        self.glyph_size = glyph_size
+        self.min_confidence = min_confidence
+        self.min_margin = min_margin
+        self.max_samples_per_digit = max_samples_per_digit
+        self._samples = {}  # digit -> [정규화된 글자 이미지, ...]
+        self._matrix = StatsMatrix([], [])  # 모든 견본의 미리 계산된 통계 (한 번의 행렬 곱으로 비교)
+        self._lock = threading.Lock()
+        self.stats = {"recognized": 0, "low_confidence": 0, "ambiguous": 0, "length_mismatch": 0,
+                      "incomplete_samples": 0, "learned": 0}
+        self._learned = {}  # digit -> [OCR로 학습한 견본, ...] (파일에 저장되는 견본)
+        self._pending = None  # (숫자 영역 이미지, OCR 결과) - 통과가 확인되면 학습
+        otp_length = os.getenv("OTP_LENGTH")
+        self._fixed_length = bool(otp_length)
+        self.otp_length = int(otp_length) if otp_length else None
+        self._load()
+
+    @property
+    def has_samples(self):
+        """0~9 모든 숫자의 확인된 견본이 있는지 여부"""
+        return all(self._samples.get(digit) for digit in self.DIGITS)
+
+    def _binarize(self, image):
+        """글자가 흰색(255)이 되도록 이진화"""
+        if image.ndim == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        _, binary = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        # 배경이 흰색이면 반전 (글자보다 배경 면적이 넓다고 가정)
+        if np.count_nonzero(binary) > binary.size / 2:
+            binary = cv2.bitwise_not(binary)
+        return binary
+
+    def _segment(self, binary):
+        """이진 이미지에서 글자 영역을 왼쪽부터 순서대로 분리
+
+        Returns:
+            list: (x, y, w, h) 글자 경계 상자 목록
+        """
+        count, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+        boxes = []
+        for i in range(1, count):
+            x, y, w, h, area = stats[i]
+            # 잡음과 가로로 긴 막대(진행 표시줄 등)는 제외
+            if area < 4 or w > h * 1.5:
+                continue
+            boxes.append((x, y, w, h))
+        if not boxes:
+            return []
+
+        max_height = max(h for _, _, _, h in boxes)
+        boxes = [box for box in boxes if box[3] >= max_height * 0.6]
+        boxes.sort(key=lambda box: box[0])
+
+        # 가로로 겹치는 조각은 하나의 글자로 병합
+        merged = []
+        for x, y, w, h in boxes:
+            if merged and x < merged[-1][0] + merged[-1][2]:
+                mx, my, mw, mh = merged[-1]
+                x2, y2 = max(mx + mw, x + w), max(my + mh, y + h)
+                mx, my = min(mx, x), min(my, y)
+                merged[-1] = (mx, my, x2 - mx, y2 - my)
+            else:
+                merged.append((x, y, w, h))
+        return merged
+
+    def _normalize_glyph(self, binary, box):
+        """글자 영역을 비율을 유지한 채 정규화 크기로 변환"""
+        x, y, w, h = box
+        glyph = binary[y:y + h, x:x + w]
+        target_w, target_h = self.glyph_size
+        scale = min(target_w / w, target_h / h)
+        resized = cv2.resize(glyph, (max(1, int(w * scale)), max(1, int(h * scale))), interpolation=cv2.INTER_AREA)
+        canvas = np.zeros((target_h, target_w), dtype=np.float32)
+        off_x = (target_w - resized.shape[1]) // 2
+        off_y = (target_h - resized.shape[0]) // 2
+        canvas[off_y:off_y + resized.shape[0], off_x:off_x + resized.shape[1]] = resized
+        return canvas
+
+    def _glyphs(self, image):
+        binary = self._binarize(image)
+        return [self._normalize_glyph(binary, box) for box in self._segment(binary)]
+
+    def _load(self):
+        """파일에서 학습한 견본 로드"""
+        if not self.file_path or not os.path.exists(self.file_path):
+            return
+        try:
+            with np.load(self.file_path) as data:
+                for name in data.files:
+                    if name == self.LENGTH_KEY:
+                        if not self._fixed_length:
+                            self.otp_length = int(data[name])
+                        continue
+                    digit = name.split('_')[0]
+                    glyph = data[name].astype(np.float32)
+                    if glyph.shape == (self.glyph_size[1], self.glyph_size[0]):
+                        self._learned.setdefault(digit, []).append(glyph)
+            self._rebuild_samples()
+        except Exception as e:
+            print(f"OTP 숫자 견본 로드 중 오류 발생: {e}")
+
+    def _save(self):
+        """학습한 견본을 파일에 저장"""
+        if not self.file_path:
+            return
+        try:
+            arrays = {f"{digit}_{i}": glyph for digit, glyphs in self._learned.items() for i, glyph in enumerate(glyphs)}
+            if self.otp_length:
+                arrays[self.LENGTH_KEY] = np.array(self.otp_length)
+            tmp_path = f"{self.file_path}.tmp.npz"
+            np.savez_compressed(tmp_path, **arrays)
+            os.replace(tmp_path, self.file_path)
+        except Exception as e:
+            print(f"OTP 숫자 견본 저장 중 오류 발생: {e}")
+
+    def _rebuild_samples(self):
+        """학습한 견본으로 비교용 견본 구성"""
+        samples = {digit: list(glyphs) for digit, glyphs in self._learned.items() if glyphs}
+        self._samples = samples
+        labels = [digit for digit, glyphs in samples.items() for _ in glyphs]
+        self._matrix = StatsMatrix(labels, [glyph for glyphs in samples.values() for glyph in glyphs])
+
+    def remember(self, image, text):
+        """OCR로 읽은 숫자열을 확인 대기 상태로 보관 (confirm으로 통과가 확인되어야 학습)"""
+        if image is None or not text or not text.isdigit():
+            self._pending = None
+            return
+        self._pending = (np.array(image, copy=True), text)
+
+    def confirm(self, text):
+        """보관한 OCR 결과가 text와 같으면 통과가 확인된 것으로 보고 학습
+
+        Returns:
+            bool: 학습 여부
+        """
+        pending, self._pending = self._pending, None
+        if pending is None or not text or pending[1] != text:
+            return False
+        if not self._fixed_length:
+            self.otp_length = len(text)
+        return self.learn(*pending)
+
+    def learn(self, image, text):
+        """확인된 숫자열로 견본 학습
+
+        Returns:
+            bool: 학습 여부 (글자 수가 일치할 때만 학습)
+        """
+        if not text or not text.isdigit():
+            return False
+        glyphs = self._glyphs(image)
+        if len(glyphs) != len(text):
+            return False
+        with self._lock:
+            for digit, glyph in zip(text, glyphs):
+                learned = self._learned.setdefault(digit, [])
+                learned.append(glyph)
+                if len(learned) > self.max_samples_per_digit:
+                    learned.pop(0)
+            self._rebuild_samples()
+            self.stats["learned"] += 1
+            self._save()
+        return True
+
+    def _classify(self, glyph):
+        """가장 비슷한 숫자, 점수, 그다음으로 비슷한 다른 숫자와의 점수 차이 반환
+
+        글자와 견본은 같은 크기이므로 TM_CCOEFF_NORMED 값은 평균을 뺀 벡터의 코사인 유사도와 같습니다.
+        견본마다 matchTemplate을 호출하는 대신 미리 정규화한 견본 행렬과 한 번에 비교합니다.
+        """
+        best = {}
+        for digit, score in zip(self._matrix.labels, self._matrix.scores(glyph)):
+            if score > best.get(digit, -1.0):
+                best[digit] = float(score)
+        ranked = sorted(best.items(), key=lambda item: item[1], reverse=True)
+        digit, score = ranked[0]
+        second = ranked[1][1] if len(ranked) > 1 else -1.0
+        return digit, score, score - second
+
+    def recognize(self, image, expected_length=None):
+        """숫자열 인식
+
+        Args:
+            image: 숫자 영역 이미지
+            expected_length: 숫자열 길이 (None이면 otp_length)
+
+        Returns:
+            tuple: (text, confidence) - confidence는 글자별 점수 중 최솟값,
+                   신뢰도가 min_confidence 미만이거나, 다른 숫자와 점수 차이가 min_margin보다 작거나,
+                   글자 수가 길이와 다르거나, 아직 모든 숫자의 견본이 없으면 text는 None
+        """
+        expected_length = expected_length or self.otp_length
+        with self._lock:
+            if image is None or image.size == 0:
+                return None, 0.0
+            if not self.has_samples:
+                self.stats["incomplete_samples"] += 1
+                return None, 0.0
+            glyphs = self._glyphs(image)
+            if not glyphs:
+                return None, 0.0
+            if expected_length is None or len(glyphs) != expected_length:
+                # 글자가 잘못 분리되었거나 길이를 아직 모르면 OCR로 인식
+                self.stats["length_mismatch"] += 1
+                return None, 0.0
+
+            digits = []
+            confidence = 1.0
+            margin = 1.0
+            for glyph in glyphs:
+                digit, score, gap = self._classify(glyph)
+                digits.append(digit)
+                confidence = min(confidence, score)
+                margin = min(margin, gap)
+
+        if confidence < self.min_confidence:
+            self.stats["low_confidence"] += 1
+            return None, confidence
+        if margin < self.min_margin:
+            # 비슷한 숫자(3/8, 6/8 등)와 구분되지 않으면 잘못 읽을 수 있으므로 OCR로 인식
+            self.stats["ambiguous"] += 1
+            return None, confidence
+
+        self.stats["recognized"] += 1
+        return ''.join(digits), confidence
@@ -0,0 +1,58 @@
+import cv2
+import numpy as np
+
+
+class FrameChangeDetector:
+    """축소 썸네일 비교로 화면 변경 여부를 빠르게 판단하는 클래스
+
+    마지막으로 분석한 프레임의 썸네일과 비교하여 바뀐 픽셀 수가 허용치 이하이면
+    같은 화면으로 판단합니다. 같은 화면일 때는 기준 썸네일을 갱신하지 않으므로
+    아주 느린 변화도 누적되어 결국 변경으로 감지됩니다.
+    """
+
+    def __init__(self, thumb_size=(160, 90), pixel_delta=8, max_changed_pixels=0):
+        """
+        Args:
+            thumb_size: 비교용 썸네일 크기 (width, height)
+            pixel_delta: 이 값보다 밝기 차이가 큰 썸네일 픽셀을 변경된 픽셀로 판단
+            max_changed_pixels: 변경된 픽셀이 이 개수 이하이면 같은 화면으로 판단 (민감도)
+        """
+        self.thumb_size = thumb_size
+        self.pixel_delta = pixel_delta
+        self.max_changed_pixels = max_changed_pixels
+        self._reference = None
+        self.frames = 0
+        self.skipped = 0
+
+    def _thumbnail(self, screen):
+        thumb = cv2.resize(screen, self.thumb_size, interpolation=cv2.INTER_AREA)
+        return thumb.astype(np.int16)
+
+    def has_changed(self, screen):
+        """마지막 분석 프레임과 비교하여 화면이 바뀌었는지 반환"""
+        self.frames += 1
+        if screen is None:
+            self._reference = None
+            return True
+
+        thumb = self._thumbnail(screen)
+        if self._reference is not None and self._reference.shape == thumb.shape:
+            changed_pixels = int(np.count_nonzero(np.abs(thumb - self._reference) > self.pixel_delta))
+            if changed_pixels <= self.max_changed_pixels:
+                self.skipped += 1
+                return False
+
+        self._reference = thumb
+        return True
+
+    def reset(self):
+        """기준 프레임 초기화"""
+        self._reference = None
+
+    def stats(self):
+        """프레임 변경 감지 통계 반환"""
+        return {
+            "frames": self.frames,
+            "skipped": self.skipped,
+            "skip_rate": (self.skipped / self.frames) if self.frames else 0.0,
+        }
@@ -0,0 +1,159 @@
+import os
+import re
+from abc import ABC, abstractmethod
+import cv2
+
+
+class FrameSource(ABC):
+    """탐지 로직에 화면 프레임을 공급하는 소스의 기본 클래스
+
+    모든 소스는 CaptureUtil과 같은 screen_capture(region, reuse_buffer) 인터페이스
+    (코루틴에서는 screen_capture_async)로 흑백 프레임을 반환하므로, AutoTenMin/OTPService/ExitGameHandler에 그대로 주입할 수 있습니다.
+    마지막으로 반환한 프레임의 타임스탬프(초)는 last_timestamp에 기록됩니다.
+    """
+
+    def __init__(self):
+        self.last_timestamp = None
+
+    @abstractmethod
+    def read_frame(self):
+        """다음 프레임 반환
+
+        Returns:
+            tuple: (timestamp, frame) - 더 이상 프레임이 없으면 (None, None)
+        """
+
+    def screen_capture(self, region=None, reuse_buffer=False):
+        """다음 프레임을 흑백 이미지로 반환합니다. (region: (x1, y1, x2, y2))"""
+        try:
+            timestamp, frame = self.read_frame()
+            if frame is None:
+                return None
+            self.last_timestamp = timestamp
+            if region is not None:
+                x1, y1, x2, y2 = (int(v) for v in region)
+                frame = frame[max(0, y1):y2, max(0, x1):x2]
+            return frame
+        except Exception as e:
+            print(f"프레임 읽기 중 오류 발생: {e}")
+            return None
+
+    async def screen_capture_async(self, region=None, reuse_buffer=False):
+        """코루틴에서 사용하는 screen_capture (녹화 재생 소스는 바로 읽음)"""
+        return self.screen_capture(region=region, reuse_buffer=reuse_buffer)
+
+    @staticmethod
+    def _to_gray(frame):
+        if frame is not None and frame.ndim == 3:
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        return frame
+
+    def close(self):
+        pass
+
+
+class DirectoryFrameSource(FrameSource):
+    """디렉터리에 저장된 이미지 파일(PNG 등)을 순서대로 재생하는 소스
+
+    파일 이름에 숫자가 있으면 첫 번째 숫자(예: 1700000000.123.png, frame_000123.png)를
+    타임스탬프로 사용하고, 없으면 파일 수정 시각을 사용합니다.
+    """
+    EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+    _NUMBER = re.compile(r'\d+(?:\.\d+)?')
+
+    def __init__(self, directory, loop=False, timestamp_scale=1.0):
+        """
+        Args:
+            directory: 프레임 이미지가 있는 디렉터리
+            loop: 마지막 프레임 이후 처음부터 다시 재생할지 여부
+            timestamp_scale: 파일 이름의 숫자를 초로 바꾸는 배율 (밀리초 이름이면 0.001)
+        """
+        super().__init__()
+        self.directory = directory
+        self.loop = loop
+        self.timestamp_scale = timestamp_scale
+        self.files = sorted(
+            name for name in os.listdir(directory) if name.lower().endswith(self.EXTENSIONS)
+        )
+        self.index = 0
+
+    def _timestamp(self, name):
+        match = self._NUMBER.search(os.path.splitext(name)[0])
+        if match:
+            return float(match.group()) * self.timestamp_scale
+        return os.path.getmtime(os.path.join(self.directory, name))
+
+    def read_frame(self):
+        if self.index >= len(self.files):
+            if not self.loop or not self.files:
+                return None, None
+            self.index = 0
+
+        name = self.files[self.index]
+        self.index += 1
+        frame = cv2.imread(os.path.join(self.directory, name), cv2.IMREAD_GRAYSCALE)
+        return self._timestamp(name), frame
+
+
+class VideoFrameSource(FrameSource):
+    """녹화된 동영상 파일을 프레임 단위로 재생하는 소스 (타임스탬프는 영상 내 위치)"""
+
+    def __init__(self, path, loop=False, frame_step=1):
+        """
+        Args:
+            path: 동영상 파일 경로
+            loop: 영상 끝에서 처음부터 다시 재생할지 여부
+            frame_step: screen_capture 한 번에 건너뛸 프레임 수 (1이면 모든 프레임)
+        """
+        super().__init__()
+        self.path = path
+        self.loop = loop
+        self.frame_step = max(1, int(frame_step))
+        self._capture = cv2.VideoCapture(path)
+        if not self._capture.isOpened():
+            raise ValueError(f"동영상 파일을 열 수 없습니다: {path}")
+
+    def read_frame(self):
+        for _ in range(self.frame_step - 1):
+            self._capture.grab()
+
+        ok, frame = self._capture.read()
+        if not ok and self.loop:
+            self._capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self._capture.read()
+        if not ok:
+            return None, None
+
+        timestamp = self._capture.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+        return timestamp, self._to_gray(frame)
+
+    def close(self):
+        self._capture.release()
+
+
+def create_frame_source(spec=None, capture_fps=0, action_clock=None):
+    """설정 문자열로 프레임 소스 생성
+
+    Args:
+        spec: None 또는 "live" - 실시간 화면 캡처
+              "dir:<경로>" - 이미지 디렉터리 재생
+              "video:<경로>" - 동영상 파일 재생
+        capture_fps: 0보다 크면 실시간 캡처를 이 속도로 백그라운드 스레드에서 수행
+        action_clock: 마지막 입력 동작 시각을 반환하는 함수 (백그라운드 캡처에서 이후 프레임만 사용)
+
+    Returns:
+        FrameSource: 프레임 소스
+    """
+    if not spec or spec == "live":
+        from src.utils.capture import CaptureUtil  # pyautogui는 실시간 캡처에서만 필요
+        if capture_fps and capture_fps > 0:
+            from src.utils.threaded_capture import ThreadedFrameSource
+            return ThreadedFrameSource(CaptureUtil(), fps=capture_fps, action_clock=action_clock)
+        return CaptureUtil()
+
+    kind, _, path = spec.partition(":")
+    if kind == "dir":
+        return DirectoryFrameSource(path)
+    if kind == "video":
+        return VideoFrameSource(path)
+    raise ValueError(f"알 수 없는 프레임 소스: {spec}")
@@ -1,23 +1,368 @@
+import os
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import cv2
 import numpy as np
-import easyocr
 import random
-from src.utils.error_handler import ErrorHandler
-from src.utils.input_controller import InputController
+from src.utils.template_pyramid import TemplatePyramid
+from src.utils.template_priors import TemplatePriors
+from src.utils.frame_change import FrameChangeDetector
+from src.utils.detection_context import DetectionContext
+from src.utils.ocr_engine import OCREngine
+from src.utils.ocr_cache import OCRCache
+from src.utils.process_matcher import ProcessMatchEngine
+from src.utils.template_stats import ncc_at
 
 class ImageMatcher:
-    def __init__(self):
-        self.error_handler = ErrorHandler()
-        self.reader = easyocr.Reader(['en','ko'])  # OCR 리더 초기화
-        self.input_controller = InputController()
+    def __init__(self, match_processes=None, input_controller=None):
+        """
+        Args:
+            match_processes: 작업 프로세스 수 (None이면 MATCH_PROCESSES 환경 변수)
+            input_controller: 클릭에 사용할 InputController (None이면 처음 클릭할 때 생성)
+        """
+        self._error_handler = None
+        self.ocr = OCREngine.get_instance()  # OCR 리더는 처음 사용할 때 (또는 워밍업 시) 로드
+        self.ocr_cache = OCRCache(max_size=128)  # 같은 픽셀에 대한 OCR 결과 캐시
+        self._input_controller = input_controller
+        self.pyramid = TemplatePyramid()  # 템플릿 스케일별 이미지 캐시
+
+        # coarse-to-fine 탐색 설정
+        self.coarse_to_fine = False  # 기본값: 전체 해상도 탐색
+        self.COARSE_FACTOR = 0.25  # 축소 탐색 비율
+        self.COARSE_MIN_WIDTH = 1280  # 이보다 작은 화면은 전체 해상도로 탐색
+        self.COARSE_CANDIDATES = 3  # 정밀 탐색할 후보 수
+        self.COARSE_MARGIN = 0.15  # 축소 탐색 시 허용하는 임계값 여유
+
+        # 템플릿별 스케일/위치 prior 설정
+        self.priors = TemplatePriors()
+        self.use_priors = True
+
+        # 스케일 탐색 조기 종료 설정
+        self.ACCEPT_CONFIDENCE = 0.95  # 이 점수 이상이면 남은 스케일을 탐색하지 않음 (None이면 전체 탐색)
+        self._scale_wins = [0] * len(self.pyramid.scales)  # 스케일별 최종 선택 횟수
+        self.sweep_stats = {"sweeps": 0, "scale_evaluations": 0, "scale_evaluations_saved": 0, "early_exits": 0}
+
+        # 스케일 병렬 탐색 설정 - 0보다 크면 한 템플릿의 스케일들을 이 수만큼의 스레드에서 동시에 매칭
+        self.sweep_workers = int(os.getenv("SWEEP_WORKERS", "0"))
+        self._sweep_executor = None
+
+        # 화면 변경 감지 설정 - 화면이 그대로면 이전 프레임의 탐지 결과 재사용
+        self.frame_gating = True
+        self.frame_change = FrameChangeDetector()
+        self.frame_context = None  # begin_frame으로 등록된 현재 프레임의 탐지 컨텍스트
+        self.reused_results = 0  # 변경되지 않은 이전 프레임에서 재사용한 결과 수
+        self.shared_results = 0  # 같은 프레임에서 다른 핸들러와 공유한 결과 수
+
+        # 비동기 매칭용 스레드 풀 (OpenCV는 매칭 중 GIL을 해제하므로 이벤트 루프가 멈추지 않음)
+        self.max_workers = int(os.getenv("MATCH_WORKERS", "2"))
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self.executor_stats = {"pending": 0, "max_pending": 0, "completed": 0}
+
+        # 다중 프로세스 매칭 설정 - 0보다 크면 비동기 탐지를 작업 프로세스에서 수행
+        if match_processes is None:
+            match_processes = int(os.getenv("MATCH_PROCESSES", "0"))
+        self.process_engine = ProcessMatchEngine(match_processes, self.coarse_to_fine) if match_processes > 0 else None
+
+    @property
+    def error_handler(self):
+        """오류 처리기 (DB/API 모듈을 import하므로 작업 프로세스에서는 오류가 날 때만 생성)"""
+        if self._error_handler is None:
+            from src.utils.error_handler import ErrorHandler
+            self._error_handler = ErrorHandler()
+        return self._error_handler
+
+    @property
+    def input_controller(self):
+        """클릭용 InputController (pyautogui/keyboard는 녹화 재생 등 클릭하지 않는 환경에서 import하지 않음)"""
+        if self._input_controller is None:
+            from src.utils.input_controller import InputController
+            self._input_controller = InputController()
+        return self._input_controller
+
+    @property
+    def reader(self):
+        """공유 OCR 리더 (로드되지 않았으면 로드될 때까지 대기)"""
+        return self.ocr.reader
+
+    def _crop_roi(self, screen, roi):
+        """ROI가 설정된 경우 해당 영역만 잘라 연속 메모리 배열로 반환"""
+        if roi is not None:
+            # ROI가 설정된 경우, 해당 영역만 탐지 대상으로 자름
+            screen = screen[roi[1]:roi[3], roi[0]:roi[2]]
+        # matchTemplate 호출마다 복사가 일어나지 않도록 한 번만 연속 배열로 변환
+        return np.ascontiguousarray(screen)
+
+    def _downsample_screen(self, screen, coarse_to_fine):
+        """coarse-to-fine 탐색용 축소 화면 생성 (사용하지 않으면 None)"""
+        if coarse_to_fine is None:
+            coarse_to_fine = self.coarse_to_fine
+        if not coarse_to_fine or screen.ndim != 2 or screen.shape[1] < self.COARSE_MIN_WIDTH:
+            return None
+        return cv2.resize(screen, None, fx=self.COARSE_FACTOR, fy=self.COARSE_FACTOR, interpolation=cv2.INTER_AREA)
+
+    def _coarse_candidates(self, result, template_shape):
+        """축소 매칭 결과에서 점수가 높은 후보 위치를 겹치지 않게 추출"""
+        candidates = []
+        result = result.copy()
+        suppress_h, suppress_w = template_shape[0] // 2 + 1, template_shape[1] // 2 + 1
+        for _ in range(self.COARSE_CANDIDATES):
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            if candidates and max_val < candidates[0][0] - self.COARSE_MARGIN:
+                break
+            candidates.append((max_val, max_loc))
+            x, y = max_loc
+            result[max(0, y - suppress_h):y + suppress_h, max(0, x - suppress_w):x + suppress_w] = -1.0
+        return candidates
+
+    def _match_window(self, screen, resized, x, y, pad):
+        """(x, y) 주변의 작은 영역에서만 템플릿 매칭
+
+        Returns:
+            tuple: (max_val, max_loc) - max_loc은 screen 기준 좌표
+        """
+        x1, y1 = max(0, x - pad), max(0, y - pad)
+        x2 = min(screen.shape[1], x + resized.shape[1] + pad)
+        y2 = min(screen.shape[0], y + resized.shape[0] + pad)
+        window = screen[y1:y2, x1:x2]
+        if resized.shape[0] > window.shape[0] or resized.shape[1] > window.shape[1]:
+            return -1.0, None
+
+        result = cv2.matchTemplate(window, resized, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        return max_val, (max_loc[0] + x1, max_loc[1] + y1)
+
+    def _match_level(self, screen, resized, coarse_screen=None, coarse=None, threshold=0.8):
+        """단일 스케일 템플릿 매칭
+
+        축소 화면과 축소 템플릿이 주어지면 축소 화면에서 후보를 찾은 뒤
+        후보 주변만 전체 해상도로 정밀 매칭합니다.
+
+        Returns:
+            tuple: (max_val, max_loc)
+        """
+        if coarse_screen is None or coarse is None or \
+                coarse.shape[0] > coarse_screen.shape[0] or coarse.shape[1] > coarse_screen.shape[1]:
+            result = cv2.matchTemplate(screen, resized, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            return max_val, max_loc
+
+        coarse_result = cv2.matchTemplate(coarse_screen, coarse, cv2.TM_CCOEFF_NORMED)
+        best_val, best_loc = -1.0, None
+        for coarse_val, coarse_loc in self._coarse_candidates(coarse_result, coarse.shape):
+            if coarse_val < threshold - self.COARSE_MARGIN:
+                break
+            # 축소 후보 주변의 작은 영역에서 전체 해상도로 정밀 매칭
+            x = int(coarse_loc[0] / self.COARSE_FACTOR)
+            y = int(coarse_loc[1] / self.COARSE_FACTOR)
+            max_val, max_loc = self._match_window(screen, resized, x, y, int(2 / self.COARSE_FACTOR) + 2)
+            if max_val > best_val:
+                best_val, best_loc = max_val, max_loc
+        return best_val, best_loc
+
+    def _match_prior(self, screen, template, levels, prior, offset, threshold):
+        """prior로 기억된 스케일과 위치 한 곳만 확인
+
+        기억된 위치의 상관계수를 미리 계산된 템플릿 통계로 구하고, ACCEPT_CONFIDENCE 이상일 때만 받아들입니다.
+        주변에서 임계값을 넘는 비슷한 영역을 찾는 것만으로는 화면 전체의 최고점인지 알 수 없으므로,
+        그 외에는 None을 반환하여 전체 탐색을 수행하게 합니다.
+
+        Returns:
+            tuple: (max_val, max_loc, r, resized_width, resized_height) 또는 None
+        """
+        index = prior["scale_index"]
+        if self.ACCEPT_CONFIDENCE is None or not 0 <= index < len(levels):
+            return None
+
+        x = prior["loc"][0] - offset[0]
+        y = prior["loc"][1] - offset[1]
+        score = ncc_at(screen, x, y, self.pyramid.get_stats(template)[index])
+        if score < max(threshold, self.ACCEPT_CONFIDENCE):
+            return None
+        scale, resized, r = levels[index]
+        return (score, (x, y), r, resized.shape[1], resized.shape[0])
+
+    def _match_template(self, screen, template, threshold, coarse_screen=None, prior_key=None, offset=(0, 0)):
+        """단일 템플릿의 다중 스케일 매칭
+
+        prior_key가 주어지면 기억된 스케일/위치를 먼저 탐색하고,
+        실패한 경우에만 전체 스케일을 탐색하여 결과를 다시 학습합니다.
+
+        Returns:
+            tuple: (max_val, max_loc, r, resized_width, resized_height) 또는 None
+        """
+        found = None
+        found_index = None
+        levels = self.pyramid.get(template)
+
+        prior = self.priors.get(prior_key) if self.use_priors else None
+        if prior is not None:
+            found = self._match_prior(screen, template, levels, prior, offset, threshold)
+            if found:
+                self.priors.record_hit(prior_key)
+                return found
+            self.priors.record_miss(prior_key)
+
+        if coarse_screen is not None:
+            coarse_levels = self.pyramid.get_coarse(template, self.COARSE_FACTOR)
+        else:
+            coarse_levels = [None] * len(levels)
+
+        # 다중 스케일 템플릿 매칭을 위한 루프 (가능성이 높은 스케일부터 탐색)
+        schedule = self._scale_schedule(len(levels), prior)
+        # 템플릿 크기가 화면을 초과하는 스케일은 무시
+        schedule = [index for index in schedule
+                    if levels[index][1].shape[0] <= screen.shape[0] and levels[index][1].shape[1] <= screen.shape[1]]
+        results = self._sweep_parallel(screen, levels, coarse_screen, coarse_levels, threshold, schedule)
+
+        evaluated = 0
+        self.sweep_stats["sweeps"] += 1
+        for index in schedule:
+            scale, resized, r = levels[index]
+            if results is not None:
+                max_val, max_loc = results[index]
+            else:
+                max_val, max_loc = self._match_level(screen, resized, coarse_screen, coarse_levels[index], threshold)
+            evaluated += 1
+
+            if max_val >= threshold:
+                if found is None or max_val > found[0]:
+                    found = (max_val, max_loc, r, resized.shape[1], resized.shape[0])
+                    found_index = index
+
+            # 임계값을 넘고 충분히 높은 점수면 남은 스케일은 탐색하지 않음
+            if self.ACCEPT_CONFIDENCE is not None and max_val >= max(threshold, self.ACCEPT_CONFIDENCE):
+                self.sweep_stats["early_exits"] += 1
+                break
+
+        if results is not None:
+            evaluated = len(results)  # 병렬 탐색은 조기 종료와 관계없이 모든 스케일을 평가함
+        self.sweep_stats["scale_evaluations"] += evaluated
+        self.sweep_stats["scale_evaluations_saved"] += len(levels) - evaluated
+
+        if found and found_index < len(self._scale_wins):
+            self._scale_wins[found_index] += 1
+
+        if found and prior_key is not None and self.use_priors:
+            max_loc = found[1]
+            self.priors.learn(prior_key, found_index, levels[found_index][0], (max_loc[0] + offset[0], max_loc[1] + offset[1]))
+
+        return found
+
+    def _sweep_parallel(self, screen, levels, coarse_screen, coarse_levels, threshold, schedule):
+        """sweep_workers가 설정된 경우 모든 스케일을 스레드 풀에서 동시에 매칭
+
+        결과는 순차 탐색과 같은 순서(schedule)로 다시 평가되므로 탐지 결과는 순차 탐색과 동일합니다.
+
+        Returns:
+            dict: {scale_index: (max_val, max_loc)} - 병렬 탐색을 하지 않으면 None
+        """
+        if self.sweep_workers <= 0 or len(schedule) < 2:
+            return None
+
+        if self._sweep_executor is None:
+            with self._executor_lock:
+                if self._sweep_executor is None:
+                    self._sweep_executor = ThreadPoolExecutor(max_workers=self.sweep_workers, thread_name_prefix="sweep")
+
+        def match(index):
+            return self._match_level(screen, levels[index][1], coarse_screen, coarse_levels[index], threshold)
+
+        return dict(zip(schedule, self._sweep_executor.map(match, schedule)))
+
+    def _scale_schedule(self, level_count, prior=None):
+        """스케일 탐색 순서 반환
+
+        prior가 있으면 기억된 스케일에서 가까운 순서로,
+        없으면 지금까지 가장 많이 선택된 스케일 순서로 탐색합니다.
+        """
+        if prior is not None and 0 <= prior["scale_index"] < level_count:
+            anchor = prior["scale_index"]
+            return sorted(range(level_count), key=lambda i: (abs(i - anchor), i))
+
+        wins = self._scale_wins
+        return sorted(range(level_count), key=lambda i: (-wins[i] if i < len(wins) else 0, i))
 
-    def detect_template(self, screen, templates, threshold=0.8, roi=None):
+    def begin_frame(self, screen):
+        """새로 캡처한 프레임의 분석 시작
+
+        프레임마다 탐지 컨텍스트를 새로 만들어, 이 프레임에 대한 탐지 결과를
+        (템플릿 키, ROI, 임계값) 단위로 모든 핸들러가 공유하도록 합니다.
+        이전에 분석한 프레임과 사실상 같은 화면이면 이전 탐지 결과도 이어받습니다.
+
+        Args:
+            screen: 새로 캡처한 화면 이미지
+
+        Returns:
+            DetectionContext: 현재 프레임의 탐지 컨텍스트 (changed 속성으로 화면 변경 여부 확인)
+        """
+        if self.frame_context is not None:
+            self._collect_frame_stats(self.frame_context)
+
+        changed = not self.frame_gating or self.frame_change.has_changed(screen)
+        self.frame_context = DetectionContext(screen, changed, previous=self.frame_context)
+        return self.frame_context
+
+    def _collect_frame_stats(self, context):
+        self.reused_results += context.reused
+        self.shared_results += context.hits
+        context.reused = context.hits = 0
+
+    def frame_stats(self):
+        """화면 변경 감지 및 결과 재사용 통계 반환"""
+        if self.frame_context is not None:
+            self._collect_frame_stats(self.frame_context)
+        return dict(self.frame_change.stats(), reused_results=self.reused_results, shared_results=self.shared_results)
+
+    def _match_frame(self, frame, screen, template, threshold, roi, coarse_screen=None, prior_key=None, offset=(0, 0),
+                     template_key=None, index=0):
+        """begin_frame으로 등록된 프레임이면 프레임 탐지 컨텍스트를 통해 매칭 결과를 공유"""
+        context = self.frame_context
+        if frame is None or context is None or frame is not context.screen:
+            return self._match_template(screen, template, threshold, coarse_screen, prior_key, offset)
+
+        key = context.make_key(template, template_key, index, threshold, roi, coarse_screen is not None)
+        cached, found = context.get(key, template)
+        if not cached:
+            found = self._match_template(screen, template, threshold, coarse_screen, prior_key, offset)
+            context.put(key, template, found)
+        return found
+
+    def _prior_key(self, template_key, screen_shape, index=0):
+        """템플릿 키가 있으면 prior 키 생성"""
+        if template_key is None or not self.use_priors:
+            return None
+        return self.priors.make_key(template_key, screen_shape, index)
+
+    def _to_screen_coords(self, found, roi):
+        """매칭 결과를 전체 화면 좌표로 변환"""
+        max_val, max_loc, r, resized_width, resized_height = found
+        start_x = int(max_loc[0] * r)
+        start_y = int(max_loc[1] * r)
+        end_x = start_x + int(resized_width * r)
+        end_y = start_y + int(resized_height * r)
+
+        # ROI가 설정된 경우, 전체 화면의 좌표로 변환
+        if roi is not None:
+            start_x += roi[0]
+            start_y += roi[1]
+            end_x += roi[0]
+            end_y += roi[1]
+
+        print(f"매칭률:{max_val}, x좌표:({start_x},{end_x}), y좌표:({start_y},{end_y})")
+        return (start_x, start_y), (end_x, end_y), max_val
+
+    def detect_template(self, screen, templates, threshold=0.8, roi=None, coarse_to_fine=None, template_key=None):
         """이미지에서 템플릿 위치 탐지
         
         Args:
             screen: 검색할 스크린샷 이미지
             template: 찾을 템플릿 이미지
             threshold: 매칭 임계값 (기본값: 0.6)
+            coarse_to_fine: 축소 화면에서 후보를 찾고 주변만 정밀 탐색 (None이면 self.coarse_to_fine 사용)
+            template_key: 템플릿 키 - 주어지면 학습된 스케일/위치를 먼저 탐색
             
         Returns:
             tuple: (top_left, bottom_right, max_val) - 템플릿이 발견된 위치와 매칭 점수
@@ -27,65 +372,169 @@ class ImageMatcher:
             if not isinstance(templates, list):
                 templates = [templates]
 
-            if roi is not None:
-                # ROI가 설정된 경우, 해당 영역만 탐지 대상으로 자름
-                screen = screen[roi[1]:roi[3], roi[0]:roi[2]]
+            frame = screen
+            full_shape = screen.shape
+            offset = (roi[0], roi[1]) if roi is not None else (0, 0)
+            screen = self._crop_roi(screen, roi)
+            coarse_screen = self._downsample_screen(screen, coarse_to_fine)
 
-            found = None
-            
             # 템플릿 리스트를 순차적으로 탐지 시도
-            for template in templates:
-                template_height, template_width = template.shape[:2]
-                found = None
+            for index, template in enumerate(templates):
+                prior_key = self._prior_key(template_key, full_shape, index)
+                found = self._match_frame(frame, screen, template, threshold, roi, coarse_screen, prior_key, offset, template_key, index)
 
-                # 다중 스케일 템플릿 매칭을 위한 루프
-                for scale in np.linspace(0.8, 1.0, 10)[::-1]:  # 스케일 범위와 단계 수 조정
-                    resized_template_width = int(template_width * scale)
-                    resized_template_height = int(template_height * scale)
+                # 템플릿 위치 반환 (탐지에 성공한 경우)
+                if found:
+                    return self._to_screen_coords(found, roi)
 
-                    resized = cv2.resize(template, (resized_template_width, resized_template_height))
+            # 모든 템플릿을 탐지했으나 성공하지 못한 경우
+            return None, None, None
+            
+        except Exception as e:
+            self.error_handler.handle_error(e, "템플릿 매칭 중 오류 발생")
+            return None, None, 0
 
-                    r = template_width / float(resized.shape[1])  # 비율 계산
+    def detect_templates(self, screen, template_keys, templates, threshold=0.8, roi=None, first_only=True, coarse_to_fine=None):
+        """하나의 화면에서 여러 템플릿을 한 번에 탐지
 
-                    # 템플릿 크기가 화면을 초과하면 무시
-                    if resized.shape[0] > screen.shape[0] or resized.shape[1] > screen.shape[1]:
-                        continue
+        화면 전처리(ROI 자르기, 연속 배열 변환)를 한 번만 수행하고
+        template_keys 순서대로 매칭합니다.
 
-                    result = cv2.matchTemplate(screen, resized, cv2.TM_CCOEFF_NORMED)
+        Args:
+            screen: 검색할 스크린샷 이미지
+            template_keys: 탐지할 템플릿 키 목록 (우선순위 순)
+            templates: 템플릿 딕셔너리
+            threshold: 매칭 임계값 (기본값: 0.8)
+            roi: 관심 영역 (x1, y1, x2, y2)
+            first_only: True이면 첫 번째 탐지 시 즉시 종료
+            coarse_to_fine: 축소 화면 선탐색 여부 (None이면 self.coarse_to_fine 사용)
 
-                    _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        Returns:
+            dict: {template_key: (top_left, bottom_right, max_val)} - 탐지된 템플릿만 포함
+        """
+        hits = {}
+        try:
+            frame = screen
+            full_shape = screen.shape
+            offset = (roi[0], roi[1]) if roi is not None else (0, 0)
+            screen = self._crop_roi(screen, roi)
+            coarse_screen = self._downsample_screen(screen, coarse_to_fine)
 
-                    if max_val >= threshold:
-                        if found is None or max_val > found[0]:
-                            found = (max_val, max_loc, r, resized.shape[1], resized.shape[0])
+            for key in template_keys:
+                if key not in templates:
+                    continue
 
-                # 템플릿 위치 반환 (탐지에 성공한 경우)
-                if found:
-                    max_val, max_loc, r, resized_width, resized_height = found
-                    start_x = int(max_loc[0] * r)
-                    start_y = int(max_loc[1] * r)
-                    end_x = start_x + int(resized_width * r)
-                    end_y = start_y + int(resized_height * r)
+                key_templates = templates[key]
+                if not isinstance(key_templates, list):
+                    key_templates = [key_templates]
 
+                for index, template in enumerate(key_templates):
+                    found = self._match_frame(frame, screen, template, threshold, roi, coarse_screen,
+                                              self._prior_key(key, full_shape, index), offset, key, index)
+                    if found:
+                        hits[key] = self._to_screen_coords(found, roi)
+                        break
 
-                    # ROI가 설정된 경우, 전체 화면의 좌표로 변환
-                    if roi is not None:
-                        start_x += roi[0]
-                        start_y += roi[1]
-                        end_x += roi[0]
-                        end_y += roi[1]
+                if first_only and hits:
+                    break
 
-                    print(f"매칭률:{max_val}, x좌표:({start_x},{end_x}), y좌표:({start_y},{end_y})")
-                    return (start_x, start_y), (end_x, end_y), max_val
+            return hits
 
-            # 모든 템플릿을 탐지했으나 성공하지 못한 경우
-            return None, None, None
-            
         except Exception as e:
-            self.error_handler.handle_error(e, "템플릿 매칭 중 오류 발생")
-            return None, None, 0
+            self.error_handler.handle_error(e, "다중 템플릿 매칭 중 오류 발생")
+            return hits
+
+    def _get_executor(self):
+        """매칭용 스레드 풀 반환 (처음 사용할 때 생성)"""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="matcher")
+        return self._executor
+
+    async def _track_pending(self, awaitable):
+        """매칭 작업이 끝날 때까지 대기 중인 작업 수를 기록"""
+        with self._executor_lock:
+            self.executor_stats["pending"] += 1
+            self.executor_stats["max_pending"] = max(self.executor_stats["max_pending"], self.executor_stats["pending"])
+        try:
+            return await awaitable
+        finally:
+            with self._executor_lock:
+                self.executor_stats["pending"] -= 1
+                self.executor_stats["completed"] += 1
+
+    async def _run_in_executor(self, func, *args, **kwargs):
+        """매칭 함수를 스레드 풀에서 실행하고 대기 중인 작업 수를 기록"""
+        loop = asyncio.get_running_loop()
+        return await self._track_pending(loop.run_in_executor(self._get_executor(), functools.partial(func, *args, **kwargs)))
+
+    async def _run_in_process(self, screen, template_keys, templates, threshold=0.8, roi=None, first_only=True, coarse_to_fine=None):
+        """detect_templates를 작업 프로세스에서 실행 (화면은 공유 메모리로 전달)"""
+        future = self.process_engine.submit(screen, template_keys, templates, threshold=threshold, roi=roi,
+                                            first_only=first_only, coarse_to_fine=coarse_to_fine)
+        return await self._track_pending(asyncio.wrap_future(future))
+
+    def shutdown_executor(self):
+        """매칭용 스레드 풀과 작업 프로세스 종료"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            if self._sweep_executor is not None:
+                self._sweep_executor.shutdown(wait=False)
+                self._sweep_executor = None
+        if self.process_engine is not None:
+            self.process_engine.close()
+
+    async def detect_template_async(self, screen, templates, threshold=0.8, roi=None, coarse_to_fine=None, template_key=None):
+        """detect_template을 스레드 풀 또는 작업 프로세스에서 실행 (인자와 반환값은 detect_template과 동일)"""
+        if self.process_engine is not None:
+            key = template_key or "template"
+            try:
+                hits = await self._run_in_process(screen, [key], {key: templates}, threshold=threshold, roi=roi,
+                                                  coarse_to_fine=coarse_to_fine)
+                return hits.get(key, (None, None, None))
+            except Exception as e:
+                self.error_handler.handle_error(e, "템플릿 매칭 중 오류 발생")
+                return None, None, 0
+        return await self._run_in_executor(self.detect_template, screen, templates, threshold=threshold, roi=roi,
+                                           coarse_to_fine=coarse_to_fine, template_key=template_key)
 
-    def process_template(self, screen, template_key, templates, click=False, roi=None, _range=10, threshold=0.8):
+    async def detect_templates_async(self, screen, template_keys, templates, threshold=0.8, roi=None, first_only=True, coarse_to_fine=None):
+        """detect_templates를 스레드 풀 또는 작업 프로세스에서 실행 (인자와 반환값은 detect_templates와 동일)"""
+        if self.process_engine is not None:
+            try:
+                return await self._run_in_process(screen, template_keys, templates, threshold=threshold, roi=roi,
+                                                  first_only=first_only, coarse_to_fine=coarse_to_fine)
+            except Exception as e:
+                self.error_handler.handle_error(e, "다중 템플릿 매칭 중 오류 발생")
+                return {}
+        return await self._run_in_executor(self.detect_templates, screen, template_keys, templates, threshold=threshold, roi=roi,
+                                           first_only=first_only, coarse_to_fine=coarse_to_fine)
+
+    async def process_template_async(self, screen, template_key, templates, click=False, roi=None, _range=10, threshold=0.8,
+                                     use_prior=True):
+        """process_template의 비동기 버전 - 탐지는 스레드 풀에서, 클릭은 호출한 스레드에서 수행"""
+        if template_key not in templates:
+            return False
+
+        top_left, bottom_right, _ = await self.detect_template_async(screen, templates[template_key], roi=roi, threshold=threshold,
+                                                                     template_key=template_key if use_prior else None)
+        if top_left and bottom_right:
+            if click:
+                self._click_in_box(top_left, bottom_right, _range)
+            return True
+        return False
+
+    def _click_in_box(self, top_left, bottom_right, _range=10):
+        """탐지 영역 안의 랜덤한 좌표 클릭"""
+        # 여백을 10픽셀 주고 랜덤한 좌표 선택
+        random_x = random.randint(top_left[0] + _range, bottom_right[0] - _range)
+        random_y = random.randint(top_left[1] + _range, bottom_right[1] - _range)
+        self.input_controller.click(random_x, random_y)
+
+    def process_template(self, screen, template_key, templates, click=False, roi=None, _range=10, threshold=0.8, use_prior=True):
         """템플릿을 감지하고 필요한 경우 클릭 수행
         
         Args:
@@ -94,6 +543,7 @@ class ImageMatcher:
             templates: 템플릿 딕셔너리
             click: 클릭 여부
             roi: 관심 영역 (x1, y1, x2, y2)
+            use_prior: 학습된 스케일/위치를 사용할지 여부 (비밀번호 숫자처럼 위치가 바뀌는 대상은 False)
             
         Returns:
             bool: 감지 성공 여부
@@ -101,17 +551,15 @@ class ImageMatcher:
         if template_key not in templates:
             return False
             
-        top_left, bottom_right, _ = self.detect_template(screen, templates[template_key], roi=roi, threshold=threshold)
+        top_left, bottom_right, _ = self.detect_template(screen, templates[template_key], roi=roi, threshold=threshold,
+                                                         template_key=template_key if use_prior else None)
         if top_left and bottom_right:
             if click:
-                # 여백을 10픽셀 주고 랜덤한 좌표 선택
-                random_x = random.randint(top_left[0] + _range, bottom_right[0] - _range)
-                random_y = random.randint(top_left[1] + _range, bottom_right[1] - _range)
-                self.input_controller.click(random_x, random_y)
+                self._click_in_box(top_left, bottom_right, _range)
             return True
         return False
 
-    async def extract_text(self, screen, template, threshold=0.8, roi=None):
+    async def extract_text(self, screen, template, threshold=0.8, roi=None, digit_recognizer=None):
         """이미지에서 텍스트 추출
         
         Args:
@@ -119,6 +567,8 @@ class ImageMatcher:
             template: 텍스트 영역 템플릿
             threshold: 매칭 임계값 (기본값: 0.8)
             roi: 관심 영역 (x1, y1, x2, y2)
+            digit_recognizer: 숫자열 인식기 - 주어지면 먼저 숫자 인식을 시도하고
+                              신뢰도가 낮을 때만 OCR 수행 (OCR 결과는 통과가 확인될 때까지 보관만 함)
             
         Returns:
             str: 추출된 텍스트
@@ -129,7 +579,7 @@ class ImageMatcher:
                 screen = screen[y1:y2, x1:x2].copy()
 
             # 텍스트 영역 찾기
-            top_left, bottom_right, max_val = self.detect_template(screen, template, threshold)
+            top_left, bottom_right, max_val = await self.detect_template_async(screen, template, threshold)
             if not top_left or not bottom_right:
                 return None
 
@@ -138,12 +588,32 @@ class ImageMatcher:
             x2, y2 = bottom_right
             text_roi = screen[y1:y2, x1:x2]
 
-            # OCR 수행
-            results = self.reader.readtext(text_roi)
-            if results:
-                text = ''.join([result[1] for result in results])
+            # 숫자 인식기로 먼저 인식 (신뢰도가 충분하면 OCR 생략)
+            if digit_recognizer is not None:
+                text, confidence = digit_recognizer.recognize(text_roi)
+                if text:
+                    return text
+                print(f"숫자 인식 신뢰도 낮음({confidence:.2f}) - OCR로 인식")
+
+            # 같은 픽셀을 이미 OCR했다면 캐시된 결과 사용
+            cache_key = self.ocr_cache.make_key(text_roi, self.ocr.languages)
+            cached, text = self.ocr_cache.get(cache_key)
+            if cached:
+                if digit_recognizer is not None:
+                    digit_recognizer.remember(text_roi, text.replace(' ', '') if text else None)
                 return text
-            return None
+
+            # OCR 수행
+            # 로드에 실패했으면 이벤트 루프에서 다시 로드하지 않도록 인식 실패로 처리
+            if not await self.ocr.wait_ready():
+                print("OCR 모델이 준비되지 않아 텍스트를 인식하지 못했습니다.")
+                return None
+            results = await self._run_in_executor(self.reader.readtext, text_roi)
+            text = ''.join([result[1] for result in results]) if results else None
+            self.ocr_cache.put(cache_key, text)
+            if digit_recognizer is not None:
+                digit_recognizer.remember(text_roi, text.replace(' ', '') if text else None)
+            return text
 
         except Exception as e:
             self.error_handler.handle_error(e, "텍스트 추출 중 오류 발생")
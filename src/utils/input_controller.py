@@ -6,11 +6,13 @@ class InputController:
     def __init__(self):
         pyautogui.FAILSAFE = True
         self.default_delay = 0.1
+        self.last_action_time = 0.0  # 마지막 입력 동작 시각 (time.monotonic(), 이후에 캡처된 프레임만 사용하기 위함)
 
     def click(self, x, y, clicks=1):
         """마우스 클릭"""
         try:
             pyautogui.click(x=x, y=y, clicks=clicks)
+            self.last_action_time = time.monotonic()
             time.sleep(self.default_delay)
             return True
         except Exception as e:
@@ -21,6 +23,7 @@ class InputController:
         """마우스 이동"""
         try:
             pyautogui.moveTo(x, y)
+            self.last_action_time = time.monotonic()
             time.sleep(self.default_delay)
             return True
         except Exception as e:
@@ -31,6 +34,7 @@ class InputController:
         """키 입력"""
         try:
             keyboard.press_and_release(key)
+            self.last_action_time = time.monotonic()
             time.sleep(self.default_delay)
             return True
         except Exception as e:
@@ -49,6 +53,7 @@ class InputController:
             for key in reversed(args):
                 keyboard.release(key)
                 time.sleep(0.1)
+            self.last_action_time = time.monotonic()
             
             time.sleep(self.default_delay)
             return True
@@ -66,6 +71,7 @@ class InputController:
         """텍스트 입력"""
         try:
             pyautogui.typewrite(text, interval=0.05)
+            self.last_action_time = time.monotonic()
             time.sleep(self.default_delay)
             return True
         except Exception as e:
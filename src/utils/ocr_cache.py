@@ -0,0 +1,65 @@
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+
+
+class OCRCache:
+    """잘라낸 이미지 픽셀 해시를 키로 OCR 결과를 보관하는 LRU 캐시
+
+    같은 픽셀에 대한 OCR은 항상 같은 결과를 내므로, 화면이 바뀌지 않은 동안
+    반복되는 OCR 호출을 캐시된 결과로 대체합니다.
+    """
+
+    def __init__(self, max_size=128):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(image, languages):
+        """이미지 픽셀과 OCR 언어 목록으로 캐시 키 생성"""
+        image = np.ascontiguousarray(image)
+        digest = hashlib.blake2b(image.tobytes(), digest_size=16)
+        digest.update(str(image.shape).encode())
+        return digest.hexdigest(), tuple(languages)
+
+    def get(self, key):
+        """캐시된 결과 조회
+
+        Returns:
+            tuple: (cached, value) - cached가 False이면 OCR이 필요함
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        """OCR 결과 저장 (최대 크기를 넘으면 가장 오래 사용하지 않은 항목 제거)"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """캐시 통계 반환"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total) if total else 0.0,
+            }
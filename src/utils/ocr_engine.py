@@ -0,0 +1,96 @@
+import asyncio
+import threading
+
+
+class OCREngine:
+    """프로세스 전체에서 공유하는 OCR 리더 (지연 생성 싱글톤)
+
+    easyocr 모델 로드는 수 초가 걸리므로 import 시점이 아니라 처음 필요할 때,
+    또는 warm_up()으로 시작한 백그라운드 스레드에서 한 번만 로드합니다.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, languages=None):
+        if OCREngine._instance is not None:
+            raise Exception("This class is a singleton!")
+
+        self.languages = languages or ['en', 'ko']
+        self._reader = None
+        self._error = None
+        self._load_lock = threading.Lock()
+        self._ready = threading.Event()  # 현재 로드 시도가 끝나면 set (시도마다 새로 생성)
+        self._warm_up_thread = None
+
+    @classmethod
+    def get_instance(cls):
+        """싱글톤 인스턴스 반환"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _load(self):
+        """OCR 모델 로드 (한 번만 수행)"""
+        with self._load_lock:
+            if self._reader is not None:
+                return self._reader
+            try:
+                import easyocr
+                print("OCR 모델 로드 시작")
+                self._reader = easyocr.Reader(self.languages)  # OCR 리더 초기화
+                self._error = None
+                print("OCR 모델 로드 완료")
+            except Exception as e:
+                self._error = e
+                print(f"OCR 모델 로드 중 오류 발생: {e}")
+                raise
+            finally:
+                self._ready.set()
+            return self._reader
+
+    def warm_up(self):
+        """백그라운드 스레드에서 OCR 모델 로드 시작 (이미 시작했으면 무시)"""
+        if self._reader is not None or (self._warm_up_thread is not None and self._warm_up_thread.is_alive()):
+            return
+        if self._ready.is_set():
+            # 이전 시도가 실패한 경우 - 이미 끝난 시도를 기다리던 쪽에 영향을 주지 않도록 새 이벤트로 다시 시도
+            self._ready = threading.Event()
+
+        def _run():
+            try:
+                self._load()
+            except Exception:
+                pass
+
+        self._warm_up_thread = threading.Thread(target=_run, name="ocr-warm-up", daemon=True)
+        self._warm_up_thread.start()
+
+    def is_ready(self):
+        """OCR 모델이 로드되었는지 여부"""
+        return self._reader is not None
+
+    async def wait_ready(self, timeout=None):
+        """OCR 모델 로드가 끝날 때까지 이벤트 루프를 막지 않고 대기
+
+        워밍업이 시작되지 않았다면 여기서 시작합니다.
+
+        Returns:
+            bool: 로드 성공 여부
+        """
+        if self._reader is not None:
+            return True
+        self.warm_up()
+        ready = self._ready
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, ready.wait, timeout)
+        return self._reader is not None
+
+    @property
+    def reader(self):
+        """OCR 리더 반환 (로드되지 않았으면 현재 스레드에서 로드)"""
+        if self._reader is not None:
+            return self._reader
+        return self._load()
@@ -0,0 +1,296 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+
+
+def _attach_shared_memory(name):
+    """다른 프로세스가 만든 공유 메모리 블록에 연결
+
+    연결만 하는 쪽이 종료될 때 블록이 지워지지 않도록 resource_tracker 추적을 끕니다.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        if os.name != "posix":
+            return shared_memory.SharedMemory(name=name)
+        # 작업 프로세스는 메인 프로세스와 resource_tracker를 공유하므로 연결 시 등록하지 않음
+        from multiprocessing import resource_tracker
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args, **kwargs: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def _read_shared_array(desc, copy):
+    """공유 메모리 설명자 (name, shape, dtype)로 배열 생성
+
+    Returns:
+        tuple: (block, array) - copy=True이면 block은 이미 닫힌 상태(None)
+    """
+    name, shape, dtype = desc
+    block = _attach_shared_memory(name)
+    array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    if copy:
+        array = array.copy()
+        block.close()
+        return None, array
+    return block, array
+
+
+# ---- 작업 프로세스 쪽 상태 ----
+_worker_matcher = None
+_worker_templates = OrderedDict()  # 템플릿 다이제스트 -> 작업 프로세스가 보유한 템플릿 배열 (오래 사용하지 않은 순)
+WORKER_TEMPLATE_LIMIT = 128  # 작업 프로세스가 보관하는 최대 템플릿 수 (교체/제거된 템플릿이 계속 쌓이지 않도록)
+
+
+def _init_worker(template_descs, coarse_to_fine):
+    """작업 프로세스 초기화 - 매처를 만들고 이미 공개된 템플릿을 미리 로드
+
+    작업 프로세스는 매칭에 필요한 모듈만 import합니다. (ImageMatcher는 입력/오류 처리/DB 모듈을
+    실제로 사용할 때만 import하므로, 컨트롤러나 pyautogui/keyboard 상태를 만들지 않습니다.)
+    """
+    global _worker_matcher
+    from src.utils.image_matcher import ImageMatcher
+
+    _worker_matcher = ImageMatcher(match_processes=0)
+    _worker_matcher.use_priors = False  # prior 학습/저장은 메인 프로세스만 담당
+    _worker_matcher.frame_gating = False
+    _worker_matcher.coarse_to_fine = coarse_to_fine
+    for digest, desc in template_descs.items():
+        _worker_template(digest, desc)
+
+
+def _worker_template(digest, desc):
+    """작업 프로세스의 템플릿 반환 (처음 사용하는 템플릿이면 공유 메모리에서 복사하고 스케일별 이미지 생성)"""
+    template = _worker_templates.get(digest)
+    if template is None:
+        _, template = _read_shared_array(desc, copy=True)
+        _worker_templates[digest] = template
+        _worker_matcher.pyramid.build(template)
+        while len(_worker_templates) > WORKER_TEMPLATE_LIMIT:
+            _, old = _worker_templates.popitem(last=False)
+            _worker_matcher.pyramid.invalidate(old)
+    else:
+        _worker_templates.move_to_end(digest)
+    return template
+
+
+def _match_job(frame_desc, template_keys, template_refs, threshold, roi, first_only, coarse_to_fine):
+    """작업 프로세스에서 실행되는 매칭 작업
+
+    Args:
+        frame_desc: 화면이 담긴 공유 메모리 설명자
+        template_keys: 탐지할 템플릿 키 목록 (우선순위 순)
+        template_refs: {template_key: [(digest, desc), ...]}
+
+    Returns:
+        dict: detect_templates와 같은 {template_key: (top_left, bottom_right, max_val)}
+    """
+    templates = {
+        key: [_worker_template(digest, desc) for digest, desc in refs]
+        for key, refs in template_refs.items()
+    }
+    block, screen = _read_shared_array(frame_desc, copy=False)
+    try:
+        return _worker_matcher.detect_templates(screen, template_keys, templates, threshold=threshold, roi=roi,
+                                                first_only=first_only, coarse_to_fine=coarse_to_fine)
+    finally:
+        del screen
+        block.close()
+
+
+class ProcessMatchEngine:
+    """여러 작업 프로세스에서 템플릿 매칭을 수행하는 엔진
+
+    캡처한 화면은 pickle로 전달하지 않고 공유 메모리 블록에 한 번 복사하여 전달하며,
+    템플릿은 내용 해시 단위로 공유 메모리에 한 번만 공개합니다. 각 작업 프로세스는
+    템플릿과 스케일별 이미지를 자체적으로 보관하므로 이후 작업에는 이름만 전달됩니다.
+    """
+
+    def __init__(self, processes=2, coarse_to_fine=False):
+        """
+        Args:
+            processes: 작업 프로세스 수
+            coarse_to_fine: 작업 프로세스 매처의 기본 축소 탐색 여부
+        """
+        self.processes = processes
+        self.coarse_to_fine = coarse_to_fine
+        self._pool = None
+        self._lock = threading.Lock()
+        self._template_refs = {}  # id(template) -> (template, digest)
+        self._template_blocks = {}  # digest -> (block, desc)
+        self._free_blocks = {}  # nbytes -> [재사용 가능한 화면 블록, ...]
+        self._inflight = 0  # 실행 중인 작업 수
+        self._pending_unlink = []  # 실행 중인 작업이 끝나면 해제할 템플릿 블록
+        self.stats = {"jobs": 0, "frames_shared": 0, "frame_blocks_created": 0, "frame_bytes_shared": 0,
+                      "templates_shared": 0, "template_bytes_shared": 0, "templates_released": 0}
+
+    # ---- 공유 메모리 관리 ----
+    def _share_template(self, template):
+        """템플릿을 공유 메모리에 공개하고 (digest, desc) 반환 (이미 공개된 템플릿은 재사용)"""
+        ref = self._template_refs.get(id(template))
+        if ref is not None and ref[0] is template:
+            digest = ref[1]
+        else:
+            contiguous = np.ascontiguousarray(template)
+            digest = hashlib.blake2b(contiguous.tobytes(), digest_size=16)
+            digest.update(str(contiguous.shape).encode())
+            digest = digest.hexdigest()
+            self._template_refs[id(template)] = (template, digest)
+            template = contiguous
+
+        shared = self._template_blocks.get(digest)
+        if shared is None:
+            block = shared_memory.SharedMemory(create=True, size=max(1, template.nbytes))
+            np.ndarray(template.shape, dtype=template.dtype, buffer=block.buf)[...] = template
+            shared = (block, (block.name, template.shape, template.dtype.str))
+            self._template_blocks[digest] = shared
+            self.stats["templates_shared"] += 1
+            self.stats["template_bytes_shared"] += template.nbytes
+        return digest, shared[1]
+
+    def release(self, template):
+        """더 이상 사용하지 않는 템플릿의 참조와 공유 메모리 블록 해제
+
+        같은 내용을 가리키는 다른 템플릿이 남아 있으면 블록은 유지하고,
+        실행 중인 작업이 있으면 작업이 끝난 뒤 블록을 해제합니다.
+        """
+        with self._lock:
+            ref = self._template_refs.get(id(template))
+            if ref is None or ref[0] is not template:
+                return
+            del self._template_refs[id(template)]
+            digest = ref[1]
+            if any(other == digest for _, other in self._template_refs.values()):
+                return
+            shared = self._template_blocks.pop(digest, None)
+            if shared is not None:
+                self._pending_unlink.append(shared[0])
+                self.stats["templates_released"] += 1
+            self._unlink_released()
+
+    def _unlink_released(self):
+        """실행 중인 작업이 없으면 해제 대기 중인 템플릿 블록 삭제 (lock을 잡은 상태에서 호출)"""
+        if self._inflight:
+            return
+        for block in self._pending_unlink:
+            self._destroy_block(block)
+        self._pending_unlink.clear()
+
+    def _share_frame(self, screen):
+        """화면을 공유 메모리 블록에 복사 (같은 크기의 블록이 남아 있으면 재사용)
+
+        Returns:
+            tuple: (block, nbytes, desc)
+        """
+        screen = np.ascontiguousarray(screen)
+        nbytes = max(1, screen.nbytes)
+        free = self._free_blocks.get(nbytes)
+        if free:
+            block = free.pop()
+        else:
+            block = shared_memory.SharedMemory(create=True, size=nbytes)
+            self.stats["frame_blocks_created"] += 1
+        np.ndarray(screen.shape, dtype=screen.dtype, buffer=block.buf)[...] = screen
+        self.stats["frames_shared"] += 1
+        self.stats["frame_bytes_shared"] += screen.nbytes
+        return block, nbytes, (block.name, screen.shape, screen.dtype.str)
+
+    def _release_frame(self, block, nbytes):
+        """작업이 끝난 화면 블록을 재사용 목록에 반환 (블록 크기는 OS에 따라 올림되므로 요청 크기로 관리)"""
+        with self._lock:
+            self._inflight -= 1
+            self._unlink_released()
+            if self._pool is None:
+                self._destroy_block(block)
+                return
+            self._free_blocks.setdefault(nbytes, []).append(block)
+
+    @staticmethod
+    def _destroy_block(block):
+        try:
+            block.close()
+            block.unlink()
+        except FileNotFoundError:
+            pass
+
+    # ---- 작업 제출 ----
+    def _get_pool(self):
+        if self._pool is None:
+            template_descs = {digest: desc for digest, (_, desc) in self._template_blocks.items()}
+            self._pool = ProcessPoolExecutor(max_workers=self.processes, initializer=_init_worker,
+                                             initargs=(template_descs, self.coarse_to_fine))
+        return self._pool
+
+    def preload(self, templates):
+        """템플릿을 미리 공유 메모리에 공개 (작업 프로세스 시작 시 함께 로드됨)
+
+        Args:
+            templates: 템플릿 이미지 또는 템플릿 이미지 리스트
+        """
+        if not isinstance(templates, list):
+            templates = [templates]
+        with self._lock:
+            for template in templates:
+                self._share_template(template)
+
+    def submit(self, screen, template_keys, templates, threshold=0.8, roi=None, first_only=True, coarse_to_fine=None):
+        """매칭 작업을 작업 프로세스에 제출
+
+        Args:
+            screen: 검색할 스크린샷 이미지
+            template_keys: 탐지할 템플릿 키 목록 (우선순위 순)
+            templates: 템플릿 딕셔너리
+
+        Returns:
+            concurrent.futures.Future: detect_templates와 같은 결과 딕셔너리를 반환하는 Future
+        """
+        with self._lock:
+            template_refs = {}
+            for key in template_keys:
+                if key not in templates:
+                    continue
+                key_templates = templates[key]
+                if not isinstance(key_templates, list):
+                    key_templates = [key_templates]
+                template_refs[key] = [self._share_template(template) for template in key_templates]
+
+            pool = self._get_pool()
+            block, nbytes, frame_desc = self._share_frame(screen)
+            self._inflight += 1
+            self.stats["jobs"] += 1
+
+        try:
+            future = pool.submit(_match_job, frame_desc, list(template_keys), template_refs, threshold, roi,
+                                 first_only, coarse_to_fine)
+        except Exception:
+            self._release_frame(block, nbytes)
+            raise
+        future.add_done_callback(lambda _: self._release_frame(block, nbytes))
+        return future
+
+    def close(self):
+        """작업 프로세스를 종료하고 공유 메모리 블록 해제"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+        with self._lock:
+            for blocks in self._free_blocks.values():
+                for block in blocks:
+                    self._destroy_block(block)
+            self._free_blocks.clear()
+            for block, _ in self._template_blocks.values():
+                self._destroy_block(block)
+            self._template_blocks.clear()
+            for block in self._pending_unlink:
+                self._destroy_block(block)
+            self._pending_unlink.clear()
+            self._template_refs.clear()
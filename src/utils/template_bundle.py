@@ -0,0 +1,151 @@
+import os
+import json
+import struct
+import hashlib
+import numpy as np
+
+MAGIC = b"TMPLBNDL"
+VERSION = 1
+ALIGNMENT = 64
+_HEADER = struct.Struct("<8sIQ")  # magic, version, JSON 헤더 길이
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def content_hash(content):
+    """원본 이미지 파일 내용의 해시 (번들 항목이 서버 파일과 같은지 비교할 때 사용)"""
+    return hashlib.sha256(content).hexdigest()
+
+
+def build_bundle(output_path, templates, pyramid, metadata=None, sources=None, source_paths=None):
+    """디코딩된 템플릿과 스케일별 이미지를 하나의 번들 파일로 저장
+
+    파일 구조: [매직/버전/헤더 길이][JSON 헤더][64바이트 정렬된 uint8 배열들]
+
+    Args:
+        output_path: 번들 파일 경로
+        templates: {template_path: 흑백 템플릿 이미지}
+        pyramid: 스케일별 이미지를 만들 TemplatePyramid
+        metadata: {template_path: {"threshold": 0.8, "roi": [x1, y1, x2, y2], ...}} 템플릿별 부가 정보
+        sources: {template_path: 원본 이미지 파일 내용(bytes)} - 해시를 저장해 두고 로드할 때 서버 파일과 비교
+        source_paths: {template_path: 실제로 받은 서버 경로} - 확장자(.png/.PNG)가 다른 경우 등 (없으면 template_path)
+
+    Returns:
+        int: 저장된 번들 파일 크기 (바이트)
+    """
+    metadata = metadata or {}
+    sources = sources or {}
+    source_paths = source_paths or {}
+    arrays = []  # (offset, array)
+    entries = {}
+    offset = 0
+
+    def place(array):
+        nonlocal offset
+        array = np.ascontiguousarray(array, dtype=np.uint8)
+        offset = _align(offset)
+        arrays.append((offset, array))
+        placed = {"offset": offset, "shape": list(array.shape)}
+        offset += array.nbytes
+        return placed
+
+    for template_path, template in templates.items():
+        entry = place(template)
+        entry["levels"] = []
+        for scale, resized, r in pyramid.build(template):
+            level = place(resized)
+            level.update(scale=scale, r=r)
+            entry["levels"].append(level)
+        entry["meta"] = metadata.get(template_path, {})
+        if template_path in sources:
+            entry["sha256"] = content_hash(sources[template_path])
+        entry["source"] = source_paths.get(template_path, template_path)
+        entries[template_path] = entry
+
+    header = json.dumps({
+        "version": VERSION,
+        "scales": [float(scale) for scale in pyramid.scales],
+        "templates": entries,
+    }).encode('utf-8')
+    data_start = _align(_HEADER.size + len(header))
+
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(header)))
+        f.write(header)
+        for array_offset, array in arrays:
+            f.seek(data_start + array_offset)
+            f.write(array.tobytes())
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, output_path)
+    return data_start + offset
+
+
+class TemplateBundle:
+    """build_bundle로 만든 번들 파일을 메모리 매핑하여 템플릿을 제공하는 로더
+
+    배열은 파일을 np.memmap으로 매핑한 읽기 전용 뷰이므로 PNG 디코딩이 없고,
+    여러 프로세스가 같은 번들을 열어도 OS 페이지 캐시의 한 복사본을 공유합니다.
+    항목마다 원본 파일의 해시를 보관하므로, 서버에서 받은 파일과 같을 때만 번들을 사용할 수 있습니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            magic, version, header_length = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"지원하지 않는 템플릿 번들 형식입니다: {path}")
+            header = json.loads(f.read(header_length).decode('utf-8'))
+
+        self.scales = header["scales"]
+        self._entries = header["templates"]
+        self._data_start = _align(_HEADER.size + header_length)
+        self._mmap = np.memmap(path, dtype=np.uint8, mode='r')
+
+    @classmethod
+    def open(cls, path):
+        """번들 파일이 있으면 열고, 없거나 읽을 수 없으면 None 반환"""
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except Exception as e:
+            print(f"템플릿 번들 로드 중 오류 발생 ({path}): {e}")
+            return None
+
+    def __contains__(self, template_path):
+        return template_path in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def keys(self):
+        return self._entries.keys()
+
+    def _view(self, placed):
+        start = self._data_start + placed["offset"]
+        height, width = placed["shape"]
+        return self._mmap[start:start + height * width].reshape(height, width)
+
+    def get(self, template_path):
+        """템플릿 이미지 (읽기 전용 메모리 매핑 뷰)"""
+        return self._view(self._entries[template_path])
+
+    def levels(self, template_path):
+        """미리 계산된 스케일별 이미지 목록 [(scale, resized, r), ...]"""
+        return [(level["scale"], self._view(level), level["r"]) for level in self._entries[template_path]["levels"]]
+
+    def source(self, template_path):
+        """번들 항목을 받은 서버 경로 (IMG_URL 뒤에 붙여 URL을 만듦)"""
+        return self._entries[template_path].get("source", template_path)
+
+    def matches(self, template_path, content):
+        """번들 항목이 주어진 원본 파일 내용으로 만들어졌는지 확인 (해시가 없는 항목은 False)"""
+        expected = self._entries[template_path].get("sha256")
+        return expected is not None and expected == content_hash(content)
+
+    def metadata(self, template_path):
+        """템플릿별 부가 정보 (임계값, ROI 힌트 등)"""
+        return self._entries[template_path].get("meta", {})
@@ -0,0 +1,174 @@
+import os
+import json
+import time
+import hashlib
+import asyncio
+import threading
+import aiohttp
+import requests
+
+
+class TemplateDiskCache:
+    """URL 단위로 템플릿 이미지를 로컬 디렉터리에 보관하는 캐시
+
+    캐시된 파일이 있으면 ETag/Last-Modified로 조건부 요청을 보내 변경된 경우에만 다시 받고,
+    서버에 연결할 수 없으면 캐시된 파일을 그대로 사용하여 오프라인에서도 시작할 수 있게 합니다.
+    파일은 임시 파일에 먼저 기록한 뒤 이름을 바꿔 저장하므로 중간에 종료되어도 깨지지 않습니다.
+    """
+
+    def __init__(self, cache_dir=None, timeout=5, offline_retry=60):
+        """
+        Args:
+            cache_dir: 캐시 디렉터리 (None이면 TEMPLATE_CACHE_DIR 환경변수, 기본값 template_cache)
+            timeout: 요청 제한 시간(초)
+            offline_retry: 서버 연결 실패 후 이 시간(초) 동안은 요청 없이 캐시만 사용
+        """
+        self.cache_dir = cache_dir or os.getenv("TEMPLATE_CACHE_DIR", "template_cache")
+        self.timeout = timeout
+        self.offline_retry = offline_retry
+        self._offline_until = 0.0
+        self._lock = threading.Lock()
+        self.stats = {"downloaded": 0, "revalidated": 0, "offline_hits": 0}
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _paths(self, url):
+        """URL에 해당하는 (이미지 파일 경로, 메타데이터 파일 경로)"""
+        name = hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]
+        base = os.path.join(self.cache_dir, name)
+        return base + ".bin", base + ".json"
+
+    @staticmethod
+    def _write_atomic(path, data):
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _read_cached(self, url):
+        """캐시된 (내용, 메타데이터) 반환 (없으면 (None, {}))"""
+        data_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(data_path, 'rb') as f:
+                return f.read(), meta
+        except (OSError, ValueError):
+            return None, {}
+
+    def cached(self, url):
+        """마지막으로 받은(재검증된) 내용을 요청 없이 반환 (캐시에 없으면 None)"""
+        return self._read_cached(url)[0]
+
+    def store(self, url, content, etag=None, last_modified=None):
+        """내려받은 내용과 검증 헤더를 캐시에 저장 (내용을 먼저 쓰고 메타데이터를 나중에 씀)"""
+        data_path, meta_path = self._paths(url)
+        meta = {"url": url, "etag": etag, "last_modified": last_modified, "stored_at": time.time()}
+        self._write_atomic(data_path, content)
+        self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+
+    def conditional_headers(self, meta):
+        """캐시 메타데이터로 조건부 요청 헤더 생성"""
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def is_offline(self):
+        return time.monotonic() < self._offline_until
+
+    def mark_offline(self):
+        """서버 연결 실패 기록 - offline_retry 동안은 캐시만 사용"""
+        self._offline_until = time.monotonic() + self.offline_retry
+
+    def fetch(self, url):
+        """URL의 내용을 캐시를 거쳐 반환
+
+        Args:
+            url: 템플릿 이미지 URL
+
+        Returns:
+            bytes: 이미지 파일 내용
+
+        Raises:
+            requests.RequestException: 다운로드에 실패했고 캐시된 파일도 없는 경우
+        """
+        cached, meta = self._read_cached(url)
+
+        if cached is not None and self.is_offline():
+            self.stats["offline_hits"] += 1
+            return cached
+
+        try:
+            response = requests.get(url, headers=self.conditional_headers(meta) if cached is not None else {},
+                                    timeout=self.timeout)
+            if response.status_code == 304 and cached is not None:
+                self.stats["revalidated"] += 1
+                return cached
+            response.raise_for_status()
+        except (requests.ConnectionError, requests.Timeout) as e:
+            self.mark_offline()
+            if cached is None:
+                raise
+            print(f"템플릿 서버에 연결할 수 없어 캐시된 파일 사용: {url} ({e})")
+            self.stats["offline_hits"] += 1
+            return cached
+        except requests.HTTPError as e:
+            # 서버 오류(5xx)는 캐시로 대체하고, 404 등 요청 오류는 그대로 전달
+            if cached is None or e.response is None or e.response.status_code < 500:
+                raise
+            print(f"템플릿 서버 오류로 캐시된 파일 사용: {url} ({e})")
+            self.stats["offline_hits"] += 1
+            return cached
+
+        with self._lock:
+            self.store(url, response.content, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        self.stats["downloaded"] += 1
+        return response.content
+
+    async def fetch_async(self, session, url):
+        """fetch의 비동기 버전 - 공유 aiohttp 세션으로 요청
+
+        Args:
+            session: aiohttp.ClientSession
+            url: 템플릿 이미지 URL
+
+        Returns:
+            bytes: 이미지 파일 내용
+
+        Raises:
+            aiohttp.ClientError: 다운로드에 실패했고 캐시된 파일도 없는 경우
+        """
+        cached, meta = self._read_cached(url)
+
+        if cached is not None and self.is_offline():
+            self.stats["offline_hits"] += 1
+            return cached
+
+        try:
+            headers = self.conditional_headers(meta) if cached is not None else {}
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            async with session.get(url, headers=headers, timeout=timeout) as response:
+                if response.status == 304 and cached is not None:
+                    self.stats["revalidated"] += 1
+                    return cached
+                if response.status >= 500 and cached is not None:
+                    print(f"템플릿 서버 오류로 캐시된 파일 사용: {url} (상태 코드 {response.status})")
+                    self.stats["offline_hits"] += 1
+                    return cached
+                response.raise_for_status()
+                content = await response.read()
+                etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            self.mark_offline()
+            if cached is None:
+                raise aiohttp.ClientConnectionError(f"템플릿 서버 연결 실패: {url} ({e})") from e
+            print(f"템플릿 서버에 연결할 수 없어 캐시된 파일 사용: {url} ({e})")
+            self.stats["offline_hits"] += 1
+            return cached
+
+        with self._lock:
+            self.store(url, content, etag, last_modified)
+        self.stats["downloaded"] += 1
+        return content
@@ -0,0 +1,147 @@
+import os
+import json
+import threading
+
+
+class TemplateManifest:
+    """버전이 있는 템플릿 목록
+
+    파일 형식:
+        {
+            "version": 3,
+            "templates": {
+                "otp_frame": {"path": "/otpFrame.PNG", "hash": "선택 - 이미지가 바뀌면 함께 변경"},
+                "password_screen": "/passwordScreen.png"
+            }
+        }
+    """
+
+    def __init__(self, version, entries, base_dir=None):
+        """
+        Args:
+            version: 매니페스트 버전 (클수록 최신)
+            entries: {template_key: {"path": ..., "hash": ...}}
+            base_dir: 로컬 이미지 파일을 찾을 디렉터리 (매니페스트 파일 위치)
+        """
+        self.version = version
+        self.entries = entries
+        self.base_dir = base_dir
+
+    @classmethod
+    def load(cls, file_path):
+        """매니페스트 파일 읽기"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        entries = {}
+        for key, entry in data.get("templates", {}).items():
+            if isinstance(entry, str):
+                entry = {"path": entry}
+            if not entry.get("path"):
+                raise ValueError(f"템플릿 경로가 없습니다: {key}")
+            entries[key] = {"path": entry["path"], "hash": entry.get("hash")}
+        return cls(int(data.get("version", 0)), entries, os.path.dirname(os.path.abspath(file_path)))
+
+    @property
+    def paths(self):
+        """{template_key: template_path}"""
+        return {key: entry["path"] for key, entry in self.entries.items()}
+
+    def local_file(self, template_path):
+        """매니페스트 옆에 있는 로컬 이미지 파일 경로 (없으면 None)"""
+        if self.base_dir is None:
+            return None
+        local_path = os.path.join(self.base_dir, template_path.lstrip('/'))
+        return local_path if os.path.isfile(local_path) else None
+
+    def missing_keys(self, required_keys):
+        """매니페스트에 없는 필수 템플릿 키 목록"""
+        return [key for key in required_keys if key not in self.entries]
+
+    def changed_keys(self, previous):
+        """이전 매니페스트와 비교하여 경로나 해시가 바뀐(또는 새로 추가된) 템플릿 키 목록"""
+        if previous is None:
+            return list(self.entries)
+        return [key for key, entry in self.entries.items() if previous.entries.get(key) != entry]
+
+
+class TemplateManifestWatcher:
+    """매니페스트 파일을 주기적으로 확인하여 더 높은 버전이 올라오면 콜백을 호출하는 감시자
+
+    콜백은 감시 스레드에서 호출되므로, 무거운 로드 작업이 진행 중인 세션을 멈추지 않습니다.
+    필수 키가 빠진 매니페스트는 적용하지 않고, 파일이 다시 바뀔 때까지 다시 읽지 않습니다.
+    """
+
+    def __init__(self, file_path, on_change, interval=10.0, required_keys=()):
+        """
+        Args:
+            file_path: 매니페스트 파일 경로
+            on_change: 새 버전을 발견했을 때 호출할 함수 (TemplateManifest를 인자로 받음)
+            interval: 확인 주기(초)
+            required_keys: 매니페스트에 반드시 있어야 하는 템플릿 키 목록
+        """
+        self.file_path = file_path
+        self.on_change = on_change
+        self.interval = interval
+        self.required_keys = list(required_keys)
+        self.version = None
+        self._mtime = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def check(self):
+        """매니페스트 파일이 바뀌었고 버전이 올라갔으면 콜백 호출
+
+        Returns:
+            bool: 콜백 호출 여부
+        """
+        try:
+            mtime = os.path.getmtime(self.file_path)
+        except OSError:
+            return False
+        if mtime == self._mtime:
+            return False
+
+        try:
+            manifest = TemplateManifest.load(self.file_path)
+        except Exception as e:
+            print(f"템플릿 매니페스트 읽기 실패 ({self.file_path}): {e}")
+            return False
+
+        if self.version is not None and manifest.version <= self.version:
+            self._mtime = mtime
+            return False
+
+        missing = manifest.missing_keys(self.required_keys)
+        if missing:
+            print(f"템플릿 매니페스트 버전 {manifest.version}에 필수 키가 없어 적용하지 않습니다 ({self.file_path}): {missing}")
+            self._mtime = mtime
+            return False
+
+        try:
+            self.on_change(manifest)
+        except Exception as e:
+            # 파일 변경 시각을 기록하지 않으므로 다음 확인 때 다시 시도
+            print(f"템플릿 매니페스트 적용 실패 (버전 {manifest.version}): {e}")
+            return False
+        self._mtime = mtime
+        self.version = manifest.version
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def start(self):
+        """감시 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="template-manifest", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval)
+            self._thread = None
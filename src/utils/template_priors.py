@@ -0,0 +1,142 @@
+import json
+import os
+import time
+import threading
+
+
+class TemplatePriors:
+    """템플릿별/해상도별로 마지막으로 매칭된 스케일과 위치를 기억하는 저장소
+
+    같은 원격 PC에서는 템플릿이 거의 같은 스케일, 같은 위치에서 탐지되므로
+    기억해 둔 스케일과 위치 주변을 먼저 탐색하고, 실패한 경우에만 전체 탐색을 수행합니다.
+    학습된 값은 파일에 저장되어 재시작 후에도 유지됩니다.
+    파일 저장은 save_interval에 한 번으로 묶고, 남은 변경은 종료할 때 flush()로 저장합니다.
+    """
+    MOVE_TOLERANCE = 4  # 이 픽셀 이상 위치가 바뀌었을 때만 파일에 저장
+
+    def __init__(self, file_path="template_priors.json", save_interval=None):
+        """
+        Args:
+            file_path: prior 파일 경로
+            save_interval: 파일에 저장하는 최소 간격(초)
+        """
+        self.file_path = file_path
+        self.save_interval = save_interval if save_interval is not None else float(os.getenv("TEMPLATE_PRIORS_SAVE_INTERVAL", "30"))
+        self._priors = {}  # prior_key -> {"scale_index", "scale", "loc"}
+        self._stats = {}  # prior_key -> {"fast_hits", "fast_misses", "learned"}
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # 파일 쓰기 순서 보장 (나중에 만든 내용이 나중에 기록됨)
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        self._load()
+
+    @staticmethod
+    def make_key(template_key, screen_shape, index=0):
+        """템플릿 키와 화면 해상도로 prior 키 생성
+
+        위치는 전체 화면 좌표로 저장하므로 ROI는 키에 포함하지 않습니다.
+        """
+        height, width = screen_shape[:2]
+        key = f"{template_key}@{width}x{height}"
+        if index:
+            key += f"#{index}"
+        return key
+
+    def _load(self):
+        """파일에서 학습된 prior 로드"""
+        try:
+            if not os.path.exists(self.file_path):
+                return
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._priors = data.get("priors", {})
+            self._stats = data.get("stats", {})
+        except Exception as e:
+            print(f"템플릿 prior 로드 중 오류 발생: {e}")
+            self._priors = {}
+            self._stats = {}
+
+    def save(self):
+        """학습된 prior와 통계를 파일에 저장"""
+        with self._save_lock:
+            with self._lock:
+                data = {"priors": dict(self._priors), "stats": {k: dict(v) for k, v in self._stats.items()}}
+                self._dirty = False
+                self._saved_at = time.monotonic()
+            tmp_path = f"{self.file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.file_path)
+            except Exception as e:
+                print(f"템플릿 prior 저장 중 오류 발생: {e}")
+                with self._lock:
+                    self._dirty = True
+
+    def flush(self):
+        """저장하지 않은 변경이 있으면 파일에 저장 (종료 시 호출)"""
+        if self._dirty:
+            self.save()
+
+    def _stat(self, prior_key):
+        return self._stats.setdefault(prior_key, {"fast_hits": 0, "fast_misses": 0, "learned": 0})
+
+    def get(self, prior_key):
+        """prior 조회 (없으면 None)"""
+        if prior_key is None:
+            return None
+        with self._lock:
+            return self._priors.get(prior_key)
+
+    def record_hit(self, prior_key):
+        """prior 위치에서 바로 탐지에 성공한 경우"""
+        with self._lock:
+            self._stat(prior_key)["fast_hits"] += 1
+
+    def record_miss(self, prior_key):
+        """prior 위치에서 탐지에 실패하여 전체 탐색으로 넘어간 경우"""
+        with self._lock:
+            self._stat(prior_key)["fast_misses"] += 1
+
+    def learn(self, prior_key, scale_index, scale, loc):
+        """전체 탐색에서 찾은 스케일과 위치를 prior로 기록
+
+        Args:
+            prior_key: make_key로 생성한 키
+            scale_index: 피라미드에서의 스케일 인덱스
+            scale: 스케일 값
+            loc: (x, y) - 전체 화면 기준 좌상단 좌표
+        """
+        if prior_key is None:
+            return
+        with self._lock:
+            old = self._priors.get(prior_key)
+            self._priors[prior_key] = {"scale_index": int(scale_index), "scale": float(scale), "loc": [int(loc[0]), int(loc[1])]}
+            self._stat(prior_key)["learned"] += 1
+            if old is None or old["scale_index"] != int(scale_index) or \
+                    abs(old["loc"][0] - loc[0]) >= self.MOVE_TOLERANCE or abs(old["loc"][1] - loc[1]) >= self.MOVE_TOLERANCE:
+                self._dirty = True
+            due = self._dirty and time.monotonic() - self._saved_at >= self.save_interval
+        if due:
+            self.save()
+
+    def clear(self):
+        """모든 prior 제거"""
+        with self._lock:
+            self._priors.clear()
+            self._stats.clear()
+        self.save()
+
+    def stats(self):
+        """prior 키별 빠른 경로 성공/실패 통계 반환"""
+        with self._lock:
+            result = {}
+            for key, stat in self._stats.items():
+                total = stat["fast_hits"] + stat["fast_misses"]
+                result[key] = dict(stat, hit_rate=(stat["fast_hits"] / total) if total else 0.0)
+            return result
+
+    def export_stats(self, file_path):
+        """빠른 경로 통계를 JSON 파일로 내보내기"""
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.stats(), f, ensure_ascii=False, indent=2)
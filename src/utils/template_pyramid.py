@@ -0,0 +1,181 @@
+import threading
+import cv2
+import numpy as np
+from src.utils.template_stats import TemplateStats
+
+
+class TemplatePyramid:
+    """템플릿별 다중 스케일 이미지를 미리 만들어 두고 재사용하는 저장소
+
+    detect_template이 매 프레임마다 cv2.resize로 같은 템플릿을 반복 생성하지 않도록
+    템플릿 로드 시점에 스케일별 이미지를 한 번만 만들어 보관합니다.
+    """
+    SCALES = np.linspace(0.8, 1.0, 10)[::-1]
+
+    def __init__(self, scales=None):
+        self.scales = self.SCALES if scales is None else np.asarray(scales)
+        self._levels = {}  # id(template) -> (template, [(scale, resized, r), ...])
+        self._coarse = {}  # (id(template), factor) -> (template, [coarse or None, ...])
+        self._stats = {}  # id(template) -> (template, [TemplateStats, ...]) 스케일별 상관계수 통계
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _build_levels(self, template):
+        """템플릿의 스케일별 이미지 목록 생성"""
+        template_height, template_width = template.shape[:2]
+        levels = []
+        for scale in self.scales:
+            resized_template_width = int(template_width * scale)
+            resized_template_height = int(template_height * scale)
+            if resized_template_width < 1 or resized_template_height < 1:
+                continue
+
+            resized = cv2.resize(template, (resized_template_width, resized_template_height))
+            r = template_width / float(resized.shape[1])  # 비율 계산
+            levels.append((float(scale), resized, r))
+        return levels
+
+    def build(self, template):
+        """템플릿의 피라미드를 생성하여 저장 (이미 있으면 재사용)
+
+        Args:
+            template: 그레이스케일 템플릿 이미지
+
+        Returns:
+            list: (scale, resized, r) 튜플 목록 - 큰 스케일부터 정렬
+        """
+        key = id(template)
+        with self._lock:
+            entry = self._levels.get(key)
+            if entry is not None and entry[0] is template:
+                return entry[1]
+
+        levels = self._build_levels(template)
+        size = sum(resized.nbytes for _, resized, _ in levels)
+
+        with self._lock:
+            old = self._levels.get(key)
+            if old is not None:
+                self.total_bytes -= sum(resized.nbytes for _, resized, _ in old[1])
+            # 템플릿 참조를 함께 보관하여 id 재사용으로 인한 오매칭을 막음
+            self._levels[key] = (template, levels)
+            self.total_bytes += size
+        return levels
+
+    def register(self, template, levels):
+        """미리 계산된 스케일별 이미지 목록을 등록 (템플릿 번들 등에서 로드한 경우)
+
+        Args:
+            template: 그레이스케일 템플릿 이미지
+            levels: (scale, resized, r) 튜플 목록 - 이 저장소의 스케일과 같아야 함
+        """
+        if [round(scale, 6) for scale, _, _ in levels] != [round(float(scale), 6) for scale in self.scales]:
+            return self.build(template)
+
+        key = id(template)
+        with self._lock:
+            old = self._levels.get(key)
+            if old is not None:
+                self.total_bytes -= sum(resized.nbytes for _, resized, _ in old[1])
+            self._levels[key] = (template, list(levels))
+            self.total_bytes += sum(resized.nbytes for _, resized, _ in levels)
+        return levels
+
+    def get(self, template):
+        """템플릿의 피라미드 반환 (없으면 생성)"""
+        with self._lock:
+            entry = self._levels.get(id(template))
+            if entry is not None and entry[0] is template:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        return self.build(template)
+
+    def get_coarse(self, template, factor, min_size=8):
+        """coarse-to-fine 탐색용 축소 템플릿 목록 반환 (없으면 생성)
+
+        Args:
+            template: 그레이스케일 템플릿 이미지
+            factor: 축소 비율 (예: 0.5)
+            min_size: 축소 후 최소 변 길이 - 이보다 작으면 해당 스케일은 None
+
+        Returns:
+            list: get()의 스케일 순서와 같은 축소 템플릿 목록
+        """
+        key = (id(template), factor)
+        with self._lock:
+            entry = self._coarse.get(key)
+            if entry is not None and entry[0] is template:
+                return entry[1]
+
+        coarse_levels = []
+        for _, resized, _ in self.get(template):
+            coarse_width = int(resized.shape[1] * factor)
+            coarse_height = int(resized.shape[0] * factor)
+            if coarse_width < min_size or coarse_height < min_size:
+                coarse_levels.append(None)
+                continue
+            coarse_levels.append(cv2.resize(resized, (coarse_width, coarse_height), interpolation=cv2.INTER_AREA))
+        size = sum(coarse.nbytes for coarse in coarse_levels if coarse is not None)
+
+        with self._lock:
+            old = self._coarse.get(key)
+            if old is not None:
+                self.total_bytes -= sum(coarse.nbytes for coarse in old[1] if coarse is not None)
+            self._coarse[key] = (template, coarse_levels)
+            self.total_bytes += size
+        return coarse_levels
+
+    def get_stats(self, template):
+        """스케일별 템플릿 통계 목록 반환 (get()의 스케일 순서와 같음, 없으면 생성)"""
+        key = id(template)
+        with self._lock:
+            entry = self._stats.get(key)
+            if entry is not None and entry[0] is template:
+                return entry[1]
+
+        stats = [TemplateStats(resized) for _, resized, _ in self.get(template)]
+        with self._lock:
+            old = self._stats.get(key)
+            if old is not None:
+                self.total_bytes -= sum(s.nbytes for s in old[1])
+            self._stats[key] = (template, stats)
+            self.total_bytes += sum(s.nbytes for s in stats)
+        return stats
+
+    def invalidate(self, template):
+        """특정 템플릿의 피라미드 제거"""
+        with self._lock:
+            entry = self._levels.get(id(template))
+            if entry is not None and entry[0] is template:
+                del self._levels[id(template)]
+                self.total_bytes -= sum(resized.nbytes for _, resized, _ in entry[1])
+
+            entry = self._stats.get(id(template))
+            if entry is not None and entry[0] is template:
+                del self._stats[id(template)]
+                self.total_bytes -= sum(s.nbytes for s in entry[1])
+
+            for key in [key for key, entry in self._coarse.items() if entry[0] is template]:
+                coarse_levels = self._coarse.pop(key)[1]
+                self.total_bytes -= sum(coarse.nbytes for coarse in coarse_levels if coarse is not None)
+
+    def clear(self):
+        """모든 피라미드 제거 (스케일별 이미지, 축소 이미지, 상관계수 통계 모두)"""
+        with self._lock:
+            self._levels.clear()
+            self._coarse.clear()
+            self._stats.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        """캐시 통계 반환"""
+        with self._lock:
+            return {
+                "templates": len(self._levels),
+                "bytes": self.total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -0,0 +1,89 @@
+import numpy as np
+
+
+class TemplateStats:
+    """정규화 상관계수(TM_CCOEFF_NORMED) 계산에 필요한 템플릿 통계를 미리 계산해 둔 객체
+
+    템플릿에서 평균을 뺀 벡터를 단위 길이로 정규화해 두면, 같은 크기의 이미지 영역과의
+    정규화 상관계수는 영역 쪽만 정규화한 뒤 내적 한 번으로 구할 수 있습니다.
+    """
+    EPSILON = 1e-6
+
+    def __init__(self, template):
+        template = np.asarray(template, dtype=np.float32)
+        self.shape = template.shape[:2]
+        self.size = template.size
+        self.mean = float(template.mean())
+        centered = template - self.mean
+        self.norm = float(np.sqrt(np.dot(centered.ravel(), centered.ravel())))
+        # 밝기 변화가 없는 템플릿은 상관계수가 정의되지 않음
+        self.flat = self.norm < self.EPSILON
+        self.unit = (centered / self.norm).ravel() if not self.flat else np.zeros(self.size, dtype=np.float32)
+
+    @property
+    def nbytes(self):
+        """미리 계산된 벡터가 차지하는 메모리 (바이트)"""
+        return self.unit.nbytes
+
+
+def normalize_patch(patch):
+    """이미지 영역을 평균 0, 길이 1인 벡터로 변환 (밝기 변화가 없으면 None)"""
+    vector = np.asarray(patch, dtype=np.float32).ravel()
+    vector = vector - vector.mean()
+    norm = float(np.sqrt(np.dot(vector, vector)))
+    if norm < TemplateStats.EPSILON:
+        return None
+    return vector / norm
+
+
+def ncc_at(screen, x, y, stats):
+    """화면의 (x, y) 위치 한 곳에서 템플릿과의 정규화 상관계수 계산
+
+    cv2.matchTemplate(..., TM_CCOEFF_NORMED) 결과의 (x, y) 값과 같습니다.
+
+    Returns:
+        float: 상관계수 (영역이 화면을 벗어나거나 밝기 변화가 없으면 -1.0)
+    """
+    height, width = stats.shape
+    if x < 0 or y < 0 or y + height > screen.shape[0] or x + width > screen.shape[1] or stats.flat:
+        return -1.0
+    patch = normalize_patch(screen[y:y + height, x:x + width])
+    if patch is None:
+        return -1.0
+    return float(np.dot(patch, stats.unit))
+
+
+class StatsMatrix:
+    """같은 크기의 여러 템플릿 통계를 행렬로 묶어 한 번의 행렬 곱으로 비교하는 객체
+
+    숫자 글자처럼 작은 템플릿 여러 개를 같은 크기의 영역과 비교할 때
+    matchTemplate을 템플릿 수만큼 호출하는 대신 사용합니다.
+    """
+
+    def __init__(self, labels, templates):
+        """
+        Args:
+            labels: 템플릿별 이름 (예: 숫자)
+            templates: labels와 같은 순서의 같은 크기 템플릿 목록
+        """
+        self.labels = list(labels)
+        stats = [TemplateStats(template) for template in templates]
+        self._matrix = np.stack([s.unit for s in stats]) if stats else np.zeros((0, 0), dtype=np.float32)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def scores(self, patch):
+        """영역과 각 템플릿의 정규화 상관계수 (영역에 밝기 변화가 없으면 모두 0)"""
+        vector = normalize_patch(patch)
+        if vector is None or not self.labels:
+            return np.zeros(len(self.labels), dtype=np.float32)
+        return self._matrix @ vector
+
+    def best(self, patch):
+        """가장 비슷한 템플릿의 (label, score) 반환 (템플릿이 없으면 (None, -1.0))"""
+        if not self.labels:
+            return None, -1.0
+        scores = self.scores(patch)
+        index = int(np.argmax(scores))
+        return self.labels[index], float(scores[index])
@@ -0,0 +1,162 @@
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+
+
+class TemplateStore:
+    """템플릿 이미지를 내용 해시 단위로 한 번만 보관하는 저장소
+
+    경로는 내용 해시를 가리키는 이름일 뿐이므로, 같은 이미지가 여러 경로(.png/.PNG 등)로
+    로드되어도 하나의 배열만 보관되고 스케일별 이미지도 한 번만 만들어집니다.
+    핵심 템플릿은 고정(pinned)되어 제거되지 않고, 세션마다 필요한 추가 템플릿(비밀번호 숫자 등)은
+    개수가 제한된 LRU 영역에 보관됩니다.
+    """
+
+    def __init__(self, max_extras=32, on_evict=None):
+        """
+        Args:
+            max_extras: LRU 영역에 보관할 최대 템플릿 수
+            on_evict: 템플릿이 제거될 때 호출할 함수 (예: 피라미드 제거)
+        """
+        self.max_extras = max_extras
+        self.on_evict = on_evict
+        self._templates = {}  # digest -> template
+        self._paths = {}  # template_path -> digest
+        self._pinned = set()  # 고정된 digest
+        self._extras = OrderedDict()  # LRU 영역 digest (오래 사용하지 않은 순)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.deduplicated = 0
+
+    @staticmethod
+    def digest(template):
+        """템플릿 픽셀과 크기로 내용 해시 생성"""
+        template = np.ascontiguousarray(template)
+        digest = hashlib.blake2b(template.tobytes(), digest_size=16)
+        digest.update(str(template.shape).encode())
+        return digest.hexdigest()
+
+    def __contains__(self, template_path):
+        with self._lock:
+            return template_path in self._paths
+
+    def get(self, template_path):
+        """경로에 해당하는 템플릿 반환 (없으면 None)"""
+        with self._lock:
+            digest = self._paths.get(template_path)
+            if digest is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if digest in self._extras:
+                self._extras.move_to_end(digest)
+            return self._templates[digest]
+
+    def put(self, template_path, template, pinned=False):
+        """템플릿 저장
+
+        같은 내용의 템플릿이 이미 있으면 기존 배열을 재사용합니다.
+
+        Args:
+            template_path: 템플릿 경로
+            template: 흑백 템플릿 이미지
+            pinned: True이면 제거되지 않는 고정 영역에 저장
+
+        Returns:
+            ndarray: 저장소가 보관하는 템플릿 (중복이면 기존 배열)
+        """
+        digest = self.digest(template)
+        evicted = []
+        with self._lock:
+            existing = self._templates.get(digest)
+            if existing is not None:
+                self.deduplicated += 1
+                template = existing
+            else:
+                self._templates[digest] = template
+            self._paths[template_path] = digest
+
+            if pinned:
+                self._pinned.add(digest)
+                self._extras.pop(digest, None)
+            elif digest not in self._pinned:
+                self._extras[digest] = True
+                self._extras.move_to_end(digest)
+                while len(self._extras) > self.max_extras:
+                    evicted.append(self._evict(next(iter(self._extras))))
+
+        if self.on_evict is not None:
+            for old in evicted:
+                self.on_evict(old)
+        return template
+
+    def _evict(self, digest):
+        """LRU 영역에서 템플릿 제거 (lock을 잡은 상태에서 호출)"""
+        del self._extras[digest]
+        template = self._templates.pop(digest)
+        for path in [path for path, value in self._paths.items() if value == digest]:
+            del self._paths[path]
+        self.evictions += 1
+        return template
+
+    def retain(self, pinned_paths):
+        """pinned_paths가 가리키는 템플릿만 고정하고, 어떤 경로도 가리키지 않는 템플릿은 제거
+
+        경로가 다른 내용으로 교체된 뒤(매니페스트 갱신 등) 이전 내용을 정리할 때 사용합니다.
+        고정이 풀린 템플릿은 LRU 영역으로 옮겨집니다.
+
+        Returns:
+            int: 제거된 템플릿 수
+        """
+        evicted = []
+        with self._lock:
+            referenced = set(self._paths.values())
+            pinned = {self._paths[path] for path in pinned_paths if path in self._paths}
+            for digest in self._pinned - pinned:
+                if digest in referenced:
+                    self._extras[digest] = True
+            self._pinned = pinned
+            for digest in list(self._templates):
+                if digest not in referenced:
+                    self._extras.pop(digest, None)
+                    evicted.append(self._templates.pop(digest))
+                    self.evictions += 1
+            while len(self._extras) > self.max_extras:
+                evicted.append(self._evict(next(iter(self._extras))))
+
+        if self.on_evict is not None:
+            for old in evicted:
+                self.on_evict(old)
+        return len(evicted)
+
+    def clear(self):
+        with self._lock:
+            evicted = list(self._templates.values())
+            self._templates.clear()
+            self._paths.clear()
+            self._pinned.clear()
+            self._extras.clear()
+
+        if self.on_evict is not None:
+            for old in evicted:
+                self.on_evict(old)
+
+    def stats(self):
+        """저장소 통계 반환"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "templates": len(self._templates),
+                "paths": len(self._paths),
+                "pinned": len(self._pinned),
+                "extras": len(self._extras),
+                "bytes": sum(template.nbytes for template in self._templates.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total) if total else 0.0,
+                "evictions": self.evictions,
+                "deduplicated": self.deduplicated,
+            }
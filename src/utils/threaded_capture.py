@@ -0,0 +1,181 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from src.utils.frame_source import FrameSource
+
+
+class ThreadedFrameSource(FrameSource):
+    """별도 스레드에서 전체 화면을 계속 캡처하고 최근 프레임을 링 버퍼에 보관하는 소스
+
+    pyautogui.screenshot()처럼 오래 걸리는 캡처를 이벤트 루프 밖에서 수행하여,
+    screen_capture_async()는 캡처를 기다리지 않고 최근 프레임을 바로 받습니다.
+    입력 동작(action_clock) 이후에 캡처된 프레임만 사용하므로 클릭 전 화면을 다시 분석하지 않습니다.
+    idle_timeout 동안 프레임 요청이 없으면 캡처 스레드는 멈추고, 다음 요청 때 다시 시작합니다.
+    영역 캡처는 링 버퍼를 거치지 않고 원래 소스로 바로 전달합니다.
+    """
+
+    def __init__(self, source: FrameSource, fps=2.0, buffer_size=4, max_age=None, action_clock=None, idle_timeout=10.0):
+        """
+        Args:
+            source: 실제로 프레임을 읽을 소스 (예: CaptureUtil)
+            fps: 초당 캡처 횟수
+            buffer_size: 보관할 최근 프레임 수
+            max_age: 최근 프레임이 이 시간(초)보다 오래되었으면 새 프레임을 기다림
+                     (None이면 캡처 간격의 2배)
+            action_clock: 마지막 입력 동작 시각(time.monotonic())을 반환하는 함수 - 이후에 캡처된 프레임만 사용
+            idle_timeout: 이 시간(초) 동안 프레임 요청이 없으면 캡처 스레드를 멈춤
+        """
+        super().__init__()
+        self.source = source
+        self.fps = fps
+        self.max_age = max_age if max_age is not None else 2.0 / fps
+        self.action_clock = action_clock
+        self.idle_timeout = idle_timeout
+        self._frames = deque(maxlen=buffer_size)  # (capture_time, timestamp, frame)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._running = False
+        self._last_request = time.monotonic()
+        self._latest_consumed = True
+        self.stats = {"captured": 0, "consumed": 0, "dropped": 0, "failed": 0, "stale_waits": 0, "idle_pauses": 0}
+
+    def start(self):
+        """캡처 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            self._last_request = time.monotonic()
+            if self._thread is not None and self._thread.is_alive() and self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="frame-capture", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=2.0):
+        """캡처 스레드 종료"""
+        with self._lock:
+            self._running = False
+            thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def close(self):
+        self.stop()
+        self.source.close()
+
+    def _run(self):
+        interval = 1.0 / self.fps
+        while self._running:
+            started = time.monotonic()
+            with self._lock:
+                if started - self._last_request > self.idle_timeout:
+                    # 세션이 없어 프레임을 요청하지 않으면 캡처를 멈춤
+                    self._running = False
+                    self.stats["idle_pauses"] += 1
+                    break
+
+            try:
+                timestamp, frame = self.source.read_frame()
+            except Exception as e:
+                print(f"백그라운드 캡처 중 오류 발생: {e}")
+                timestamp, frame = None, None
+
+            with self._lock:
+                if frame is None:
+                    self.stats["failed"] += 1
+                else:
+                    if not self._latest_consumed and self._frames:
+                        self.stats["dropped"] += 1  # 한 번도 사용되지 않고 밀려난 프레임
+                    self._frames.append((time.monotonic(), timestamp, frame))
+                    self._latest_consumed = False
+                    self.stats["captured"] += 1
+
+            elapsed = time.monotonic() - started
+            if elapsed < interval:
+                time.sleep(interval - elapsed)
+
+    def _last_action(self):
+        return self.action_clock() if self.action_clock is not None else 0.0
+
+    def _take_latest(self, after=None):
+        """after 이후에 캡처된 가장 최근 프레임 반환 (없으면 None)"""
+        with self._lock:
+            if not self._frames:
+                return None
+            captured, timestamp, frame = self._frames[-1]
+            if after is not None and captured <= after:
+                return None
+            self._latest_consumed = True
+            self.stats["consumed"] += 1
+            return captured, timestamp, frame
+
+    def latest(self):
+        """가장 최근 프레임을 기다리지 않고 반환
+
+        Returns:
+            tuple: (timestamp, frame) - 프레임이 없으면 (None, None)
+        """
+        self.start()
+        entry = self._take_latest()
+        if entry is None:
+            return None, None
+        return entry[1], entry[2]
+
+    async def latest_async(self, after=None, timeout=None):
+        """마지막 입력 동작 이후에 캡처된, max_age 이내의 최근 프레임을 이벤트 루프를 막지 않고 기다려 반환
+
+        Args:
+            after: 이 시각(time.monotonic()) 이후에 캡처된 프레임만 사용 (None이면 마지막 입력 동작 시각)
+            timeout: 새 프레임을 기다릴 최대 시간(초) (None이면 max_age)
+
+        Returns:
+            tuple: (timestamp, frame) - 시간 안에 새 프레임이 없으면 원래 소스에서 직접 캡처한 프레임
+        """
+        self.start()
+        if after is None:
+            after = self._last_action()
+        after = max(after, time.monotonic() - self.max_age)
+        deadline = time.monotonic() + (timeout if timeout is not None else self.max_age)
+        poll = min(0.05, 0.25 / self.fps)
+        while True:
+            entry = self._take_latest(after)
+            if entry is not None:
+                return entry[1], entry[2]
+            if time.monotonic() >= deadline or not self._running:
+                break
+            self.stats["stale_waits"] += 1
+            await asyncio.sleep(poll)
+
+        # 캡처 스레드가 따라오지 못하면 직접 캡처 (executor에서 실행)
+        return await asyncio.get_running_loop().run_in_executor(None, self.source.read_frame)
+
+    def recent_frames(self):
+        """링 버퍼에 있는 최근 프레임 목록 [(timestamp, frame), ...] (오래된 순)"""
+        with self._lock:
+            return [(timestamp, frame) for _, timestamp, frame in self._frames]
+
+    def read_frame(self):
+        return self.latest()
+
+    def screen_capture(self, region=None, reuse_buffer=False):
+        """영역 캡처는 원래 소스로 전달하고, 전체 화면은 최근 프레임을 반환"""
+        if region is not None:
+            return self.source.screen_capture(region=region, reuse_buffer=reuse_buffer)
+        frame = super().screen_capture()
+        if frame is None:
+            # 아직 캡처된 프레임이 없으면 직접 캡처
+            frame = self.source.screen_capture()
+            self.last_timestamp = self.source.last_timestamp
+        return frame
+
+    async def screen_capture_async(self, region=None, reuse_buffer=False):
+        """영역 캡처는 원래 소스로 전달하고, 전체 화면은 입력 동작 이후의 최근 프레임을 반환"""
+        if region is not None:
+            return await self.source.screen_capture_async(region=region, reuse_buffer=reuse_buffer)
+        try:
+            timestamp, frame = await self.latest_async()
+        except Exception as e:
+            print(f"프레임 읽기 중 오류 발생: {e}")
+            return None
+        if frame is not None:
+            self.last_timestamp = timestamp
+        return frame
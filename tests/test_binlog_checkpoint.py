@@ -0,0 +1,188 @@
+import asyncio
+import json
+import os
+import threading
+from pymysqlreplication.event import QueryEvent, XidEvent
+from src.binlog.checkpoint import BinlogCheckpoint
+from src.binlog.reader import BinlogReader
+
+
+def _query_event(query):
+    event = QueryEvent.__new__(QueryEvent)
+    event.query = query
+    return event
+
+
+def test_checkpoint_flush_and_load(tmp_path):
+    # Given
+    file_path = str(tmp_path / "checkpoint.json")
+    checkpoint = BinlogCheckpoint(file_path, interval=3600)
+
+    # When
+    checkpoint.update("mysql-bin.000001", 120)
+    saved_before_flush = os.path.exists(file_path)
+    checkpoint.flush()
+
+    # Then
+    assert saved_before_flush  # 첫 갱신은 바로 기록
+    assert BinlogCheckpoint(file_path).position == ("mysql-bin.000001", 120)
+    with open(file_path, 'r', encoding='utf-8') as f:
+        assert json.load(f)["log_pos"] == 120
+    assert os.listdir(tmp_path) == ["checkpoint.json"]
+
+
+def test_checkpoint_update_respects_interval(tmp_path):
+    # Given
+    file_path = str(tmp_path / "checkpoint.json")
+    checkpoint = BinlogCheckpoint(file_path, interval=3600)
+    checkpoint.update("mysql-bin.000001", 120)
+
+    # When
+    checkpoint.update("mysql-bin.000001", 240)
+
+    # Then
+    assert checkpoint.position == ("mysql-bin.000001", 240)
+    assert BinlogCheckpoint(file_path).position == ("mysql-bin.000001", 120)
+
+
+def test_checkpoint_force_writes_immediately(tmp_path):
+    # Given
+    file_path = str(tmp_path / "checkpoint.json")
+    checkpoint = BinlogCheckpoint(file_path, interval=3600)
+    checkpoint.update("mysql-bin.000001", 120)
+
+    # When
+    checkpoint.update("mysql-bin.000001", 240, force=True)
+
+    # Then
+    assert BinlogCheckpoint(file_path).position == ("mysql-bin.000001", 240)
+
+
+def test_checkpoint_reset_removes_file(tmp_path):
+    # Given
+    file_path = str(tmp_path / "checkpoint.json")
+    checkpoint = BinlogCheckpoint(file_path, interval=0)
+    checkpoint.update("mysql-bin.000002", 4)
+
+    # When
+    checkpoint.reset()
+
+    # Then
+    assert checkpoint.position is None
+    assert not os.path.exists(file_path)
+    assert BinlogCheckpoint(file_path).position is None
+
+
+def test_checkpoint_ignores_broken_file(tmp_path):
+    # Given
+    file_path = tmp_path / "checkpoint.json"
+    file_path.write_text("{broken", encoding='utf-8')
+
+    # When
+    checkpoint = BinlogCheckpoint(str(file_path))
+
+    # Then
+    assert checkpoint.position is None
+
+
+def test_is_boundary():
+    # Given
+    xid = XidEvent.__new__(XidEvent)
+
+    # When / Then
+    assert BinlogReader._is_boundary(xid)
+    assert BinlogReader._is_boundary(_query_event("COMMIT"))
+    assert BinlogReader._is_boundary(_query_event("ALTER TABLE remote_pcs ADD COLUMN memo TEXT"))
+    assert not BinlogReader._is_boundary(_query_event("BEGIN"))
+    assert not BinlogReader._is_boundary(_query_event(" begin "))
+    assert not BinlogReader._is_boundary(object())
+
+
+def test_is_purged_log_error():
+    # Given
+    purged = Exception(1236, "Could not find first log file name in binary log index file")
+
+    # When / Then
+    assert BinlogReader._is_purged_log_error(purged)
+    assert BinlogReader._is_purged_log_error(Exception("could not find first log file name"))
+    assert not BinlogReader._is_purged_log_error(Exception(2013, "Lost connection to MySQL server"))
+
+
+class _Row:
+    def __init__(self, value):
+        self.value = value
+        self.rows = [value]
+
+
+class _Stream:
+    """주어진 (이벤트, log_pos) 목록을 시작 위치 이후부터 내보내고, 다 읽으면 닫힐 때까지 대기하는 스트림"""
+
+    def __init__(self, events, position):
+        self.events = events
+        self.log_file = "mysql-bin.000001"
+        self.log_pos = position[1] if position else 0
+        self.closed = threading.Event()
+
+    def __iter__(self):
+        for event, log_pos in self.events:
+            if log_pos <= self.log_pos:
+                continue
+            self.log_pos = log_pos
+            yield event
+        self.closed.wait()
+        raise OSError("stream closed")
+
+    def close(self):
+        self.closed.set()
+
+
+def _read(tmp_path, events, count, replay_until, dispatched):
+    """리더로 행 이벤트 count개를 처리하고 (이벤트 목록, 체크포인트 파일 위치) 반환"""
+    file_path = str(tmp_path / "checkpoint.json")
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump({"log_file": "mysql-bin.000001", "log_pos": 0}, f)
+
+    async def run():
+        checkpoint = BinlogCheckpoint(file_path, interval=3600)
+        checkpoint.update("mysql-bin.000001", 1)  # 첫 기록 - 이후 기록은 interval 또는 force가 필요
+        reader = BinlogReader(asyncio.get_running_loop(), lambda position: _Stream(events, position),
+                              checkpoint=checkpoint, replay_until=replay_until)
+        reader.start()
+        received = []
+        try:
+            for _ in range(count):
+                received.append(await asyncio.wait_for(reader.get(), 5))
+                reader.mark_processed(dispatched)
+        finally:
+            reader._running = False
+            reader._close_stream()
+        return received
+
+    received = asyncio.run(run())
+    return received, BinlogCheckpoint(file_path).position
+
+
+def test_reader_marks_replayed_events_and_forces_dispatched_checkpoint(tmp_path):
+    # Given - 시작할 때 서버 위치는 4, 그 뒤의 트랜잭션은 실시간 이벤트
+    events = [(QueryEvent.__new__(QueryEvent), 2), (_Row("old"), 3), (XidEvent.__new__(XidEvent), 4),
+              (_Row("live"), 5), (XidEvent.__new__(XidEvent), 6)]
+    events[0][0].query = "BEGIN"
+
+    # When
+    received, saved = _read(tmp_path, events, 2, ("mysql-bin.000001", 4), dispatched=True)
+
+    # Then
+    assert [(event.value, event.replayed) for event in received] == [("old", True), ("live", False)]
+    assert saved == ("mysql-bin.000001", 6)
+
+
+def test_reader_keeps_interval_for_events_without_work(tmp_path):
+    # Given
+    events = [(_Row("a"), 2), (XidEvent.__new__(XidEvent), 3)]
+
+    # When
+    received, saved = _read(tmp_path, events, 1, None, dispatched=False)
+
+    # Then
+    assert received[0].replayed is False
+    assert saved == ("mysql-bin.000001", 1)
@@ -0,0 +1,59 @@
+import cv2
+import numpy as np
+import pytest
+from src.utils.image_matcher import ImageMatcher
+from src.utils.template_pyramid import TemplatePyramid
+
+
+def _matcher():
+    matcher = ImageMatcher(match_processes=0)
+    matcher.use_priors = False
+    matcher.frame_gating = False
+    return matcher
+
+
+def _scene(seed, scale, x, y):
+    """COARSE_MIN_WIDTH 이상인 무작위 화면에 scale 크기로 줄인 템플릿을 (x, y)에 붙여 넣은 (screen, template)"""
+    rng = np.random.default_rng(seed)
+    screen = cv2.GaussianBlur(rng.integers(0, 256, (720, 1280), dtype=np.uint8), (9, 9), 0)
+    template = cv2.GaussianBlur(rng.integers(0, 256, (80, 120), dtype=np.uint8), (7, 7), 0)
+    resized = cv2.resize(template, (int(120 * scale), int(80 * scale)))
+    screen[y:y + resized.shape[0], x:x + resized.shape[1]] = resized
+    return screen, template
+
+
+@pytest.mark.parametrize("seed,level,x,y", [(0, 0, 400, 300), (1, 4, 1003, 57), (2, 9, 13, 611), (3, 6, 777, 401)])
+def test_coarse_to_fine_matches_full_search(seed, level, x, y):
+    # Given
+    screen, template = _scene(seed, TemplatePyramid.SCALES[level], x, y)
+    matcher = _matcher()
+    assert matcher._downsample_screen(screen, True) is not None  # 축소 탐색을 실제로 사용하는 화면 크기
+
+    try:
+        # When
+        full = matcher.detect_template(screen, template, threshold=0.8, coarse_to_fine=False)
+        coarse = matcher.detect_template(screen, template, threshold=0.8, coarse_to_fine=True)
+
+        # Then
+        assert full[0] is not None and full[2] >= 0.8
+        assert coarse[:2] == full[:2]
+        assert coarse[2] == pytest.approx(full[2], abs=1e-4)
+    finally:
+        matcher.shutdown_executor()
+
+
+def test_coarse_to_fine_reports_no_match_like_full_search():
+    # Given - 템플릿이 없는 화면
+    screen, template = _scene(4, 1.0, 0, 0)
+    screen = cv2.GaussianBlur(np.random.default_rng(5).integers(0, 256, screen.shape, dtype=np.uint8), (9, 9), 0)
+    matcher = _matcher()
+
+    try:
+        # When
+        full = matcher.detect_template(screen, template, threshold=0.8, coarse_to_fine=False)
+        coarse = matcher.detect_template(screen, template, threshold=0.8, coarse_to_fine=True)
+
+        # Then
+        assert full == coarse == (None, None, None)
+    finally:
+        matcher.shutdown_executor()
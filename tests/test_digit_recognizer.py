@@ -0,0 +1,86 @@
+import cv2
+import numpy as np
+from src.utils.digit_recognizer import DigitRecognizer
+
+
+def _otp_image(text):
+    """검은 배경에 흰 글자로 숫자열을 그린 이미지"""
+    image = np.zeros((40, 24 * len(text) + 16), dtype=np.uint8)
+    cv2.putText(image, text, (8, 30), cv2.FONT_HERSHEY_SIMPLEX, 1.0, 255, 2, cv2.LINE_AA)
+    return image
+
+
+def _recognizer(tmp_path, monkeypatch, confirmed=("0123456789",)):
+    """확인된 OTP들로 학습한 인식기"""
+    monkeypatch.delenv("OTP_LENGTH", raising=False)
+    recognizer = DigitRecognizer(file_path=str(tmp_path / "otp_glyphs.npz"))
+    for text in confirmed:
+        recognizer.remember(_otp_image(text), text)
+        assert recognizer.confirm(text)
+    return recognizer
+
+
+def test_recognizes_after_all_digits_are_confirmed(tmp_path, monkeypatch):
+    # Given
+    recognizer = _recognizer(tmp_path, monkeypatch, ["012345", "678901"])
+
+    # When
+    text, confidence = recognizer.recognize(_otp_image("937264"))
+
+    # Then
+    assert text == "937264"
+    assert confidence >= recognizer.min_confidence
+    assert DigitRecognizer(file_path=str(tmp_path / "otp_glyphs.npz")).otp_length == 6
+
+
+def test_rejects_until_every_digit_has_confirmed_samples(tmp_path, monkeypatch):
+    # Given - 8과 9는 아직 확인된 견본이 없음
+    recognizer = _recognizer(tmp_path, monkeypatch, ["012345", "670123"])
+
+    # When
+    text, _ = recognizer.recognize(_otp_image("123456"))
+
+    # Then
+    assert text is None
+    assert recognizer.stats["incomplete_samples"] == 1
+
+
+def test_rejects_ambiguous_digits(tmp_path, monkeypatch):
+    # Given - 3과 8의 견본이 같은 모양이라 구분할 수 없음
+    recognizer = _recognizer(tmp_path, monkeypatch, ["012345", "678901"])
+    recognizer.learn(_otp_image("8"), "3")
+
+    # When
+    text, _ = recognizer.recognize(_otp_image("128456"))
+
+    # Then
+    assert text is None
+    assert recognizer.stats["ambiguous"] == 1
+
+
+def test_unconfirmed_or_mismatched_reads_are_not_learned(tmp_path, monkeypatch):
+    # Given
+    recognizer = _recognizer(tmp_path, monkeypatch, [])
+
+    # When
+    recognizer.remember(_otp_image("123456"), "123456")
+    wrong = recognizer.confirm("123457")  # 다른 OTP가 통과됨
+    recognizer.remember(_otp_image("123456"), "12345")  # OCR이 한 글자를 놓침
+    short = recognizer.confirm("12345")
+
+    # Then
+    assert not wrong and not short
+    assert recognizer.stats["learned"] == 0
+    assert recognizer.recognize(_otp_image("123456")) == (None, 0.0)
+
+
+def test_rejects_length_mismatch(tmp_path, monkeypatch):
+    # Given
+    recognizer = _recognizer(tmp_path, monkeypatch, ["012345", "678901"])
+
+    # When
+    text, _ = recognizer.recognize(_otp_image("12345"))
+
+    # Then
+    assert text is None
+    assert recognizer.stats["length_mismatch"] == 1
@@ -0,0 +1,61 @@
+import cv2
+import numpy as np
+import pytest
+from src.utils.image_matcher import ImageMatcher
+
+
+def _matcher(sweep_workers, accept_confidence):
+    matcher = ImageMatcher(match_processes=0)
+    matcher.use_priors = False
+    matcher.frame_gating = False
+    matcher.sweep_workers = sweep_workers
+    matcher.ACCEPT_CONFIDENCE = accept_confidence
+    return matcher
+
+
+def _scene(seed, scale):
+    """무작위 화면에 scale 크기로 줄인 템플릿을 붙여 넣은 (screen, template)"""
+    rng = np.random.default_rng(seed)
+    screen = cv2.GaussianBlur(rng.integers(0, 256, (240, 320), dtype=np.uint8), (5, 5), 0)
+    template = cv2.GaussianBlur(rng.integers(0, 256, (40, 60), dtype=np.uint8), (3, 3), 0)
+    resized = cv2.resize(template, (int(60 * scale), int(40 * scale)))
+    screen[100:100 + resized.shape[0], 150:150 + resized.shape[1]] = resized
+    return screen, template
+
+
+@pytest.mark.parametrize("accept_confidence", [None, 0.95])
+@pytest.mark.parametrize("seed,scale", [(0, 1.0), (1, 0.9), (2, 0.8), (3, 0.6)])
+def test_parallel_sweep_matches_sequential(seed, scale, accept_confidence):
+    # Given
+    screen, template = _scene(seed, scale)
+    sequential = _matcher(0, accept_confidence)
+    parallel = _matcher(4, accept_confidence)
+
+    try:
+        # When
+        expected = sequential.detect_template(screen, template, threshold=0.8)
+        actual = parallel.detect_template(screen, template, threshold=0.8)
+
+        # Then
+        assert actual == expected
+        assert parallel._sweep_executor is not None
+    finally:
+        sequential.shutdown_executor()
+        parallel.shutdown_executor()
+
+
+def test_parallel_sweep_keeps_scale_statistics():
+    # Given
+    matcher = _matcher(4, None)
+    screen, template = _scene(4, 0.9)
+
+    try:
+        # When
+        matcher.detect_template(screen, template, threshold=0.8)
+
+        # Then
+        assert matcher.sweep_stats["sweeps"] == 1
+        assert matcher.sweep_stats["scale_evaluations"] == len(matcher.pyramid.scales)
+        assert sum(matcher._scale_wins) == 1
+    finally:
+        matcher.shutdown_executor()
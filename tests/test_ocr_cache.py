@@ -0,0 +1,105 @@
+import asyncio
+import numpy as np
+from src.utils.image_matcher import ImageMatcher
+from src.utils.ocr_cache import OCRCache
+
+
+def _image(seed, shape=(20, 60)):
+    return np.random.default_rng(seed).integers(0, 256, shape, dtype=np.uint8)
+
+
+def test_hit_after_put():
+    # Given
+    cache = OCRCache(max_size=2)
+    key = OCRCache.make_key(_image(0), ['en', 'ko'])
+
+    # When
+    before = cache.get(key)
+    cache.put(key, "123456")
+    after = cache.get(OCRCache.make_key(_image(0).copy(), ['en', 'ko']))  # 같은 픽셀의 다른 배열
+
+    # Then
+    assert before == (False, None)
+    assert after == (True, "123456")
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_key_depends_on_pixels_shape_and_languages():
+    # Given
+    image = _image(1)
+    key = OCRCache.make_key(image, ['en', 'ko'])
+    changed = image.copy()
+    changed[0, 0] ^= 1
+
+    # When / Then
+    assert OCRCache.make_key(changed, ['en', 'ko']) != key
+    assert OCRCache.make_key(image.reshape(60, 20), ['en', 'ko']) != key
+    assert OCRCache.make_key(image, ['en']) != key
+    assert OCRCache.make_key(image[:, ::2], ['en', 'ko']) == OCRCache.make_key(image[:, ::2].copy(), ['en', 'ko'])
+
+
+def test_evicts_least_recently_used():
+    # Given
+    cache = OCRCache(max_size=2)
+    a, b, c = (OCRCache.make_key(_image(seed), ['en']) for seed in (2, 3, 4))
+    cache.put(a, "a")
+    cache.put(b, "b")
+
+    # When
+    cache.get(a)  # a를 최근 사용으로 갱신
+    cache.put(c, "c")
+
+    # Then
+    assert cache.get(b) == (False, None)
+    assert cache.get(a) == (True, "a")
+    assert cache.get(c) == (True, "c")
+    assert cache.stats()["size"] == 2
+
+
+def test_cached_none_result_is_a_hit():
+    # Given - 글자를 찾지 못한 결과(None)도 다시 OCR하지 않음
+    cache = OCRCache()
+    key = OCRCache.make_key(_image(5), ['en'])
+
+    # When
+    cache.put(key, None)
+
+    # Then
+    assert cache.get(key) == (True, None)
+
+
+class _OCR:
+    """readtext 호출 횟수를 기록하는 OCR 엔진 대역"""
+    languages = ['en', 'ko']
+
+    def __init__(self):
+        self.calls = 0
+        self.reader = self
+
+    async def wait_ready(self):
+        return True
+
+    def readtext(self, image):
+        self.calls += 1
+        return [(None, '12 34', 0.9), (None, '56', 0.9)]
+
+
+def test_extract_text_runs_ocr_once_per_crop():
+    # Given
+    matcher = ImageMatcher(match_processes=0)
+    matcher.frame_gating = False
+    matcher.ocr = _OCR()
+    screen = _image(6, (120, 200))
+    template = screen[40:70, 50:130].copy()
+
+    try:
+        # When
+        first = asyncio.run(matcher.extract_text(screen, template))
+        second = asyncio.run(matcher.extract_text(screen.copy(), template))
+
+        # Then
+        assert first == second == "12 3456"
+        assert matcher.ocr.calls == 1
+        assert matcher.ocr_cache.stats()["hits"] == 1
+    finally:
+        matcher.shutdown_executor()
@@ -0,0 +1,136 @@
+from pymysqlreplication.event import QueryEvent
+from src.binlog.row_decoder import DDL_PATTERN, RowChange, RowDecoderRegistry, TableDecoder, ddl_tables, is_ddl
+
+
+class _RowsEvent:
+    def __init__(self, table, rows):
+        self.table = table
+        self.rows = rows
+
+
+def _registry(columns):
+    """load()가 information_schema 대신 주어진 컬럼 목록을 사용하는 레지스트리"""
+    registry = RowDecoderRegistry({}, "ez_daenak", list(columns))
+    loads = []
+
+    def load():
+        loads.append(dict(columns))
+        with registry._lock:
+            registry._decoders = {table: TableDecoder(table, names) for table, names in columns.items()}
+            registry._mismatches.clear()
+        return {table: len(names) for table, names in columns.items()}
+
+    registry.load = load
+    return registry, loads
+
+
+def test_table_decoder_uses_column_order():
+    # Given
+    decoder = TableDecoder("remote_pcs", ["id", "server_id", "state"])
+
+    # When
+    row = decoder.decode({"UNKNOWN_COL0": 1, "UNKNOWN_COL1": "pc-1", "UNKNOWN_COL2": "idle"})
+
+    # Then
+    assert type(row).__name__ == "RemotePcsRow"
+    assert row.id == 1 and row.server_id == "pc-1" and row.state == "idle"
+
+
+def test_table_decoder_rejects_width_mismatch():
+    # Given
+    decoder = TableDecoder("remote_pcs", ["id", "server_id"])
+
+    # When / Then
+    assert decoder.decode({"id": 1}) is None
+    assert decoder.decode({}) is None
+    assert decoder.decode(None) is None
+
+
+def test_table_decoder_renames_invalid_column_names():
+    # Given
+    decoder = TableDecoder("daenak", ["id", "class", "id"])
+
+    # When
+    row = decoder.decode({"a": 1, "b": "x", "c": 2})
+
+    # Then
+    assert tuple(row) == (1, "x", 2)
+
+
+def test_ddl_pattern():
+    # When / Then
+    assert DDL_PATTERN.match("ALTER TABLE remote_pcs ADD COLUMN memo TEXT")
+    assert DDL_PATTERN.match("  create table daenak (id int)")
+    assert DDL_PATTERN.match("TRUNCATE TABLE daenak")
+    assert not DDL_PATTERN.match("UPDATE remote_pcs SET state = 'idle'")
+    assert not DDL_PATTERN.match("CREATE INDEX idx ON daenak (id)")
+
+
+def test_is_ddl_skips_leading_comments():
+    # When / Then
+    assert is_ddl("/* ApplicationName=DBeaver */ ALTER TABLE remote_pcs ADD COLUMN memo TEXT")
+    assert is_ddl("-- migration 12\nALTER TABLE daenak DROP COLUMN memo")
+    assert is_ddl("# generated\n/* a */ /* b */\n  RENAME TABLE daenak TO daenak_old")
+    assert not is_ddl("/* ALTER TABLE daenak */ UPDATE daenak SET id = 1")
+    assert not is_ddl("BEGIN")
+
+
+def test_ddl_tables_parses_exact_table_names():
+    # When / Then
+    assert ddl_tables("ALTER TABLE daenak_log ADD COLUMN memo TEXT") == {"daenak_log"}
+    assert ddl_tables("/* tool */ ALTER TABLE `ez_daenak`.`daenak` ADD COLUMN memo TEXT") == {"daenak"}
+    assert ddl_tables("CREATE TABLE IF NOT EXISTS remote_pcs (id INT)") == {"remote_pcs"}
+    assert ddl_tables("RENAME TABLE daenak TO daenak_old, daenak_new TO daenak") == {"daenak", "daenak_old", "daenak_new"}
+    assert ddl_tables("DROP TABLE IF EXISTS daenak_log, remote_pcs") == {"daenak_log", "remote_pcs"}
+    assert ddl_tables("UPDATE daenak SET id = 1") == set()
+
+
+def test_process_ignores_ddl_for_similarly_named_tables():
+    # Given
+    registry, loads = _registry({"daenak": ["id"]})
+    event = QueryEvent.__new__(QueryEvent)
+
+    # When
+    event.query = "ALTER TABLE daenak_log ADD COLUMN memo TEXT"
+    registry.process(event)
+    ignored = len(loads)
+    event.query = "ALTER TABLE daenak ADD COLUMN memo TEXT"
+    registry.process(event)
+
+    # Then
+    assert ignored == 0
+    assert len(loads) == 1
+
+
+def test_decode_refreshes_once_per_mismatch():
+    # Given
+    columns = {"remote_pcs": ["id", "state"]}
+    registry, loads = _registry(columns)
+    registry.load()
+    wide = {"values": {"a": 1, "b": "idle", "c": "memo"}}
+
+    # When
+    first = registry.decode(_RowsEvent("remote_pcs", [wide]))
+    second = registry.decode(_RowsEvent("remote_pcs", [wide]))
+
+    # Then
+    assert first == [] and second == []
+    assert len(loads) == 2  # 시작 시 로드 + 불일치로 한 번 다시 로드
+
+
+def test_decode_picks_up_new_columns_after_refresh():
+    # Given
+    columns = {"remote_pcs": ["id", "state"]}
+    registry, loads = _registry(columns)
+    registry.load()
+    columns["remote_pcs"] = ["id", "state", "memo"]
+    row = {"before_values": {"a": 1, "b": "idle", "c": None}, "after_values": {"a": 1, "b": "busy", "c": "x"}}
+
+    # When
+    changes = registry.decode(_RowsEvent("remote_pcs", [row]))
+
+    # Then
+    assert len(changes) == 1
+    assert isinstance(changes[0], RowChange)
+    assert changes[0].before.state == "idle"
+    assert changes[0].after.memo == "x"
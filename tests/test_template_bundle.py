@@ -0,0 +1,116 @@
+import cv2
+import numpy as np
+from src.utils.template_bundle import TemplateBundle, build_bundle
+from src.utils.template_pyramid import TemplatePyramid
+
+
+def _template(seed):
+    return np.random.default_rng(seed).integers(0, 256, (24, 36), dtype=np.uint8)
+
+
+def _png(template):
+    return cv2.imencode('.png', template)[1].tobytes()
+
+
+def test_built_bundle_loads_back(tmp_path):
+    # Given
+    path = str(tmp_path / "templates.bundle")
+    pyramid = TemplatePyramid()
+    templates = {"/a.png": _template(0), "/b.PNG": _template(1)}
+    metadata = {"/a.png": {"threshold": 0.7, "roi": [0, 0, 10, 10]}}
+
+    # When
+    size = build_bundle(path, templates, pyramid, metadata, {"/a.png": _png(templates["/a.png"])}, {"/a.png": "/a.PNG"})
+    bundle = TemplateBundle.open(path)
+
+    # Then
+    assert size == (tmp_path / "templates.bundle").stat().st_size
+    assert len(bundle) == 2 and set(bundle.keys()) == set(templates)
+    for template_path, template in templates.items():
+        assert np.array_equal(bundle.get(template_path), template)
+        expected = pyramid.build(template)
+        levels = bundle.levels(template_path)
+        assert [scale for scale, _, _ in levels] == [scale for scale, _, _ in expected]
+        assert all(np.array_equal(a, b) for (_, a, _), (_, b, _) in zip(levels, expected))
+    assert bundle.metadata("/a.png") == metadata["/a.png"]
+    assert bundle.metadata("/b.PNG") == {}
+    assert bundle.source("/a.png") == "/a.PNG" and bundle.source("/b.PNG") == "/b.PNG"
+    assert bundle.matches("/a.png", _png(templates["/a.png"]))
+    assert not bundle.matches("/a.png", _png(_template(2)))
+    assert not bundle.matches("/b.PNG", _png(templates["/b.PNG"]))  # 해시가 없는 항목
+
+
+def test_open_rejects_missing_or_invalid_file(tmp_path):
+    # Given
+    broken = tmp_path / "broken.bundle"
+    broken.write_bytes(b"not a bundle" * 4)
+
+    # When / Then
+    assert TemplateBundle.open(str(tmp_path / "missing.bundle")) is None
+    assert TemplateBundle.open(str(broken)) is None
+
+
+class _DiskCache:
+    """요청 횟수를 기록하는 디스크 캐시 대역"""
+
+    def __init__(self, cached, served):
+        self._cached = cached
+        self.served = served
+        self.fetched = []
+
+    def cached(self, url):
+        return self._cached.get(url)
+
+    def fetch(self, url):
+        self.fetched.append(url)
+        return self.served[url]
+
+
+def _service(tmp_path, monkeypatch, template, disk_cache):
+    from src.service.template_service import TemplateService
+    from src.utils.image_matcher import ImageMatcher
+
+    bundle_path = str(tmp_path / "templates.bundle")
+    build_bundle(bundle_path, {"/a.png": template}, TemplatePyramid(), sources={"/a.png": _png(template)},
+                 source_paths={"/a.png": "/a.PNG"})
+    monkeypatch.setenv("IMG_URL", "http://templates.local")
+    monkeypatch.setenv("TEMPLATE_BUNDLE", bundle_path)
+    monkeypatch.setenv("TEMPLATE_CACHE_DIR", str(tmp_path / "template_cache"))
+    monkeypatch.setenv("TEMPLATE_MANIFEST", "")
+    service = TemplateService(ImageMatcher(match_processes=0))
+    service.disk_cache = disk_cache
+    return service
+
+
+def test_service_serves_bundle_without_request_and_replaces_changed_file(tmp_path, monkeypatch):
+    # Given - 디스크 캐시에는 번들과 같은 파일이 있지만, 서버 파일은 그 뒤에 바뀜
+    template, changed = _template(0), _template(3)
+    url = "http://templates.local/a.PNG"
+    disk_cache = _DiskCache({url: _png(template)}, {url: _png(changed)})
+    service = _service(tmp_path, monkeypatch, template, disk_cache)
+
+    # When
+    loaded = service._load_template("/a.png")
+    requested_before_return = list(disk_cache.fetched)
+    service._revalidate_queue.join()  # 백그라운드 재검증 완료 대기
+
+    # Then
+    assert isinstance(loaded, np.memmap) and np.array_equal(loaded, template)
+    assert requested_before_return == []
+    assert disk_cache.fetched == [url]  # 번들에 기록된 확장자로 한 번만 요청
+    assert np.array_equal(service.store.get("/a.png"), changed)
+
+
+def test_service_skips_bundle_when_cached_file_differs(tmp_path, monkeypatch):
+    # Given - 디스크 캐시에 이미 바뀐 서버 파일이 있음
+    template, changed = _template(0), _template(4)
+    disk_cache = _DiskCache({"http://templates.local/a.PNG": _png(changed)},
+                            {"http://templates.local/a.png": _png(changed)})
+    service = _service(tmp_path, monkeypatch, template, disk_cache)
+
+    # When
+    loaded = service._load_template("/a.png")
+
+    # Then
+    assert not isinstance(loaded, np.memmap)
+    assert np.array_equal(loaded, changed)
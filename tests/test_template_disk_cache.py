@@ -0,0 +1,108 @@
+import pytest
+import requests
+from src.utils import template_disk_cache
+from src.utils.template_disk_cache import TemplateDiskCache
+
+URL = "http://templates.local/a.PNG"
+
+
+class _Response:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)
+
+
+class _Server:
+    """requests.get 대역 - 받은 요청 헤더를 기록하고 준비된 응답(또는 예외)을 차례로 반환"""
+
+    def __init__(self, monkeypatch, *responses):
+        self.responses = list(responses)
+        self.requests = []
+        monkeypatch.setattr(template_disk_cache.requests, "get", self.get)
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append((url, dict(headers or {})))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def test_revalidates_with_etag_and_serves_cache_on_304(tmp_path, monkeypatch):
+    # Given
+    server = _Server(monkeypatch,
+                     _Response(200, b"v1", {"ETag": '"abc"', "Last-Modified": "Sat, 17 Oct 2026 00:00:00 GMT"}),
+                     _Response(304))
+    cache = TemplateDiskCache(str(tmp_path))
+
+    # When
+    first = cache.fetch(URL)
+    second = cache.fetch(URL)
+
+    # Then
+    assert first == second == b"v1"
+    assert server.requests[0][1] == {}
+    assert server.requests[1][1] == {"If-None-Match": '"abc"', "If-Modified-Since": "Sat, 17 Oct 2026 00:00:00 GMT"}
+    assert cache.stats == {"downloaded": 1, "revalidated": 1, "offline_hits": 0}
+    assert cache.cached(URL) == b"v1"
+
+
+def test_replaces_cached_file_when_server_file_changes(tmp_path, monkeypatch):
+    # Given
+    server = _Server(monkeypatch, _Response(200, b"v1", {"ETag": '"v1"'}), _Response(200, b"v2", {"ETag": '"v2"'}),
+                     _Response(304))
+    cache = TemplateDiskCache(str(tmp_path))
+    cache.fetch(URL)
+
+    # When
+    changed = cache.fetch(URL)
+    revalidated = cache.fetch(URL)
+
+    # Then
+    assert changed == revalidated == b"v2"
+    assert server.requests[2][1] == {"If-None-Match": '"v2"'}
+
+
+def test_serves_cached_file_offline(tmp_path, monkeypatch):
+    # Given - 이전 실행에서 받아 둔 파일이 있고, 지금은 서버에 연결할 수 없음
+    _Server(monkeypatch, _Response(200, b"v1", {"ETag": '"abc"'}))
+    TemplateDiskCache(str(tmp_path)).fetch(URL)
+    server = _Server(monkeypatch, requests.ConnectionError("refused"))
+    cache = TemplateDiskCache(str(tmp_path))
+
+    # When
+    offline = cache.fetch(URL)
+    again = cache.fetch(URL)  # offline_retry 동안은 요청하지 않음
+
+    # Then
+    assert offline == again == b"v1"
+    assert len(server.requests) == 1
+    assert cache.stats["offline_hits"] == 2
+
+
+def test_server_error_uses_cache_but_missing_file_raises(tmp_path, monkeypatch):
+    # Given
+    _Server(monkeypatch, _Response(200, b"v1"), _Response(503), _Response(404))
+    cache = TemplateDiskCache(str(tmp_path))
+    cache.fetch(URL)
+
+    # When / Then
+    assert cache.fetch(URL) == b"v1"
+    with pytest.raises(requests.HTTPError):
+        cache.fetch("http://templates.local/missing.png")
+
+
+def test_offline_without_cache_raises(tmp_path, monkeypatch):
+    # Given
+    _Server(monkeypatch, requests.ConnectionError("refused"))
+    cache = TemplateDiskCache(str(tmp_path))
+
+    # When / Then
+    with pytest.raises(requests.ConnectionError):
+        cache.fetch(URL)
+    assert cache.cached(URL) is None
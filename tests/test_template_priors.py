@@ -0,0 +1,81 @@
+import json
+import cv2
+import numpy as np
+from src.utils.image_matcher import ImageMatcher
+from src.utils.template_priors import TemplatePriors
+
+
+def _matcher(tmp_path):
+    matcher = ImageMatcher(match_processes=0)
+    matcher.frame_gating = False
+    matcher.priors = TemplatePriors(str(tmp_path / "template_priors.json"), save_interval=0)
+    return matcher
+
+
+def _scene(rng, template, placements):
+    """무작위 배경에 (x, y, 이미지) 목록을 붙여 넣은 화면"""
+    screen = cv2.GaussianBlur(rng.integers(0, 256, (480, 640), dtype=np.uint8), (5, 5), 0)
+    for x, y, image in placements:
+        screen[y:y + image.shape[0], x:x + image.shape[1]] = image
+    return screen
+
+
+def test_prior_recovers_after_target_moves(tmp_path):
+    # Given - 이전 세션에서 (50, 50)을 학습했고, 지금은 그 자리에 비슷한 다른 이미지가 있음
+    rng = np.random.default_rng(0)
+    template = cv2.GaussianBlur(rng.integers(0, 256, (40, 60), dtype=np.uint8), (3, 3), 0)
+    noise = rng.normal(0, 15, template.shape)
+    look_alike = np.clip(template.astype(np.float32) + noise, 0, 255).astype(np.uint8)
+    similarity = cv2.matchTemplate(look_alike, template, cv2.TM_CCOEFF_NORMED)[0, 0]
+    assert 0.8 < similarity < 0.95  # 임계값은 넘지만 ACCEPT_CONFIDENCE에는 못 미치는 비슷한 이미지
+
+    matcher = _matcher(tmp_path)
+    first = _scene(rng, template, [(50, 50, template)])
+    assert matcher.detect_template(first, template, template_key="digit")[0] == (50, 50)
+
+    # When
+    moved = _scene(rng, template, [(50, 50, look_alike), (300, 200, template)])
+    top_left, bottom_right, score = matcher.detect_template(moved, template, template_key="digit")
+
+    # Then
+    assert top_left == (300, 200)
+    assert score > 0.99
+    key = matcher.priors.make_key("digit", moved.shape)
+    assert matcher.priors.get(key)["loc"] == [300, 200]
+    assert matcher.priors.stats()[key]["fast_misses"] == 1
+
+
+def test_prior_point_check_hits_unchanged_target(tmp_path):
+    # Given
+    rng = np.random.default_rng(1)
+    template = cv2.GaussianBlur(rng.integers(0, 256, (40, 60), dtype=np.uint8), (3, 3), 0)
+    screen = _scene(rng, template, [(120, 80, template)])
+    matcher = _matcher(tmp_path)
+    matcher.detect_template(screen, template, template_key="otp_frame")
+    sweeps = matcher.sweep_stats["sweeps"]
+
+    # When
+    top_left, _, _ = matcher.detect_template(screen, template, template_key="otp_frame")
+
+    # Then
+    assert top_left == (120, 80)
+    assert matcher.sweep_stats["sweeps"] == sweeps  # 전체 탐색 없이 기억된 위치에서 바로 탐지
+    assert matcher.priors.stats()[matcher.priors.make_key("otp_frame", screen.shape)]["fast_hits"] == 1
+
+
+def test_priors_save_is_debounced_and_flushed(tmp_path):
+    # Given
+    file_path = tmp_path / "template_priors.json"
+    priors = TemplatePriors(str(file_path), save_interval=3600)
+
+    # When
+    priors.learn("a@640x480", 0, 1.0, (10, 10))
+    saved_before_flush = file_path.exists()
+    priors.flush()
+
+    # Then
+    assert not saved_before_flush
+    with open(file_path, 'r', encoding='utf-8') as f:
+        assert json.load(f)["priors"]["a@640x480"]["loc"] == [10, 10]
+    assert TemplatePriors(str(file_path)).get("a@640x480")["scale_index"] == 0
+    assert [path.name for path in tmp_path.iterdir()] == ["template_priors.json"]
@@ -0,0 +1,81 @@
+import cv2
+import numpy as np
+import pytest
+from src.utils.template_pyramid import TemplatePyramid
+from src.utils.template_stats import StatsMatrix, TemplateStats, ncc_at
+
+
+def _random_image(seed, shape):
+    return np.random.default_rng(seed).integers(0, 256, shape, dtype=np.uint8)
+
+
+def test_ncc_at_matches_cv2_match_template():
+    # Given
+    screen = _random_image(0, (60, 80))
+    template = screen[20:32, 30:46].copy()
+    stats = TemplateStats(template)
+
+    # When
+    expected = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
+
+    # Then
+    for y, x in [(20, 30), (0, 0), (5, 17), (48, 64)]:
+        assert ncc_at(screen, x, y, stats) == pytest.approx(float(expected[y, x]), abs=1e-4)
+
+
+def test_ncc_at_out_of_bounds_or_flat():
+    # Given
+    screen = _random_image(1, (40, 40))
+    stats = TemplateStats(screen[0:10, 0:10])
+
+    # When / Then
+    assert ncc_at(screen, 35, 0, stats) == -1.0
+    assert ncc_at(screen, -1, 0, stats) == -1.0
+    assert ncc_at(np.full((40, 40), 7, dtype=np.uint8), 0, 0, stats) == -1.0
+    assert ncc_at(screen, 0, 0, TemplateStats(np.zeros((10, 10), dtype=np.uint8))) == -1.0
+
+
+def test_stats_matrix_matches_cv2_match_template():
+    # Given
+    templates = [_random_image(seed, (14, 10)) for seed in range(10)]
+    matrix = StatsMatrix(range(10), templates)
+    patch = templates[3].copy()
+    patch[0, 0] ^= 0x40
+
+    # When
+    scores = matrix.scores(patch)
+    label, score = matrix.best(patch)
+
+    # Then
+    for index, template in enumerate(templates):
+        expected = cv2.matchTemplate(patch, template, cv2.TM_CCOEFF_NORMED)[0, 0]
+        assert scores[index] == pytest.approx(float(expected), abs=1e-4)
+    assert label == 3
+    assert score == pytest.approx(float(scores[3]))
+
+
+def test_stats_matrix_empty_and_flat_patch():
+    # Given
+    empty = StatsMatrix([], [])
+    matrix = StatsMatrix(["a"], [_random_image(2, (5, 5))])
+
+    # When / Then
+    assert empty.best(_random_image(3, (5, 5))) == (None, -1.0)
+    assert matrix.scores(np.zeros((5, 5), dtype=np.uint8)).tolist() == [0.0]
+
+
+def test_pyramid_counts_stats_memory():
+    # Given
+    pyramid = TemplatePyramid()
+    template = _random_image(4, (20, 30))
+    levels_bytes = sum(resized.nbytes for _, resized, _ in pyramid.build(template))
+
+    # When
+    stats = pyramid.get_stats(template)
+    with_stats = pyramid.stats()["bytes"]
+    pyramid.invalidate(template)
+
+    # Then
+    assert with_stats == levels_bytes + sum(s.unit.nbytes for s in stats)
+    assert sum(s.unit.nbytes for s in stats) > levels_bytes  # float32 벡터는 uint8 이미지의 4배
+    assert pyramid.stats()["bytes"] == 0
@@ -0,0 +1,95 @@
+import numpy as np
+from src.utils.template_store import TemplateStore
+
+
+def _template(value):
+    return np.full((4, 4), value, dtype=np.uint8)
+
+
+def test_put_deduplicates_same_content():
+    # Given
+    store = TemplateStore()
+    first = _template(1)
+
+    # When
+    stored = store.put("/a.png", first)
+    duplicate = store.put("/a.PNG", _template(1))
+
+    # Then
+    assert stored is first
+    assert duplicate is first
+    assert store.stats()["templates"] == 1
+    assert store.stats()["paths"] == 2
+    assert store.deduplicated == 1
+
+
+def test_extras_are_evicted_least_recently_used_first():
+    # Given
+    evicted = []
+    store = TemplateStore(max_extras=2, on_evict=evicted.append)
+    store.put("/1.png", _template(1))
+    store.put("/2.png", _template(2))
+    store.get("/1.png")
+
+    # When
+    store.put("/3.png", _template(3))
+
+    # Then
+    assert "/2.png" not in store
+    assert "/1.png" in store and "/3.png" in store
+    assert [int(template[0, 0]) for template in evicted] == [2]
+    assert store.evictions == 1
+
+
+def test_pinned_templates_are_never_evicted():
+    # Given
+    evicted = []
+    store = TemplateStore(max_extras=1, on_evict=evicted.append)
+    store.put("/core.png", _template(0), pinned=True)
+
+    # When
+    store.put("/1.png", _template(1))
+    store.put("/2.png", _template(2))
+
+    # Then
+    assert "/core.png" in store
+    assert "/1.png" not in store
+    assert store.stats()["pinned"] == 1
+    assert [int(template[0, 0]) for template in evicted] == [1]
+
+
+def test_retain_releases_replaced_content_and_unpins():
+    # Given
+    evicted = []
+    store = TemplateStore(max_extras=4, on_evict=evicted.append)
+    store.put("/a.png", _template(1), pinned=True)
+    store.put("/b.png", _template(2), pinned=True)
+    store.put("/a.png", _template(3), pinned=True)  # 경로가 새 내용으로 교체됨
+
+    # When
+    removed = store.retain(["/a.png"])
+
+    # Then
+    assert removed == 1
+    assert [int(template[0, 0]) for template in evicted] == [1]
+    assert int(store.get("/a.png")[0, 0]) == 3
+    assert "/b.png" in store
+    stats = store.stats()
+    assert stats["pinned"] == 1
+    assert stats["extras"] == 1
+
+
+def test_clear_calls_on_evict_for_every_template():
+    # Given
+    evicted = []
+    store = TemplateStore(on_evict=evicted.append)
+    store.put("/a.png", _template(1), pinned=True)
+    store.put("/b.png", _template(2))
+
+    # When
+    store.clear()
+
+    # Then
+    assert len(evicted) == 2
+    assert store.get("/a.png") is None
+    assert store.stats()["templates"] == 0